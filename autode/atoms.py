@@ -1,4 +1,8 @@
 import numpy as np
+from collections.abc import MutableSequence
+from copy import copy
+from itertools import count
+from autode.geom import get_rot_mat_euler
 from autode.log import logger
 
 
@@ -30,33 +34,42 @@ class Atom:
                                  if no origin is specified then the atom
                                  is rotated without translation.
         """
-        # If specified shift so that the origin is at (0, 0, 0), apply the
-        # rotation, and shift back
-        if origin is not None:
-            self.translate(vec=-origin)
-
-        # Normalise the axis
-        axis = np.asarray(axis)
-        axis = axis / np.linalg.norm(axis)
-
-        # Compute the 3D rotation matrix using
-        # https://en.wikipedia.org/wiki/Euler–Rodrigues_formula
-        a = np.cos(theta / 2.0)
-        b, c, d = -axis * np.sin(theta / 2.0)
-        aa, bb, cc, dd = a * a, b * b, c * c, d * d
-        bc, ad, ac, ab, bd, cd = b * c, a * d, a * c, a * b, b * d, c * d
-        rot_matrix = np.array([[aa + bb - cc - dd, 2 * (bc + ad), 2 * (bd - ac)],
-                               [2 * (bc - ad), aa + cc - bb - dd, 2 * (cd + ab)],
-                               [2 * (bd + ac), 2 * (cd - ab), aa + dd - bb - cc]])
-
-        # Apply the rotation
-        self.coord = np.matmul(rot_matrix, self.coord)
-
-        if origin is not None:
-            self.translate(vec=origin)
+        rot_matrix = get_rot_mat_euler(axis, theta)
+        origin = np.zeros(3) if origin is None else np.asarray(origin)
 
+        self.coord = np.matmul(rot_matrix, self.coord - origin) + origin
         return None
 
+    @property
+    def coord(self):
+        """Coordinate of this atom, which may be a view into the coordinates
+        of an Atoms container. shape = (3,)"""
+        return self._coord
+
+    @coord.setter
+    def coord(self, value):
+        # Set in place, so an atom in an Atoms container stays a view
+        self._coord[:] = value
+
+        if self._container is not None:
+            self._container._update_version()
+
+    def _is_bound(self):
+        """Is this atom's coordinate a view into an Atoms container"""
+        return self._container is not None
+
+    def _bind(self, container, coord):
+        """Make this atom's coordinate a view into an Atoms container"""
+        self._coord, self._container = coord, container
+        return None
+
+    def __getstate__(self):
+        # Copied or pickled atoms are not in a container
+        state = dict(self.__dict__)
+        state['_coord'] = np.array(self._coord, copy=True)
+        state['_container'] = None
+        return state
+
     def __init__(self, atomic_symbol, x=0.0, y=0.0, z=0.0):
         """
         Atom class. Centered at the origin by default
@@ -72,7 +85,8 @@ class Atom:
         assert atomic_symbol in elements
 
         self.label = atomic_symbol
-        self.coord = np.array([float(x), float(y), float(z)])
+        self._coord = np.array([float(x), float(y), float(z)])
+        self._container = None      # Atoms this atom is in, if any
 
 
 class DummyAtom(Atom):
@@ -83,6 +97,238 @@ class DummyAtom(Atom):
         self.label = 'D'
 
 
+class Atoms(MutableSequence):
+
+    def __repr__(self):
+        return f'Atoms({self._atoms})'
+
+    def __len__(self):
+        return len(self._atoms)
+
+    def __getitem__(self, item):
+        """Get an atom, or a list of atoms for a slice. The atoms are the
+        same objects so modifying them modifies this container"""
+        return self._atoms[item]
+
+    def __setitem__(self, item, value):
+        if isinstance(item, slice):
+            atoms = list(self._atoms)
+            atoms[item] = value
+            self._set_atoms(atoms)
+            return
+
+        atom = self._adopt(value)
+
+        # The replaced atom keeps its own coordinate
+        self._atoms[item]._bind(container=None,
+                                coord=self._coords[item].copy())
+        self._coords[item] = atom.coord
+
+        atom._bind(container=self, coord=self._coords[item])
+        self._atoms[item] = atom
+        self._update_version()
+
+    def __delitem__(self, item):
+        atoms = list(self._atoms)
+        del atoms[item]
+        self._set_atoms(atoms)
+
+    def insert(self, index, value):
+        atoms = list(self._atoms)
+        atoms.insert(index, value)
+        self._set_atoms(atoms)
+
+    def extend(self, values):
+        self._set_atoms(list(self._atoms) + list(values))
+
+    def __iadd__(self, values):
+        self.extend(values)
+        return self
+
+    def __add__(self, other):
+        return Atoms(list(self._atoms) + list(other))
+
+    def __radd__(self, other):
+        return Atoms(list(other) + list(self._atoms))
+
+    def __copy__(self):
+        return self.copy()
+
+    def __deepcopy__(self, memo):
+        atoms = self.copy()
+        memo[id(self)] = atoms
+        return atoms
+
+    def __getstate__(self):
+        return {'_atoms': self._atoms}
+
+    def __setstate__(self, state):
+        self._coords = np.zeros(shape=(0, 3))
+        self._atoms = []
+        self._version = next(_versions)
+        self._set_atoms(state['_atoms'])
+
+    def _update_version(self):
+        """Give the current geometry a new version, after any change to
+        the atoms or their coordinates"""
+        self._version = next(_versions)
+        return None
+
+    @property
+    def version(self):
+        """
+        Version of the geometry, which changes whenever the atoms or any
+        coordinates change. Versions are unique over all Atoms, other than
+        for copies with the same coordinates, so can be used to cache
+        quantities derived from the coordinates
+
+        Returns:
+            (int):
+        """
+        return self._version
+
+    def _adopt(self, atom):
+        """Get an atom to add to this container, which is a copy if the atom
+        is already in another container"""
+        if atom._container is None or atom._container is self:
+            return atom
+
+        return copy(atom)
+
+    def _set_atoms(self, atoms):
+        """Set the atoms and copy their coordinates into a single array, to
+        which each atom's coordinate is then a view"""
+        atoms = [self._adopt(atom) for atom in atoms]
+        coords = np.array([atom.coord for atom in atoms], dtype=float).reshape(-1, 3)
+
+        # Atoms that are removed no longer share these coordinates
+        kept_ids = set(id(atom) for atom in atoms)
+        for atom in self._atoms:
+            if id(atom) not in kept_ids:
+                atom._bind(container=None, coord=atom.coord.copy())
+
+        self._atoms, self._coords = atoms, coords
+        for atom, coord in zip(self._atoms, self._coords):
+            atom._bind(container=self, coord=coord)
+
+        self._update_version()
+        return None
+
+    @property
+    def coordinates(self):
+        """Copy of the coordinates of all atoms. shape = (n_atoms, 3)"""
+        return np.array(self._coords, copy=True)
+
+    @coordinates.setter
+    def coordinates(self, value):
+        assert np.shape(value) == self._coords.shape
+        self._coords[:] = value
+        self._update_version()
+
+    @property
+    def labels(self):
+        """Labels of all the atoms"""
+        return [atom.label for atom in self._atoms]
+
+    def copy(self):
+        """Copy the atoms, copying all the coordinates at once. The copy has
+        the same version until either is modified"""
+        atoms = Atoms()
+        atoms._coords = np.array(self._coords, copy=True)
+        atoms._atoms = []
+
+        for atom, coord in zip(self._atoms, atoms._coords):
+            atom_copy = atom.__class__.__new__(atom.__class__)
+            atom_copy.__dict__.update(atom.__dict__)
+            atom_copy._bind(container=atoms, coord=coord)
+            atoms._atoms.append(atom_copy)
+
+        atoms._version = self._version
+        return atoms
+
+    def apply_transform(self, rot_matrix=None, vec=None, origin=None,
+                        idxs=None):
+        """
+        Apply a rigid body transformation to all the atoms, or a subset of
+        them, in a single operation. Coordinates are rotated about the origin
+        then translated by the vector: x -> R(x - origin) + origin + vec
+
+        Keyword Arguments:
+            rot_matrix (np.ndarray | None): Rotation matrix. shape = (3, 3)
+            vec (np.ndarray | None): Translation vector. shape = (3,)
+            origin (np.ndarray | None): Origin of the rotation. shape = (3,)
+            idxs (list(int) | None): Indexes of the atoms to transform, if
+                                     None then transform all atoms
+        """
+        idxs = slice(None) if idxs is None else np.asarray(idxs, dtype=int)
+        coords = self._coords[idxs]
+
+        if rot_matrix is not None:
+            origin = np.zeros(3) if origin is None else np.array(origin, dtype=float)
+            coords = np.matmul(coords - origin, rot_matrix.T) + origin
+
+        if vec is not None:
+            coords = coords + np.asarray(vec)
+
+        self._coords[idxs] = coords
+        self._update_version()
+        return None
+
+    def translate(self, vec, idxs=None):
+        """
+        Translate all the atoms, or a subset of them, by a vector
+
+        Arguments:
+            vec (np.ndarray): shape = (3,)
+
+        Keyword Arguments:
+            idxs (list(int) | None): Indexes of the atoms to translate
+        """
+        if idxs is None:
+            self._coords += vec
+            self._update_version()
+            return None
+
+        return self.apply_transform(vec=vec, idxs=idxs)
+
+    def rotate(self, axis, theta, origin=None, idxs=None):
+        """
+        Rotate all the atoms, or a subset of them, theta radians around an
+        axis given an origin, as Atom.rotate. The rotation matrix is built
+        only once
+
+        Arguments:
+            axis (np.ndarray): Axis to rotate in. shape = (3,)
+            theta (float): Angle in radians (float)
+
+        Keyword Arguments:
+            origin (np.ndarray): Rotate about this origin. shape = (3,)
+            idxs (list(int) | None): Indexes of the atoms to rotate
+        """
+        return self.apply_transform(rot_matrix=get_rot_mat_euler(axis, theta),
+                                    origin=origin, idxs=idxs)
+
+    def __init__(self, atoms=None):
+        """
+        Collection of atoms with all the coordinates in a single
+        (n_atoms, 3) array. Behaves as a list of autode.atoms.Atom, where the
+        coordinate of each atom is a view into the array
+
+        Keyword Arguments:
+            atoms (list(autode.atoms.Atom) | None): Atoms, which are copied if
+                                                   they are in another Atoms
+        """
+        self._coords = np.zeros(shape=(0, 3))
+        self._atoms = []
+        self._version = next(_versions)
+
+        if atoms is not None:
+            self._set_atoms(atoms)
+
+
+# Source of unique geometry versions over all Atoms
+_versions = count()
+
 elements = ['H', 'He', 'Li', 'Be', 'B', 'C', 'N', 'O', 'F', 'Ne', 'Na', 'Mg',
             'Al', 'Si', 'P', 'S', 'Cl', 'Ar', 'K', 'Ca', 'Sc', 'Ti', 'V', 'Cr',
             'Mn', 'Fe', 'Co', 'Ni', 'Cu', 'Zn', 'Ga', 'Ge', 'As', 'Se', 'Br',
@@ -1,6 +1,10 @@
 import itertools
+import multiprocessing
 import os
+from collections import Counter
+from multiprocessing import Pool
 from autode.atoms import get_maximal_valance
+from autode.config import Config
 from autode.geom import get_neighbour_list
 from autode.geom import get_points_on_sphere
 from autode.log import logger
@@ -8,6 +12,8 @@ from autode.mol_graphs import get_bond_type_list
 from autode.mol_graphs import get_fbonds
 from autode.mol_graphs import is_isomorphic
 from autode.mol_graphs import connected_components
+from autode.mol_graphs import EditableGraph
+from autode.mol_graphs import get_atom_signatures
 
 
 def get_bond_rearrangs(reactant, product, name):
@@ -29,7 +35,10 @@ def get_bond_rearrangs(reactant, product, name):
     if os.path.exists(f'{name}_bond_rearrangs.txt'):
         return get_bond_rearrangs_from_file(f'{name}_bond_rearrangs.txt')
 
-    if is_isomorphic(reactant.graph, product.graph) and product.n_atoms > 3:
+    if (is_isomorphic(reactant.graph, product.graph,
+                      graph1_hash=reactant.graph_hash,
+                      graph2_hash=product.graph_hash)
+            and product.n_atoms > 3):
         logger.error('Reactant (complex) is isomorphic to product (complex). '
                      'Bond rearrangement cannot be determined unless the '
                      'substrates are limited in size')
@@ -204,43 +213,230 @@ def add_bond_rearrangment(bond_rearrangs, reactant, product, fbonds, bbonds):
     Returns:
         (list(autode.bond_rearrangements.BondRearrangement)):
     """
+    return add_bond_rearrangements(bond_rearrangs, reactant, product,
+                                   candidates=[(fbonds, bbonds)])
 
-    # Check that the bond rearrangement doesn't exceed standard atom valances
+
+def add_bond_rearrangements(bond_rearrangs, reactant, product, candidates,
+                            min_n_parallel=50):
+    """For a set of possible bond rearrangements, find those which make the
+    products and add them to the bond rearrang list, in order. Candidates are
+    first pruned on atom valances and on atom environments (see
+    could_make_product), then those remaining are checked for isomorphism
+    with the product, in parallel if there are enough of them
+
+    Arguments:
+        bond_rearrangs (list(autode.bond_rearrangements.BondRearrangement)):
+                        list of working bond rearrangments
+        reactant (molecule object): reactant complex
+        product (molecule object): product complex
+        candidates (list(tuple(list))): Pairs of forming and breaking bonds
+
+    Keyword Arguments:
+        min_n_parallel (int): Minimum number of candidates remaining after
+                              pruning to check over Config.n_cores processes
+
+    Returns:
+        (list(autode.bond_rearrangements.BondRearrangement)):
+    """
+    reac_envs = get_atom_environments(reactant.graph)
+    env_changes = get_atom_environment_changes(reactant.graph, product.graph)
+
+    candidates = [(fbonds, bbonds) for fbonds, bbonds in candidates
+                  if not exceeds_maximal_valance(reactant, fbonds, bbonds)
+                  and could_make_product(reactant.graph, reac_envs,
+                                         env_changes, fbonds, bbonds)]
+
+    logger.info(f'Checking {len(candidates)} possible bond rearrangement(s) '
+                f'for isomorphism with the product')
+
+    if (Config.n_cores > 1 and len(candidates) >= min_n_parallel
+            and not multiprocessing.current_process().daemon):
+
+        with Pool(processes=Config.n_cores,
+                  initializer=_init_rearrangement_worker,
+                  initargs=(reactant.graph, product.graph,
+                            product.graph_hash)) as pool:
+
+            chunksize = max(len(candidates) // (4 * Config.n_cores), 1)
+            results = pool.starmap(_makes_worker_product, candidates,
+                                   chunksize=chunksize)
+
+    else:
+        reac_graph = EditableGraph(reactant.graph)
+        results = [makes_product(reac_graph, product.graph, fbonds, bbonds,
+                                 product_hash=product.graph_hash)
+                   for fbonds, bbonds in candidates]
+
+    for (fbonds, bbonds), result in zip(candidates, results):
+        if not result:
+            continue
+
+        ordered_fbonds = sorted(tuple(sorted(fbond)) for fbond in fbonds)
+        ordered_bbonds = sorted(tuple(sorted(bbond)) for bbond in bbonds)
+        bond_rearrangs.append(BondRearrangement(forming_bonds=ordered_fbonds,
+                                                breaking_bonds=ordered_bbonds))
+
+    return bond_rearrangs
+
+
+def exceeds_maximal_valance(reactant, fbonds, bbonds):
+    """Would forming a set of bonds, while breaking others, give an atom with
+    more bonds than its maximal valance? Only atoms not in a breaking bond
+    are considered
+
+    Arguments:
+        reactant (molecule object): reactant complex
+        fbonds (list(tuple)): list of bonds to be made
+        bbonds (list(tuple)): list of bonds to be broken
+
+    Returns:
+        (bool):
+    """
     bbond_atoms = [atom for bbond in bbonds for atom in bbond]
+
     for fbond in fbonds:
         for atom in fbond:
             atom_label = reactant.atoms[atom].label
 
             if (reactant.graph.degree(atom) == get_maximal_valance(atom_label)
                     and atom not in bbond_atoms):
-                # If we are here then there is at least one atom that will
-                # exceed it's maximal valance, therefore
-                # we don't need to run isomorphism
-                return bond_rearrangs
-
-    rearranged_graph = generate_rearranged_graph(reactant.graph,
-                                                 fbonds=fbonds, bbonds=bbonds)
-
-    if is_isomorphic(rearranged_graph, product.graph):
-        ordered_fbonds = []
-        ordered_bbonds = []
-        for fbond in fbonds:
-            if fbond[0] < fbond[1]:
-                ordered_fbonds.append((fbond[0], fbond[1]))
-            else:
-                ordered_fbonds.append((fbond[1], fbond[0]))
-        for bbond in bbonds:
-            if bbond[0] < bbond[1]:
-                ordered_bbonds.append((bbond[0], bbond[1]))
-            else:
-                ordered_bbonds.append((bbond[1], bbond[0]))
-
-        ordered_fbonds.sort()
-        ordered_bbonds.sort()
-        bond_rearrangs.append(BondRearrangement(forming_bonds=ordered_fbonds,
-                                                breaking_bonds=ordered_bbonds))
+                return True
+
+    return False
 
-    return bond_rearrangs
+
+def get_atom_environment(graph, atom, neighbours):
+    """Environment of an atom as its label and the sorted labels of its
+    neighbours"""
+    return (graph.nodes[atom].get('atom_label', 'C'),
+            tuple(sorted(graph.nodes[n].get('atom_label', 'C')
+                         for n in neighbours)))
+
+
+def get_atom_environments(graph):
+    """
+    Get the environment of each atom in a graph, see get_atom_environment
+
+    Arguments:
+        graph (nx.Graph):
+
+    Returns:
+        (dict): Key = atom index, Value = environment
+    """
+    return {atom: get_atom_environment(graph, atom, graph.neighbors(atom))
+            for atom in graph.nodes}
+
+
+def get_atom_environment_changes(reac_graph, prod_graph):
+    """
+    Get the change in the number of atoms with each environment going from
+    reactant to product, which any bond rearrangement must reproduce
+
+    Arguments:
+        reac_graph (nx.Graph):
+        prod_graph (nx.Graph):
+
+    Returns:
+        (dict): Key = environment, Value = change in number (non-zero)
+    """
+    changes = Counter(get_atom_environments(prod_graph).values())
+    changes.subtract(get_atom_environments(reac_graph).values())
+
+    return {env: n for env, n in changes.items() if n != 0}
+
+
+def could_make_product(reac_graph, reac_envs, env_changes, fbonds, bbonds):
+    """
+    Check whether a bond rearrangement could make the product using the
+    environments of the atoms in the rearranged graph. These are necessarily
+    the same in any graph isomorphic to the product, so this covers the
+    degree of every atom and the number of bonds between each pair of
+    elements. Only the environments of atoms in forming or breaking bonds
+    change, so this does not require the rearranged graph
+
+    Arguments:
+        reac_graph (nx.Graph): Reactant graph
+        reac_envs (dict): Atom environments in the reactant, see
+                          get_atom_environments
+        env_changes (dict): See get_atom_environment_changes
+        fbonds (list(tuple)): list of bonds to be made
+        bbonds (list(tuple)): list of bonds to be broken
+
+    Returns:
+        (bool): False if the products cannot be made
+    """
+    neighbours = {}
+    for (i, j) in itertools.chain(fbonds, bbonds):
+        for atom in (i, j):
+            if atom not in neighbours:
+                neighbours[atom] = set(reac_graph.neighbors(atom))
+
+    for (i, j) in fbonds:
+        neighbours[i].add(j)
+        neighbours[j].add(i)
+
+    for (i, j) in bbonds:
+        neighbours[i].discard(j)
+        neighbours[j].discard(i)
+
+    changes = Counter()
+    for atom, atom_neighbours in neighbours.items():
+        changes[reac_envs[atom]] -= 1
+        changes[get_atom_environment(reac_graph, atom, atom_neighbours)] += 1
+
+    return {env: n for env, n in changes.items() if n != 0} == env_changes
+
+
+def makes_product(reac_graph, prod_graph, fbonds, bbonds, product_hash=None):
+    """
+    Does rearranging the reactant graph make a graph isomorphic to the
+    product. The reactant graph is edited then reverted, so an NX graph is
+    only generated if the hash of the rearranged graph matches the product
+
+    Arguments:
+        reac_graph (autode.mol_graphs.EditableGraph):
+        prod_graph (nx.Graph):
+        fbonds (list(tuple)): list of bonds to be made
+        bbonds (list(tuple)): list of bonds to be broken
+
+    Keyword Arguments:
+        product_hash (str | None): Hash of the product graph
+
+    Returns:
+        (bool):
+    """
+    reac_graph.edit(fbonds=fbonds, bbonds=bbonds)
+
+    try:
+        if product_hash is not None and reac_graph.hash != product_hash:
+            return False
+
+        return is_isomorphic(reac_graph.to_networkx(), prod_graph,
+                             graph1_hash=reac_graph.hash,
+                             graph2_hash=product_hash)
+    finally:
+        reac_graph.undo()
+
+
+# Reactant and product graphs and the product hash in a worker process
+_worker_graphs = None
+
+
+def _init_rearrangement_worker(reac_graph, prod_graph, product_hash):
+    """Set the reactant and product graphs in a worker process"""
+    global _worker_graphs
+    _worker_graphs = (EditableGraph(reac_graph), prod_graph, product_hash)
+
+    return None
+
+
+def _makes_worker_product(fbonds, bbonds):
+    """Does a bond rearrangement make the product, in a worker process"""
+    reac_graph, prod_graph, product_hash = _worker_graphs
+
+    return makes_product(reac_graph, prod_graph, fbonds, bbonds,
+                         product_hash=product_hash)
 
 
 def generate_rearranged_graph(graph, fbonds, bbonds):
@@ -267,61 +463,56 @@ def generate_rearranged_graph(graph, fbonds, bbonds):
 
 def get_fbonds_bbonds_1b(reac, prod, possible_brs, all_possible_bbonds, all_possible_fbonds, possible_bbond_and_fbonds, bbond_atom_type_fbonds, fbond_atom_type_bbonds):
     logger.info('Getting possible 1 breaking bond rearrangements')
+    candidates = []
 
     for bbond in all_possible_bbonds[0]:
         # Break one bond
-        possible_brs = add_bond_rearrangment(possible_brs, reac, prod,
-                                             fbonds=[], bbonds=[bbond])
+        candidates.append(([], [bbond]))
 
-    return possible_brs
+    return add_bond_rearrangements(possible_brs, reac, prod, candidates)
 
 
 def get_fbonds_bbonds_2b(reac, prod, possible_brs, all_possible_bbonds, all_possible_fbonds, possible_bbond_and_fbonds, bbond_atom_type_fbonds, fbond_atom_type_bbonds):
     logger.info('Getting possible 2 breaking bond rearrangements')
+    candidates = []
 
     if len(all_possible_bbonds) == 1:
         # Break two bonds of the same type
         for bbond1, bbond2 in itertools.combinations(all_possible_bbonds[0], 2):
-            possible_brs = add_bond_rearrangment(possible_brs, reac, prod,
-                                                 fbonds=[],
-                                                 bbonds=[bbond1, bbond2])
+            candidates.append(([], [bbond1, bbond2]))
 
     elif len(all_possible_bbonds) == 2:
         # Break two bonds of different types
         for bbond1, bbond2 in itertools.product(all_possible_bbonds[0],
                                                 all_possible_bbonds[1]):
 
-            possible_brs = add_bond_rearrangment(possible_brs, reac, prod,
-                                                 fbonds=[],
-                                                 bbonds=[bbond1, bbond2])
+            candidates.append(([], [bbond1, bbond2]))
 
-    return possible_brs
+    return add_bond_rearrangements(possible_brs, reac, prod, candidates)
 
 
 def get_fbonds_bbonds_1b1f(reac, prod, possible_brs, all_possible_bbonds, all_possible_fbonds, possible_bbond_and_fbonds, bbond_atom_type_fbonds, fbond_atom_type_bbonds):
     logger.info('Getting possible 1 breaking and 1 forming bond '
                 'rearrangements')
+    candidates = []
 
     if len(all_possible_bbonds) == 1 and len(all_possible_fbonds) == 1:
         # Make and break a bond of different types
         for fbond, bbond in itertools.product(all_possible_fbonds[0], all_possible_bbonds[0]):
-            possible_brs = add_bond_rearrangment(possible_brs, reac, prod,
-                                                 fbonds=[fbond],
-                                                 bbonds=[bbond])
+            candidates.append(([fbond], [bbond]))
 
     elif len(all_possible_bbonds) == 0 and len(all_possible_fbonds) == 0:
         # Make and break a bond of the same type
         for bbonds, fbonds in possible_bbond_and_fbonds:
             for bbond, fbond in itertools.product(bbonds, fbonds):
-                possible_brs = add_bond_rearrangment(possible_brs, reac, prod,
-                                                     fbonds=[fbond],
-                                                     bbonds=[bbond])
+                candidates.append(([fbond], [bbond]))
 
-    return possible_brs
+    return add_bond_rearrangements(possible_brs, reac, prod, candidates)
 
 
 def get_fbonds_bbonds_2b1f(reac, prod, possible_brs, all_possible_bbonds, all_possible_fbonds, possible_bbond_and_fbonds, bbond_atom_type_fbonds, fbond_atom_type_bbonds):
     logger.info('Getting possible 2 breaking and 1 forming bond rearrangements')
+    candidates = []
 
     if len(all_possible_bbonds) == 2 and len(all_possible_fbonds) == 1:
         # Make a bond and break two bonds, all of different types
@@ -330,9 +521,7 @@ def get_fbonds_bbonds_2b1f(reac, prod, possible_brs, all_possible_bbonds, all_po
                                       all_possible_bbonds[1])
 
         for fbond, bbond1, bbond2 in possibles:
-            possible_brs = add_bond_rearrangment(possible_brs, reac, prod,
-                                                 fbonds=[fbond],
-                                                 bbonds=[bbond1, bbond2])
+            candidates.append(([fbond], [bbond1, bbond2]))
 
     elif len(all_possible_bbonds) == 1 and len(all_possible_fbonds) == 1:
         # Make a bond of one type, break two bonds of another type
@@ -341,9 +530,7 @@ def get_fbonds_bbonds_2b1f(reac, prod, possible_brs, all_possible_bbonds, all_po
                                       two_same_possibles)
 
         for fbond, (bbond1, bbond2) in possibles:
-            possible_brs = add_bond_rearrangment(possible_brs, reac, prod,
-                                                 fbonds=[fbond],
-                                                 bbonds=[bbond1, bbond2])
+            candidates.append(([fbond], [bbond1, bbond2]))
 
     elif len(all_possible_bbonds) == 1 and len(all_possible_fbonds) == 0:
         for bbonds, fbonds in possible_bbond_and_fbonds:
@@ -353,9 +540,7 @@ def get_fbonds_bbonds_2b1f(reac, prod, possible_brs, all_possible_bbonds, all_po
                                           bbonds)
 
             for fbond, bbond1, bbond2 in possibles:
-                possible_brs = add_bond_rearrangment(possible_brs, reac, prod,
-                                                     fbonds=[fbond],
-                                                     bbonds=[bbond1, bbond2])
+                candidates.append(([fbond], [bbond1, bbond2]))
 
         # Make and break two bonds, all of the same type
         two_same_possibles = itertools.combinations(all_possible_bbonds[0], 2)
@@ -363,15 +548,14 @@ def get_fbonds_bbonds_2b1f(reac, prod, possible_brs, all_possible_bbonds, all_po
                                       two_same_possibles)
 
         for fbond, (bbond1, bbond2) in possibles:
-            possible_brs = add_bond_rearrangment(possible_brs, reac, prod,
-                                                 fbonds=[fbond],
-                                                 bbonds=[bbond1, bbond2])
+            candidates.append(([fbond], [bbond1, bbond2]))
 
-    return possible_brs
+    return add_bond_rearrangements(possible_brs, reac, prod, candidates)
 
 
 def get_fbonds_bbonds_2b2f(reac, prod, possible_brs, all_possible_bbonds, all_possible_fbonds, possible_bbond_and_fbonds, bbond_atom_type_fbonds, fbond_atom_type_bbonds):
     logger.info('Getting possible 2 breaking and 2 forming bond rearrangements')
+    candidates = []
 
     if len(all_possible_bbonds) == 2 and len(all_possible_fbonds) == 2:
         # Make two bonds and break two bonds, all of different types
@@ -381,9 +565,7 @@ def get_fbonds_bbonds_2b2f(reac, prod, possible_brs, all_possible_bbonds, all_po
                                       all_possible_bbonds[1])
 
         for fbond1, fbond2, bbond1, bbond2 in possibles:
-            possible_brs = add_bond_rearrangment(possible_brs, reac, prod,
-                                                 fbonds=[fbond1, fbond2],
-                                                 bbonds=[bbond1, bbond2])
+            candidates.append(([fbond1, fbond2], [bbond1, bbond2]))
 
     elif len(all_possible_bbonds) == 2 and len(all_possible_fbonds) == 1:
         # Make two bonds of the same type, break two bonds of different types
@@ -393,9 +575,7 @@ def get_fbonds_bbonds_2b2f(reac, prod, possible_brs, all_possible_bbonds, all_po
                                       two_same_possibles)
 
         for bbond1, bbond2, (fbond1, fbond2) in possibles:
-            possible_brs = add_bond_rearrangment(possible_brs, reac, prod,
-                                                 fbonds=[fbond1, fbond2],
-                                                 bbonds=[bbond1, bbond2])
+            candidates.append(([fbond1, fbond2], [bbond1, bbond2]))
 
     elif len(all_possible_bbonds) == 1 and len(all_possible_fbonds) == 2:
         # Make two bonds of different types, break two bonds of the same type
@@ -405,9 +585,7 @@ def get_fbonds_bbonds_2b2f(reac, prod, possible_brs, all_possible_bbonds, all_po
                                       two_same_possibles)
 
         for fbond1, fbond2, (bbond1, bbond2) in possibles:
-            possible_brs = add_bond_rearrangment(possible_brs, reac, prod,
-                                                 fbonds=[fbond1, fbond2],
-                                                 bbonds=[bbond1, bbond2])
+            candidates.append(([fbond1, fbond2], [bbond1, bbond2]))
 
     elif len(all_possible_bbonds) == 1 and len(all_possible_fbonds) == 1:
         two_f_possibles = itertools.combinations(all_possible_fbonds[0], 2)
@@ -416,9 +594,7 @@ def get_fbonds_bbonds_2b2f(reac, prod, possible_brs, all_possible_bbonds, all_po
 
         for (fbond1, fbond2), (bbond1, bbond2) in possibles:
             # Make two bonds of the same type, break two bonds of another type
-            possible_brs = add_bond_rearrangment(possible_brs, reac, prod,
-                                                 fbonds=[fbond1, fbond2],
-                                                 bbonds=[bbond1, bbond2])
+            candidates.append(([fbond1, fbond2], [bbond1, bbond2]))
 
         for bbonds, fbonds in possible_bbond_and_fbonds:
             # Make one bonds of one type, break one bond of another type, make
@@ -429,9 +605,7 @@ def get_fbonds_bbonds_2b2f(reac, prod, possible_brs, all_possible_bbonds, all_po
                                           bbonds)
 
             for fbond1, fbond2, bbond1, bbond2 in possibles:
-                possible_brs = add_bond_rearrangment(possible_brs, reac, prod,
-                                                     fbonds=[fbond1, fbond2],
-                                                     bbonds=[bbond1, bbond2])
+                candidates.append(([fbond1, fbond2], [bbond1, bbond2]))
 
         # Make a bond of one type, make and break two bonds of another type
         two_b_possibles = itertools.combinations(all_possible_bbonds[0], 2)
@@ -440,9 +614,7 @@ def get_fbonds_bbonds_2b2f(reac, prod, possible_brs, all_possible_bbonds, all_po
                                       two_b_possibles)
 
         for fbond1, fbond2, (bbond1, bbond2) in possibles:
-            possible_brs = add_bond_rearrangment(possible_brs, reac, prod,
-                                                 fbonds=[fbond1, fbond2],
-                                                 bbonds=[bbond1, bbond2])
+            candidates.append(([fbond1, fbond2], [bbond1, bbond2]))
 
         two_f_possibles = itertools.combinations(all_possible_fbonds[0], 2)
         possibles = itertools.product(all_possible_bbonds[0],
@@ -452,9 +624,7 @@ def get_fbonds_bbonds_2b2f(reac, prod, possible_brs, all_possible_bbonds, all_po
         for bbond1, bbond2, (fbond1, fbond2) in possibles:
             # Break a bond of one type, make two and break one bond of another
             #  type
-            possible_brs = add_bond_rearrangment(possible_brs, reac, prod,
-                                                 fbonds=[fbond1, fbond2],
-                                                 bbonds=[bbond1, bbond2])
+            candidates.append(([fbond1, fbond2], [bbond1, bbond2]))
 
     elif len(all_possible_bbonds) == 0 and len(all_possible_fbonds) == 0:
         possibles_b_f = itertools.combinations(possible_bbond_and_fbonds, 2)
@@ -465,9 +635,7 @@ def get_fbonds_bbonds_2b2f(reac, prod, possible_brs, all_possible_bbonds, all_po
             possibles = itertools.product(fbonds1, bbonds1, fbonds2, bbonds2)
 
             for fbond1, bbond1, fbond2, bbond2 in possibles:
-                possible_brs = add_bond_rearrangment(possible_brs, reac, prod,
-                                                     fbonds=[fbond1, fbond2],
-                                                     bbonds=[bbond1, bbond2])
+                candidates.append(([fbond1, fbond2], [bbond1, bbond2]))
 
         for bbonds, fbonds in possible_bbond_and_fbonds:
             # Make two and break two bonds, all of the same type
@@ -475,24 +643,25 @@ def get_fbonds_bbonds_2b2f(reac, prod, possible_brs, all_possible_bbonds, all_po
                                           itertools.combinations(bbonds, 2))
 
             for (fbond1, fbond2), (bbond1, bbond2) in possibles:
-                possible_brs = add_bond_rearrangment(possible_brs, reac, prod,
-                                                     fbonds=[fbond1, fbond2],
-                                                     bbonds=[bbond1, bbond2])
+                candidates.append(([fbond1, fbond2], [bbond1, bbond2]))
 
-    return possible_brs
+    return add_bond_rearrangements(possible_brs, reac, prod, candidates)
 
 
 def strip_equiv_bond_rearrs(mol, possible_bond_rearrs, depth=6):
     """Remove any bond rearrangement from possible_bond_rearrs for which
-    there is already an equivalent in the unique_bond_rearrangements list
+    there is already an equivalent in the unique_bond_rearrangements list.
+    Rearrangements are equivalent if they have the same signature, from the
+    environments of the active atoms in the reactant graph
 
     Arguments:
         mol (molecule object): reactant object
         possible_bond_rearrs (list(object)): list of BondRearrangement objects
 
     Keyword Arguments:
-        depth (int): Depth of neighbour list that must be identical for a set
-               of atoms to be considered equivalent (default: {6})
+        depth (int): Number of bonds from an active atom within which the
+                     atoms must be identical for a set of atoms to be
+                     considered equivalent (default: {6})
 
     Returns:
         (list(BondRearrangement)): stripped list of BondRearrangement objects
@@ -500,25 +669,20 @@ def strip_equiv_bond_rearrs(mol, possible_bond_rearrs, depth=6):
     logger.info('Stripping the forming and breaking bond list by discarding '
                 'rearrangements with equivalent atoms')
 
-    unique_bond_rearrs = []
+    atom_signatures = get_atom_signatures(mol.graph, depth=depth)
+    unique_bond_rearrs = {}
 
     for bond_rearr in possible_bond_rearrs:
-        bond_rearrang_is_unique = True
-
-        # Compare bond_rearrang to all those already considered to be unique,
-        for unique_bond_rearrang in unique_bond_rearrs:
-
-            if (unique_bond_rearrang.get_active_atom_neighbour_lists(mol=mol, depth=depth) ==
-                    bond_rearr.get_active_atom_neighbour_lists(mol=mol, depth=depth)):
-                bond_rearrang_is_unique = False
+        signature = bond_rearr.get_signature(atom_signatures)
 
-        if bond_rearrang_is_unique:
-            unique_bond_rearrs.append(bond_rearr)
+        # Keep only the first rearrangement with each signature
+        if signature not in unique_bond_rearrs:
+            unique_bond_rearrs[signature] = bond_rearr
 
     logger.info(
         f'Stripped {len(possible_bond_rearrs)-len(unique_bond_rearrs)} '
         f'bond rearrangements')
-    return unique_bond_rearrs
+    return list(unique_bond_rearrs.values())
 
 
 class BondRearrangement:
@@ -565,6 +729,32 @@ class BondRearrangement:
 
         return self.active_atom_nl
 
+    def get_signature(self, atom_signatures):
+        """
+        Get a signature of this bond rearrangement that does not depend on
+        the atom indexes. This comprises the signatures of the atoms in each
+        forming and breaking bond, and the number of forming and breaking
+        bonds each active atom is in
+
+        Arguments:
+            atom_signatures (dict): Signature of each atom in the reactant,
+                                    see autode.mol_graphs.get_atom_signatures
+
+        Returns:
+            (tuple):
+        """
+        def bond_signatures(bonds):
+            return tuple(sorted(tuple(sorted(atom_signatures[i] for i in bond))
+                                for bond in bonds))
+
+        active_atoms = tuple(sorted((atom_signatures[atom],
+                                     sum(atom in bond for bond in self.fbonds),
+                                     sum(atom in bond for bond in self.bbonds))
+                                    for atom in self.active_atoms))
+
+        return (bond_signatures(self.fbonds), bond_signatures(self.bbonds),
+                active_atoms)
+
     def _set_active_atom_list(self, bonds, ls):
 
         for bond in bonds:
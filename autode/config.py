@@ -60,6 +60,21 @@ class Config:
     #
     num_conformers = 300
     # -------------------------------------------------------------------------
+    # Conformer generation stops before num_conformers have been generated if
+    # the fraction of unique conformers (based on rmsd_threshold) in the last
+    # conformer_saturation_window generated is below min_unique_conformer_rate
+    # Set min_unique_conformer_rate = 0 to always generate num_conformers
+    #
+    min_unique_conformer_rate = 0.05
+    conformer_saturation_window = 30
+    # -------------------------------------------------------------------------
+    # Generate conformers of molecules by systematically rotating about all
+    # the rotatable bonds on a grid with a spacing of torsion_angle_step
+    # degrees, rather than with RDKit or simulated annealing
+    #
+    torsion_conformers = False
+    torsion_angle_step = 120
+    # -------------------------------------------------------------------------
     # Maximum random displacement in angstroms for conformational searching
     #
     max_atom_displacement = 4.0
@@ -82,12 +97,38 @@ class Config:
     #
     max_num_complex_conformers = 300
     # -------------------------------------------------------------------------
+    # Complex conformers are ranked on a cheap intermolecular energy and
+    # clustered on RMSD (rmsd_threshold) before optimisation. At most this
+    # number of the lowest energy distinct conformers are optimised, None
+    # optimises all of them
+    #
+    max_num_opt_complex_conformers = None
+    # -------------------------------------------------------------------------
     # Use the high + low level method to find the lowest energy
     # conformer, to use energies at the low_opt level of the low level code
     # set this to False
     #
     hmethod_conformers = True
     # -------------------------------------------------------------------------
+    # Conformers are screened in tiers in find_lowest_energy_conformer():
+    #   1. force field energy, 2. low level single point energy,
+    #   3. low level optimisation and 4. high level optimisation
+    # At each tier the conformers are ranked on energy and at most max_num_*
+    # conformers within the *_window (kJ mol-1) of the lowest are passed to
+    # the next. None sets no cut-off and low level single points are only
+    # calculated if either the max_num_lsp or lsp_window is set
+    #
+    max_num_ff_conformers = None
+    max_num_lsp_conformers = None
+    lsp_conformer_window = None
+    max_num_hmethod_conformers = None
+    hmethod_conformer_window = None
+    # -------------------------------------------------------------------------
+    # Maximum number of graph isomorphism results, for pairs of molecular
+    # graphs, that are cached. Least recently used results are removed first
+    #
+    isomorphism_cache_size = 10000
+    # -------------------------------------------------------------------------
 
     class ORCA:
         # ---------------------------------------------------------------------
@@ -0,0 +1,203 @@
+import hashlib
+import numpy as np
+import os
+from autode.atoms import Atom
+from autode.log import logger
+
+
+def get_conformer_archive_key(species, dist_consts=None):
+    """
+    Get a key for the conformers of a species from its atom labels, molecular
+    graph and any distance constraints, such that conformers generated with
+    a different key should not be reused
+
+    Arguments:
+        species (autode.species.Species):
+
+    Keyword Arguments:
+        dist_consts (dict): Key = tuple of atom indexes, Value = distance
+
+    Returns:
+        (str): Hash
+    """
+    labels = [atom.label for atom in species.atoms]
+
+    bonds = []
+    if species.graph is not None:
+        bonds = sorted(tuple(sorted(bond)) for bond in species.graph.edges)
+
+    consts = []
+    if dist_consts is not None:
+        consts = sorted((tuple(sorted(bond)), round(float(dist), 3))
+                        for bond, dist in dist_consts.items())
+
+    key_str = f'{labels}{bonds}{consts}'
+    return hashlib.sha1(key_str.encode()).hexdigest()
+
+
+def save_conformer_energies(species, conformers):
+    """
+    Save the energies of conformers generated by simulated annealing (those
+    with a conformer number, conf_n) in the species' conformer archive
+
+    Arguments:
+        species (autode.species.Species):
+        conformers (list(autode.conformers.Conformer)):
+    """
+    conformers = [conf for conf in conformers if conf.conf_n is not None]
+
+    if len(conformers) == 0:
+        return None
+
+    archive = ConformerArchive(species, dist_consts=conformers[0].dist_consts)
+
+    for conf in conformers:
+        if conf.conf_n in archive:
+            archive.set_energy(conf.conf_n, conf.energy)
+
+    if len(archive) > 0:
+        archive.save()
+
+    return None
+
+
+class ConformerArchive:
+
+    def __len__(self):
+        return len(self.conf_ns)
+
+    def __contains__(self, conf_n):
+        return conf_n in self._idxs
+
+    def _load(self):
+        """Load the conformers from the archive file, if it exists and has
+        the same key and atoms"""
+        if not os.path.exists(self.filename):
+            return None
+
+        with np.load(self.filename, allow_pickle=False) as data:
+
+            if (str(data['key']) != self.key
+                    or list(data['labels']) != self.labels):
+                logger.warning(f'Conformer archive {self.filename} was '
+                               f'generated for a different species. Ignoring')
+                return None
+
+            self.conf_ns = data['conf_ns']
+            self.coords = data['coords']
+            self.seeds = data['seeds']
+            self.ff_energies = data['ff_energies']
+            self.energies = data['energies']
+
+        self._idxs = {int(conf_n): n for n, conf_n in enumerate(self.conf_ns)}
+        logger.info(f'Loaded {len(self)} conformer(s) from {self.filename}')
+        return None
+
+    def save(self):
+        """Save the archive, replacing the file only once it has been
+        written completely"""
+        tmp_filename = f'{self.filename}.tmp'
+
+        with open(tmp_filename, 'wb') as archive_file:
+            np.savez(archive_file,
+                     key=np.array(self.key),
+                     labels=np.array(self.labels),
+                     conf_ns=self.conf_ns,
+                     coords=self.coords,
+                     seeds=self.seeds,
+                     ff_energies=self.ff_energies,
+                     energies=self.energies)
+
+        os.replace(tmp_filename, self.filename)
+        return None
+
+    def append(self, conf_n, coords, seed=None, ff_energy=None):
+        """
+        Add a conformer to the archive, replacing any with the same number
+
+        Arguments:
+            conf_n (int): Number of the conformer
+            coords (np.ndarray): shape = (n_atoms, 3)
+
+        Keyword Arguments:
+            seed (int | None): Random seed used to generate the conformer
+            ff_energy (float | None): Force field energy
+        """
+        assert coords.shape == (len(self.labels), 3)
+
+        seed = -1 if seed is None else seed
+        ff_energy = np.nan if ff_energy is None else ff_energy
+
+        if conf_n in self:
+            n = self._idxs[conf_n]
+            self.coords[n], self.seeds[n] = coords, seed
+            self.ff_energies[n], self.energies[n] = ff_energy, np.nan
+            return None
+
+        self._idxs[conf_n] = len(self)
+        self.conf_ns = np.append(self.conf_ns, conf_n)
+        self.coords = np.concatenate((self.coords, coords[None, :, :]))
+        self.seeds = np.append(self.seeds, seed)
+        self.ff_energies = np.append(self.ff_energies, ff_energy)
+        self.energies = np.append(self.energies, np.nan)
+
+        return None
+
+    def set_energy(self, conf_n, energy):
+        """Set the energy (e.g. from an electronic structure calculation) of
+        a conformer in the archive"""
+        self.energies[self._idxs[conf_n]] = np.nan if energy is None else energy
+        return None
+
+    def get_coords(self, conf_n):
+        """
+        Get the coordinates of a conformer
+
+        Arguments:
+            conf_n (int): Number of the conformer
+
+        Returns:
+            (np.ndarray): shape = (n_atoms, 3)
+        """
+        return np.array(self.coords[self._idxs[conf_n]], copy=True)
+
+    def get_atoms(self, conf_n):
+        """
+        Get the atoms of a conformer
+
+        Arguments:
+            conf_n (int): Number of the conformer
+
+        Returns:
+            (list(autode.atoms.Atom)): Atoms
+        """
+        return [Atom(label, *coord)
+                for label, coord in zip(self.labels, self.get_coords(conf_n))]
+
+    def __init__(self, species, dist_consts=None, filename=None):
+        """
+        Conformers of a species stored in a single file, as a stack of
+        coordinates with the random seed, force field and electronic structure
+        energy of each conformer. Conformers are loaded from an existing file
+        only if the key (see get_conformer_archive_key) and atoms match
+
+        Arguments:
+            species (autode.species.Species):
+
+        Keyword Arguments:
+            dist_consts (dict): Key = tuple of atom indexes, Value = distance
+            filename (str | None): Archive filename, if None then
+                                   {species.name}_confs.npz
+        """
+        self.filename = f'{species.name}_confs.npz' if filename is None else filename
+        self.key = get_conformer_archive_key(species, dist_consts)
+        self.labels = [atom.label for atom in species.atoms]
+
+        self.conf_ns = np.zeros(0, dtype=int)
+        self.coords = np.zeros(shape=(0, len(self.labels), 3))
+        self.seeds = np.zeros(0, dtype=int)
+        self.ff_energies = np.zeros(0)
+        self.energies = np.zeros(0)
+
+        self._idxs = {}     # Conformer number -> index in the arrays
+        self._load()
@@ -2,16 +2,19 @@ from copy import deepcopy
 from itertools import combinations
 import numpy as np
 import os
+from multiprocessing import Pool
 from scipy.optimize import minimize
+from scipy.spatial.distance import cdist
 from time import time
 from cconf_gen import v
 from cconf_gen import dvdr
 from autode.bond_lengths import get_ideal_bond_length_matrix
 from autode.config import Config
-from autode.input_output import xyz_file_to_atoms
-from autode.input_output import atoms_to_xyz_file
+from autode.conformers.archive import ConformerArchive
 from autode.log import logger
 from autode.geom import are_coords_reasonable
+from autode.geom import get_rot_mat_euler
+from autode.mol_graphs import find_cycles
 from autode.mol_graphs import split_mol_across_bond
 from autode.exceptions import CannotSplitAcrossBond
 from autode.exceptions import NoMolecularGraph
@@ -116,11 +119,11 @@ def get_atoms_rotated_stereocentres(species, atoms, rand):
 
     Arguments:
         species (autode.species.Species):
-        atoms (list(autode.atoms.Atom)):
+        atoms (autode.atoms.Atoms):
         rand (np.RandomState): random state
 
     Returns:
-        (list(autode.atoms.Atom)): Atoms
+        (autode.atoms.Atoms): Atoms
     """
 
     stereocentres = [node for node in species.graph.nodes if species.graph.nodes[node]['stereo'] is True]
@@ -136,7 +139,8 @@ def get_atoms_rotated_stereocentres(species, atoms, rand):
             continue
 
         try:
-            left_idxs, right_idxs = split_mol_across_bond(species.graph, bond=(i, j))
+            left_idxs, right_idxs = split_mol_across_bond(species.compact_graph,
+                                                         bond=(i, j))
 
         except CannotSplitAcrossBond:
             logger.warning('Splitting across this bond does not give two '
@@ -148,7 +152,8 @@ def get_atoms_rotated_stereocentres(species, atoms, rand):
         theta = 2*np.pi*rand.rand()
         idxs_to_rotate = left_idxs if i in left_idxs else right_idxs
 
-        [atoms[n].rotate(axis=rot_axis, theta=theta, origin=atoms[i].coord) for n in idxs_to_rotate if n != i]
+        atoms.rotate(axis=rot_axis, theta=theta, origin=atoms[i].coord,
+                     idxs=[n for n in idxs_to_rotate if n != i])
 
     return atoms
 
@@ -169,7 +174,8 @@ def add_dist_consts_for_stereocentres(species, dist_consts):
     Returns:
         (dict): Distance constraints
     """
-    if not are_coords_reasonable(coords=species.get_coordinates()):
+    if not are_coords_reasonable(coords=species.get_coordinates(),
+                                 dist_mat=species.get_distance_matrix()):
         # TODO generate a reasonable initial structure: molassembler?
         logger.error('Cannot constrain stereochemistry if the initial '
                      'structure is not sensible')
@@ -233,71 +239,430 @@ def get_non_random_atoms(species):
     return set(non_rand_atoms)
 
 
-def get_atoms_from_generated_file(species, xyz_filename):
+def get_coords_minimised_v_subset(coords, idxs, bonds, k, c, d0, tol,
+                                  fixed_bonds, exponent=8):
     """
-    Get atoms from a previously generated  .xyz file, if the atoms match
+    Get the coordinates that minimise a bonds + repulsion FF where only the
+    atoms with indexes in idxs are free to move, all others are fixed
 
     Arguments:
-        species (autode.species.Species):
-        xyz_filename (str):
+        coords (np.ndarray): Initial coordinates, shape = (n_atoms, 3)
+        idxs (list(int)): Indexes of the atoms to minimise
+        bonds (list(tuple(int))): List of bonds
+        fixed_bonds (list(tuple(int))): List of constrained bonds
+        k (float):
+        c (float):
+        d0 (np.ndarray): Ideal bond lengths. shape = (n_atoms, n_atoms)
+        tol (float):
+        exponent (int): Exponent in the repulsive pairwise term
 
     Returns:
-        (list(autode.atoms.Atoms)) or None: Atoms from file
+        (np.ndarray): Optimised coordinates, shape = (n_atoms, 3)
     """
+    n_atoms = len(coords)
+    os.environ['OMP_NUM_THREADS'] = str(1)
 
-    if not os.path.exists(xyz_filename):
-        return None
+    coords = np.array(coords, copy=True)
+    bond_matrix = get_bond_matrix(n_atoms=n_atoms,
+                                  bonds=bonds,
+                                  fixed_bonds=fixed_bonds)
 
-    atoms = xyz_file_to_atoms(filename=xyz_filename)
+    def energy(x):
+        coords[idxs] = x.reshape(-1, 3)
+        return v(coords.reshape(3 * n_atoms), bond_matrix, k, d0, c, exponent)
 
-    if len(atoms) != species.n_atoms:
-        return None
+    def gradient(x):
+        coords[idxs] = x.reshape(-1, 3)
+        grad = dvdr(coords.reshape(3 * n_atoms), bond_matrix, k, d0, c,
+                    exponent)
+        return grad.reshape(n_atoms, 3)[idxs].flatten()
 
-    all_atoms_match = all(atoms[i].label == species.atoms[i].label
-                          for i in range(species.n_atoms))
+    res = minimize(energy, x0=coords[idxs].flatten(),
+                   method='CG',
+                   tol=tol,
+                   jac=gradient)
 
-    if all_atoms_match:
-        logger.info('Conformer has already been generated')
-        return atoms
+    coords[idxs] = res.x.reshape(-1, 3)
+    return coords
 
-    return None
 
+def get_fragments(graph):
+    """
+    Partition a molecular graph into fragments that can be built as rigid
+    bodies: ring systems (rings that share an atom are merged) and acyclic
+    non-terminal atoms, each with their terminal (degree 1) neighbours. The
+    fragments are ordered such that, where possible, every fragment is bonded
+    to one earlier in the list
 
-def get_coords_no_init_strucutre(atoms, species, d0, constrained_bonds):
+    Arguments:
+        graph (nx.Graph):
+
+    Returns:
+        (list(list(int))): Atom indexes in each fragment
     """
-    Generate coordinates where no initial structure is present - this fixes(?)
-     a problem for large molecule where if all the atoms are initially bonded
-     and minimised then high energy minima are often found
+    ring_systems = []
+    for ring in find_cycles(graph):
+        system = set(ring)
 
-    Args:
-        atoms (list(autode.atoms.Atom)):
-        species (autode.species.Species):
+        for other_system in [s for s in ring_systems if s & system]:
+            system |= other_system
+            ring_systems.remove(other_system)
+
+        ring_systems.append(system)
+
+    fragments = [sorted(system) for system in ring_systems]
+    fragment_idx = {i: n for n, system in enumerate(fragments) for i in system}
+
+    def is_terminal(idx):
+        return graph.degree(idx) == 1
+
+    for i in graph.nodes:
+        if i in fragment_idx or is_terminal(i):
+            continue
+
+        fragment_idx[i] = len(fragments)
+        fragments.append([i])
+
+    # Add the terminal atoms to the fragment of their neighbour, pairs of
+    # terminal atoms e.g. H2 form their own fragment
+    for i in graph.nodes:
+        if i in fragment_idx or not is_terminal(i):
+            continue
+
+        j = next(iter(graph.neighbors(i)))
+        if j not in fragment_idx:
+            fragment_idx[j] = len(fragments)
+            fragments.append([j])
+
+        fragment_idx[i] = fragment_idx[j]
+        fragments[fragment_idx[j]].append(i)
+
+    # Order the fragments with a breadth first search starting from the
+    # largest in each connected component
+    ordered_idxs = []
+    for n in sorted(range(len(fragments)), key=lambda m: -len(fragments[m])):
+        if n in ordered_idxs:
+            continue
+
+        queue = [n]
+        while len(queue) > 0:
+            m = queue.pop(0)
+            if m in ordered_idxs:
+                continue
+
+            ordered_idxs.append(m)
+            queue += [fragment_idx[j] for i in fragments[m]
+                      for j in graph.neighbors(i)
+                      if fragment_idx[j] not in ordered_idxs]
+
+    return [sorted(fragments[n]) for n in ordered_idxs]
+
+
+def get_coords_atom_by_atom(coords, bonds, d0, constrained_bonds):
+    """
+    Minimise a structure by adding atoms one at a time, minimising after
+    every addition
+
+    Arguments:
+        coords (np.ndarray): Initial coordinates, shape = (n_atoms, 3)
+        bonds (list(tuple(int))):
         d0 (np.ndarray):
-        constrained_bonds (list):
+        constrained_bonds (list(tuple(int))):
 
     Returns:
         (np.ndarray): Optimised coordinates, shape = (n_atoms, 3)
     """
     # Minimise atoms with no bonds between them
-    far_coords = get_coords_minimised_v(coords=np.array([atom.coord for atom in atoms]),
-                                        bonds=species.graph.edges, fixed_bonds=constrained_bonds,
+    far_coords = get_coords_minimised_v(coords=coords,
+                                        bonds=bonds, fixed_bonds=constrained_bonds,
                                         k=0.0, c=0.1, d0=d0, tol=5E-3, exponent=2)
     coords = far_coords[:2]
 
     # Add the atoms one by one to the structure. Thanks to Dr. Cyrille Lavigne
     #  for this suggestion!
-    for n in range(2, species.n_atoms):
+    for n in range(2, len(far_coords)):
         coords = get_coords_minimised_v(np.concatenate((coords, far_coords[len(coords):n+1])),
-                                        bonds=species.graph.edges, fixed_bonds=constrained_bonds,
+                                        bonds=bonds, fixed_bonds=constrained_bonds,
                                         k=0.1, c=0.1, d0=d0, tol=1E-3, exponent=2)
+    return coords
+
+
+def get_fragment_coords(coords, fragment, bonds, d0, constrained_bonds):
+    """
+    Generate a local geometry of a fragment in isolation from the rest of the
+    structure
+
+    Arguments:
+        coords (np.ndarray): Coordinates of all atoms, shape = (n_atoms, 3)
+        fragment (list(int)): Atom indexes in this fragment
+        bonds (list(tuple(int))):
+        d0 (np.ndarray):
+        constrained_bonds (list(tuple(int))):
+
+    Returns:
+        (np.ndarray): Fragment coordinates, shape = (len(fragment), 3)
+    """
+    if len(fragment) == 1:
+        return np.zeros((1, 3))
+
+    local_idxs = {idx: n for n, idx in enumerate(fragment)}
+    local_bonds = [(local_idxs[i], local_idxs[j]) for (i, j) in bonds
+                   if i in local_idxs and j in local_idxs]
+    local_constrained_bonds = [(local_idxs[i], local_idxs[j])
+                               for (i, j) in constrained_bonds
+                               if i in local_idxs and j in local_idxs]
+    local_d0 = d0[np.ix_(fragment, fragment)]
+
+    frag_coords = get_coords_atom_by_atom(coords[fragment], local_bonds,
+                                          local_d0, local_constrained_bonds)
+
+    return get_coords_minimised_v(coords=frag_coords, bonds=local_bonds,
+                                  fixed_bonds=local_constrained_bonds,
+                                  k=1.0, c=0.01, d0=local_d0, tol=1E-4)
+
+
+def get_coords_no_init_strucutre(atoms, species, d0, constrained_bonds,
+                                 fragments=None):
+    """
+    Generate coordinates where no initial structure is present - this fixes(?)
+     a problem for large molecule where if all the atoms are initially bonded
+     and minimised then high energy minima are often found.
+
+    The structure is built from rigid fragments (see get_fragments) each with
+    a geometry generated in isolation. Fragments are added one by one, bonded
+    to the current structure, and only the atoms close to the new bond are
+    minimised before a single minimisation of the full structure
+
+    Args:
+        atoms (list(autode.atoms.Atom)):
+        species (autode.species.Species):
+        d0 (np.ndarray):
+        constrained_bonds (list):
+
+    Keyword Arguments:
+        fragments (list(list(int)) | None): Fragments, if None then
+                                            calculate from the graph
+
+    Returns:
+        (np.ndarray): Optimised coordinates, shape = (n_atoms, 3)
+    """
+    init_coords = np.array([atom.coord for atom in atoms])
+    bonds = list(species.graph.edges)
+
+    coords = np.zeros(shape=(species.n_atoms, 3))
+    built_idxs = []
+
+    # Fragments with the same atoms and bonds can share the same geometry
+    fragment_geometries = {}
+
+    if fragments is None:
+        fragments = get_fragments(species.graph)
+
+    for fragment in fragments:
+        key = (tuple(atoms[i].label for i in fragment),
+               tuple(sorted((fragment.index(i), fragment.index(j))
+                            for (i, j) in bonds
+                            if i in fragment and j in fragment)))
+
+        if key not in fragment_geometries:
+            fragment_geometries[key] = get_fragment_coords(init_coords,
+                                                           fragment, bonds,
+                                                           d0,
+                                                           constrained_bonds)
+        frag_coords = np.array(fragment_geometries[key], copy=True)
+
+        if len(built_idxs) == 0:
+            coords[fragment] = frag_coords - np.average(frag_coords, axis=0)
+            built_idxs += fragment
+            continue
+
+        join_bonds = [(i, j) if i in built_idxs else (j, i)
+                      for (i, j) in bonds
+                      if (i in built_idxs) != (j in built_idxs)
+                      and (i in fragment or j in fragment)]
+
+        if len(join_bonds) == 0:
+            # Not bonded to the current structure, so add it along a
+            # random direction, outside the current structure
+            centroid = np.average(coords[built_idxs], axis=0)
+            radius = np.max(np.linalg.norm(coords[built_idxs] - centroid,
+                                           axis=1))
+            direction = np.random.uniform(-1, 1, size=3)
+            coords[fragment] = (frag_coords - np.average(frag_coords, axis=0)
+                                + centroid + (radius + 3.0) * direction
+                                / np.linalg.norm(direction))
+            built_idxs += fragment
+            continue
+
+        i, j = join_bonds[0]
+
+        # Add the fragment along the direction pointing away from the
+        # neighbours of atom i that already exist
+        built_neighbours = [n for n in species.graph.neighbors(i)
+                            if n in built_idxs]
+        if len(built_neighbours) > 0:
+            direction = (coords[i]
+                         - np.average(coords[built_neighbours], axis=0))
+        else:
+            direction = coords[i] - np.average(coords[built_idxs], axis=0)
+
+        if np.linalg.norm(direction) < 1E-6:
+            direction = np.random.uniform(-1, 1, size=3)
+        direction /= np.linalg.norm(direction)
+
+        # Rotate the fragment so the rest of the fragment points along the
+        # same direction from atom j, then shift j to the ideal bond length
+        frag_coords -= frag_coords[fragment.index(j)]
+        frag_direction = np.average(frag_coords, axis=0)
+
+        if np.linalg.norm(frag_direction) > 1E-6:
+            frag_direction /= np.linalg.norm(frag_direction)
+            axis = np.cross(frag_direction, direction)
+            cos_theta = np.dot(frag_direction, direction)
+
+            if np.linalg.norm(axis) > 1E-6:
+                rot_mat = get_rot_mat_euler(axis=axis,
+                                            theta=np.arccos(cos_theta))
+                frag_coords = np.matmul(frag_coords, rot_mat.T)
+
+            elif cos_theta < 0:
+                frag_coords *= -1
+
+        coords[fragment] = frag_coords + coords[i] + d0[i, j] * direction
+        built_idxs += fragment
+
+        # Minimise only the joining region with the nearby atoms, keeping
+        # everything else fixed
+        join_idxs = fragment + [i] + built_neighbours
+        dists = cdist(coords[join_idxs], coords[built_idxs])
+        sub_idxs = sorted(set(join_idxs).union(
+            built_idxs[n] for n in np.where(np.min(dists, axis=0) < 4.0)[0]))
+
+        sub_map = {idx: n for n, idx in enumerate(sub_idxs)}
+        sub_bonds = [(sub_map[a], sub_map[b]) for (a, b) in bonds
+                     if a in sub_map and b in sub_map]
+        sub_constrained_bonds = [(sub_map[a], sub_map[b])
+                                 for (a, b) in constrained_bonds
+                                 if a in sub_map and b in sub_map]
+
+        coords[sub_idxs] = get_coords_minimised_v_subset(
+            coords=coords[sub_idxs],
+            idxs=[sub_map[idx] for idx in join_idxs],
+            bonds=sub_bonds,
+            fixed_bonds=sub_constrained_bonds,
+            k=1.0, c=0.01, d0=d0[np.ix_(sub_idxs, sub_idxs)], tol=1E-3)
 
     # Perform a final minimisation
-    coords = get_coords_minimised_v(coords=coords, bonds=species.graph.edges, fixed_bonds=constrained_bonds,
+    coords = get_coords_minimised_v(coords=coords, bonds=bonds, fixed_bonds=constrained_bonds,
                                     k=1.0, c=0.01, d0=d0, tol=1E-5)
     return coords
 
 
-def get_simanl_atoms(species, dist_consts=None, conf_n=0):
+class ConformerGenerationPlan:
+
+    def __init__(self, species, dist_consts=None):
+        """
+        Everything required to generate conformers of a species with
+        get_simanl_atoms that does not change between conformers, so it is
+        calculated only once per species
+
+        Arguments:
+            species (autode.species.Species): Species with a molecular graph
+
+        Keyword Arguments:
+            dist_consts (dict): Key = tuple of atom indexes, Value = distance
+        """
+        if species.graph is None:
+            raise NoMolecularGraph
+
+        self.species = species
+        self.bonds = list(species.graph.edges)
+
+        self.d0 = get_ideal_bond_length_matrix(atoms=species.atoms,
+                                               bonds=self.bonds)
+
+        # Add distance constraints across stereocentres e.g. for a Z double
+        # bond then modify d0 appropriately
+        self.dist_consts = add_dist_consts_for_stereocentres(species=species,
+                                                             dist_consts={} if dist_consts is None else dict(dist_consts))
+
+        self.constrained_bonds = []
+        for bond, length in self.dist_consts.items():
+            i, j = bond
+            self.d0[i, j] = length
+            self.d0[j, i] = length
+            self.constrained_bonds.append(bond)
+
+        # Atoms that are not randomised
+        self.fixed_atom_indexes = get_non_random_atoms(species=species)
+
+        self.init_coords_are_reasonable = are_coords_reasonable(species.get_coordinates(),
+                                                                dist_mat=species.get_distance_matrix())
+
+        # Fragments are only required when building from no initial structure
+        self.fragments = None
+        if not self.init_coords_are_reasonable:
+            self.fragments = get_fragments(species.graph)
+
+
+def get_simanl_coords(plan, seed=None):
+    """
+    Generate the coordinates of a conformer from a ConformerGenerationPlan
+    by randomising the atoms then minimising the force field, see
+    get_simanl_atoms
+
+    Arguments:
+        plan (autode.conformers.conf_gen.ConformerGenerationPlan):
+
+    Keyword Arguments:
+        seed (int | None): Random seed, if None then use a random one
+
+    Returns:
+        (np.ndarray): shape = (n_atoms, 3)
+    """
+    species = plan.species
+
+    # Initialise a new random seed and make a copy of the species' atoms.
+    # RandomState is thread safe
+    rand = np.random.RandomState(seed)
+    atoms = get_atoms_rotated_stereocentres(species=species,
+                                            atoms=deepcopy(species.atoms),
+                                            rand=rand)
+
+    # Shift by a factor defined in the config file if the coordinates are
+    # reasonable but otherwise init in a 10 A cube
+    if plan.init_coords_are_reasonable:
+        # Randomise coordinates that aren't fixed by shifting a maximum of
+        # autode.Config.max_atom_displacement in x, y, z
+        factor = Config.max_atom_displacement / np.sqrt(3)
+        [atom.translate(vec=factor * rand.uniform(-1, 1, 3)) for i, atom in enumerate(atoms) if i not in plan.fixed_atom_indexes]
+    else:
+        # Randomise in a 10 Å cubic box
+        [atom.translate(vec=rand.uniform(-5, 5, 3)) for atom in atoms]
+
+    logger.info('Minimising species...')
+    st = time()
+    if plan.init_coords_are_reasonable:
+        coords = get_coords_minimised_v(coords=np.array([atom.coord for atom in atoms]), bonds=plan.bonds,
+                                        k=1.0, c=0.01, d0=plan.d0, tol=1E-5, fixed_bonds=plan.constrained_bonds)
+
+    else:
+        coords = get_coords_no_init_strucutre(atoms, species, plan.d0, plan.constrained_bonds,
+                                              fragments=plan.fragments)
+
+    logger.info(f'                 ... ({time()-st:.3f} s)')
+    return coords
+
+
+def get_plan_v(plan, coords):
+    """Get the force field energy of a set of coordinates, as minimised in
+    get_simanl_coords"""
+    return get_v(coords, bonds=plan.bonds, k=1.0, c=0.01, d0=plan.d0,
+                 fixed_bonds=plan.constrained_bonds)
+
+
+def get_simanl_atoms(species, dist_consts=None, conf_n=0, seed=None,
+                     plan=None, archive=None):
     """
     Use a bonded + repulsive force field to generate 3D structure for a
     species. If the initial coordinates are reasonable e.g. from a previously
@@ -308,6 +673,10 @@ def get_simanl_atoms(species, dist_consts=None, conf_n=0):
 
     V(x) = Σ_bonds k(d - d0)^2 + Σ_ij c/d^n
 
+    Generated conformers are saved in the species' conformer archive, so
+    rerunning will use the saved conformer. If an archive is given it is not
+    saved, which is left to the caller
+
     Arguments:
         species (autode.species.Species):
 
@@ -315,74 +684,137 @@ def get_simanl_atoms(species, dist_consts=None, conf_n=0):
 
         conf_n (int): Number of this conformer
 
+        seed (int | None): Random seed, if None then use a random one
+
+        plan (autode.conformers.conf_gen.ConformerGenerationPlan | None):
+              Plan for this species, if None then make one with dist_consts
+
+        archive (autode.conformers.archive.ConformerArchive | None):
+                 Archive of conformers, if None then load the species'
+
     Returns:
         (list(autode.atoms.Atom)): Atoms
     """
-    xyz_filename = f'{species.name}_conf{conf_n}_siman.xyz'
+    save_archive = archive is None
+
+    if archive is None:
+        archive = ConformerArchive(species, dist_consts=dist_consts)
 
-    saved_atoms = get_atoms_from_generated_file(species, xyz_filename)
-    if saved_atoms is not None:
-        return saved_atoms
+    if conf_n in archive:
+        logger.info('Conformer has already been generated')
+        return archive.get_atoms(conf_n)
 
     # To generate the potential requires bonds between atoms defined in a
     # molecular graph
-    if species.graph is None:
-        raise NoMolecularGraph
+    if plan is None:
+        plan = ConformerGenerationPlan(species, dist_consts=dist_consts)
 
-    # Initialise a new random seed and make a copy of the species' atoms.
-    # RandomState is thread safe
-    rand = np.random.RandomState()
-    atoms = get_atoms_rotated_stereocentres(species=species,
-                                            atoms=deepcopy(species.atoms),
-                                            rand=rand)
+    seed = np.random.randint(0, 2**31 - 1) if seed is None else seed
+    coords = get_simanl_coords(plan, seed=seed)
 
-    # Add the distance constraints as fixed bonds
-    d0 = get_ideal_bond_length_matrix(atoms=species.atoms,
-                                      bonds=species.graph.edges())
+    # Save the conformer so rerunning will use it
+    archive.append(conf_n, coords, seed=seed, ff_energy=get_plan_v(plan, coords))
 
-    # Add distance constraints across stereocentres e.g. for a Z double bond
-    # then modify d0 appropriately
-    dist_consts = add_dist_consts_for_stereocentres(species=species,
-                                                    dist_consts={} if dist_consts is None else dist_consts)
+    if save_archive:
+        archive.save()
 
-    constrained_bonds = []
-    for bond, length in dist_consts.items():
-        i, j = bond
-        d0[i, j] = length
-        d0[j, i] = length
-        constrained_bonds.append(bond)
+    return archive.get_atoms(conf_n)
 
-    # Randomise coordinates that aren't fixed by shifting a maximum of
-    # autode.Config.max_atom_displacement in x, y, z
-    fixed_atom_indexes = get_non_random_atoms(species=species)
 
-    # Shift by a factor defined in the config file if the coordinates are
-    # reasonable but otherwise init in a 10 A cube
-    initial_coords_are_reasonable = are_coords_reasonable(species.get_coordinates())
+# Conformer generation plan shared by all the conformers generated in a
+# worker process, set once by _init_simanl_worker
+_worker_plan = None
 
-    if initial_coords_are_reasonable:
-        factor = Config.max_atom_displacement / np.sqrt(3)
-        [atom.translate(vec=factor * rand.uniform(-1, 1, 3)) for i, atom in enumerate(atoms) if i not in fixed_atom_indexes]
-    else:
-        # Randomise in a 10 Å cubic box
-        [atom.translate(vec=rand.uniform(-5, 5, 3)) for atom in atoms]
 
-    logger.info('Minimising species...')
-    st = time()
-    if initial_coords_are_reasonable:
-        coords = get_coords_minimised_v(coords=np.array([atom.coord for atom in atoms]), bonds=species.graph.edges,
-                                        k=1.0, c=0.01, d0=d0, tol=1E-5, fixed_bonds=constrained_bonds)
+def _init_simanl_worker(plan):
+    """Set the conformer generation plan in a worker process"""
+    global _worker_plan
+    _worker_plan = plan
 
-    else:
-        coords = get_coords_no_init_strucutre(atoms, species, d0, constrained_bonds)
+    return None
 
-    logger.info(f'                 ... ({time()-st:.3f} s)')
 
-    # Set the coordinates of the new atoms
-    for i, atom in enumerate(atoms):
-        atom.coord = coords[i]
+def _get_worker_simanl_coords(seed):
+    """Generate the coordinates and force field energy of a conformer of the
+    species in this worker's plan"""
+    coords = get_simanl_coords(_worker_plan, seed=seed)
 
-    # Print an xyz file so rerunning will read the file
-    atoms_to_xyz_file(atoms=atoms, filename=xyz_filename)
+    return coords, get_plan_v(_worker_plan, coords)
 
-    return atoms
+
+def get_species_for_workers(species):
+    """
+    Get a copy of a species with only the attributes needed to generate
+    conformers (name, atoms, charge, multiplicity, solvent and molecular
+    graph) so it is cheap to send to a worker process. Any conformers, RDKit
+    molecule or calculations are not copied
+
+    Arguments:
+        species (autode.species.Species):
+
+    Returns:
+        (autode.conformers.Conformer):
+    """
+    from autode.conformers.conformer import get_conformer
+
+    species_copy = get_conformer(species, name=species.name)
+    species_copy.graph = species.graph
+
+    return species_copy
+
+
+def generate_simanl_atoms(species, dist_consts=None, n_confs=None):
+    """
+    Generate the atoms of conformers using get_simanl_coords in parallel
+    batches of Config.n_cores, yielding each set as they are produced. If the
+    generator is closed the remaining conformers are not generated. A
+    ConformerGenerationPlan for the species is made once and sent to each
+    worker process when the pool is initialised, so each conformer then
+    requires only a random seed. Conformers are saved to the species'
+    conformer archive once generation finishes or the generator is closed,
+    and any already in the archive are not generated again
+
+    Arguments:
+        species (autode.species.Species):
+
+    Keyword Arguments:
+        dist_consts (dict): Key = tuple of atom indexes, Value = distance
+
+        n_confs (int): Maximum number of conformers to generate, if None
+                       default to autode.Config.num_conformers
+
+    Yields:
+        (list(autode.atoms.Atom)): Atoms
+    """
+    n_confs = Config.num_conformers if n_confs is None else n_confs
+    batch_size = max(Config.n_cores, 1)
+    seeds = np.random.randint(0, 2**31 - 1, size=n_confs)
+
+    archive = ConformerArchive(species, dist_consts=dist_consts)
+    plan = ConformerGenerationPlan(get_species_for_workers(species),
+                                   dist_consts=dist_consts)
+
+    n_archived = len(archive)
+
+    try:
+        with Pool(processes=Config.n_cores,
+                  initializer=_init_simanl_worker,
+                  initargs=(plan,)) as pool:
+
+            for batch_start in range(0, n_confs, batch_size):
+                batch = [i for i in range(batch_start, min(batch_start + batch_size, n_confs))
+                         if i not in archive]
+
+                results = pool.map(_get_worker_simanl_coords,
+                                   [int(seeds[i]) for i in batch], chunksize=1)
+
+                for i, (coords, ff_energy) in zip(batch, results):
+                    archive.append(i, coords, seed=int(seeds[i]), ff_energy=ff_energy)
+
+                for i in range(batch_start, min(batch_start + batch_size, n_confs)):
+                    yield archive.get_atoms(i)
+
+    finally:
+        # Save all the conformers generated, once
+        if len(archive) > n_archived:
+            archive.save()
@@ -3,6 +3,7 @@ from autode.config import Config
 from autode.exceptions import AtomsNotFound
 from autode.log import logger
 from autode.species.species import Species
+from autode.wrappers.keywords import SinglePointKeywords
 
 
 def get_conformer(species, name):
@@ -26,9 +27,42 @@ def get_conformer(species, name):
     return conformer
 
 
+def get_low_sp_keywords(method):
+    """
+    Get keywords for a single point energy at the level of theory of the
+    low level optimisation, by removing the optimisation keywords
+
+    Arguments:
+        method (autode.wrappers.base.ElectronicStructureMethod):
+
+    Returns:
+        (autode.wrappers.keywords.SinglePointKeywords):
+    """
+    keywords = []
+
+    for keyword in method.keywords.low_opt.copy():
+
+        # NWChem optimisation blocks and tasks
+        if keyword.lower().startswith('driver'):
+            continue
+
+        if keyword.lower().startswith('task'):
+            keywords.append(keyword.replace('optimize', 'energy'))
+            continue
+
+        # e.g. LooseOpt in ORCA or Opt=Loose in Gaussian
+        if 'opt' in keyword.lower() and '\n' not in keyword:
+            continue
+
+        keywords.append(keyword)
+
+    return SinglePointKeywords(keywords)
+
+
 class Conformer(Species):
 
-    def optimise(self, method=None, reset_graph=False, calc=None):
+    def optimise(self, method=None, reset_graph=False, calc=None,
+                 n_cores=None):
         """
         Optimise the geometry of this conformer
 
@@ -38,6 +72,8 @@ class Conformer(Species):
         Keyword Arguments:
             reset_graph (bool):
             calc (autode.calculation.Calculation):
+            n_cores (int): Number of cores to use, if None then use
+                           autode.Config.n_cores
         """
         logger.info(f'Running optimisation of {self.name}')
 
@@ -46,7 +82,7 @@ class Conformer(Species):
 
         opt = Calculation(name=f'{self.name}_opt', molecule=self, method=method,
                           keywords=method.keywords.low_opt,
-                          n_cores=Config.n_cores,
+                          n_cores=Config.n_cores if n_cores is None else n_cores,
                           distance_constraints=self.dist_consts)
         opt.run()
         self.energy = opt.get_energy()
@@ -60,9 +96,35 @@ class Conformer(Species):
 
         return None
 
+    def single_point(self, method, n_cores=None):
+        """
+        Calculate a single point energy of this conformer at the same level
+        of theory as the low level optimisation
+
+        Arguments:
+            method (autode.wrappers.base.ElectronicStructureMethod):
+
+        Keyword Arguments:
+            n_cores (int): Number of cores to use, if None then use
+                           autode.Config.n_cores
+        """
+        logger.info(f'Running single point energy evaluation of {self.name}')
+
+        sp = Calculation(name=f'{self.name}_sp', molecule=self, method=method,
+                         keywords=get_low_sp_keywords(method),
+                         n_cores=Config.n_cores if n_cores is None else n_cores)
+        sp.run()
+        self.energy = sp.get_energy()
+
+        return None
+
     def __init__(self, name='conf', atoms=None, solvent_name=None,
-                 charge=0, mult=1, dist_consts=None):
+                 charge=0, mult=1, dist_consts=None, conf_n=None):
         super(Conformer, self).__init__(name, atoms, charge, mult,
                                         solvent_name=solvent_name)
 
         self.dist_consts = dist_consts
+
+        # Number of the conformer in the conformer archive, if generated by
+        # simulated annealing
+        self.conf_n = conf_n
@@ -1,12 +1,62 @@
-from rdkit import Chem
+from rdkit.Chem import AllChem
 from autode.atoms import Atom
+from autode.bond_lengths import get_ideal_bond_length_matrix
+from autode.conformers.conf_gen import get_v
 from autode.config import Config
 from autode.constants import Constants
-from autode.geom import calc_heavy_atom_rmsd
+from autode.geom import calc_rmsds
+from autode.geom import calc_rmsd_lower_bounds
+from autode.geom import get_distance_fingerprint
+from autode.geom import get_heavy_atom_coords
 from autode.log import logger
+from autode.utils import NoDaemonPool
 import numpy as np
 
 
+def get_rdkit_atom_labels(rdkit_mol_obj):
+    """Get the element labels of all the atoms in a RDKit molecule, which are
+    shared by all its conformers
+
+    Arguments:
+        rdkit_mol_obj (rdkit.Chem.Mol): RDKit molecule
+
+    Returns:
+        (list(str)): Atom labels
+    """
+    return [atom.GetSymbol() for atom in rdkit_mol_obj.GetAtoms()]
+
+
+def get_coords_from_rdkit_mol_object(rdkit_mol_obj, conf_ids):
+    """Get the coordinates of a set of conformers in a RDKit molecule
+
+    Arguments:
+        rdkit_mol_obj (rdkit.Chem.Mol): RDKit molecule
+        conf_ids (list(int)): Conformer ids
+
+    Returns:
+        (np.ndarray): shape = (n_confs, n_atoms, 3)
+    """
+    coords = np.empty(shape=(len(conf_ids), rdkit_mol_obj.GetNumAtoms(), 3))
+
+    for n, conf_id in enumerate(conf_ids):
+        coords[n] = rdkit_mol_obj.GetConformer(conf_id).GetPositions()
+
+    return coords
+
+
+def get_atoms_from_coords(labels, coords):
+    """Get a list of atoms from atom labels and coordinates
+
+    Arguments:
+        labels (list(str)): Atom labels
+        coords (np.ndarray): shape = (n_atoms, 3)
+
+    Returns:
+        (list(autode.atoms.Atom)): Atoms
+    """
+    return [Atom(label, *coord) for label, coord in zip(labels, coords)]
+
+
 def get_atoms_from_rdkit_mol_object(rdkit_mol_obj, conf_id):
     """Generate atoms for conformers in rdkit_mol_obj
 
@@ -17,32 +67,229 @@ def get_atoms_from_rdkit_mol_object(rdkit_mol_obj, conf_id):
     Returns:
         (list(autode.atoms.Atom)): Atoms
     """
+    coords = get_coords_from_rdkit_mol_object(rdkit_mol_obj, conf_ids=[conf_id])
+    return get_atoms_from_coords(get_rdkit_atom_labels(rdkit_mol_obj), coords[0])
 
-    mol_block_lines = Chem.MolToMolBlock(rdkit_mol_obj,
-                                         confId=conf_id).split('\n')
-    mol_file_atoms = []
 
-    # Extract atoms from the mol block
-    for line in mol_block_lines:
-        split_line = line.split()
+def generate_rdkit_conformer_coords(rdkit_mol_obj, n_confs):
+    """
+    Generate conformers with RDKit's ETKDG algorithm in batches of
+    autode.Config.conformer_saturation_window, yielding the coordinates of
+    each batch as they are produced. Atom labels are the same for all
+    conformers (see get_rdkit_atom_labels)
 
-        if len(split_line) == 16:
-            atom_label = split_line[3]
-            x, y, z = split_line[0], split_line[1], split_line[2]
-            mol_file_atoms.append(Atom(atom_label, x=x, y=y, z=z))
+    Arguments:
+        rdkit_mol_obj (rdkit.Chem.Mol): RDKit molecule
+        n_confs (int): Maximum number of conformers to generate
 
-    return mol_file_atoms
+    Yields:
+        (np.ndarray): shape = (n_confs_in_batch, n_atoms, 3)
+    """
+    # Conformers are not pruned on RMSD here, so all duplicates count towards
+    # the saturation of conformer generation (see conformers_are_saturated)
+    method = AllChem.ETKDGv2()
+    method.numThreads = Config.n_cores
+
+    batch_size = max(Config.conformer_saturation_window, 1)
+
+    for batch_start in range(0, n_confs, batch_size):
+
+        # Keep the previously generated conformers, other than those present
+        # before the first batch
+        method.clearConfs = batch_start == 0
+
+        logger.info('Running conformation generation with RDKit... running')
+        conf_ids = list(AllChem.EmbedMultipleConfs(rdkit_mol_obj,
+                                                   numConfs=min(batch_size, n_confs - batch_start),
+                                                   params=method))
+        logger.info('                                          ... done')
+
+        yield get_coords_from_rdkit_mol_object(rdkit_mol_obj, conf_ids)
+
+
+def generate_rdkit_conformer_atoms(rdkit_mol_obj, n_confs):
+    """
+    Generate conformers with RDKit's ETKDG algorithm, yielding the atoms of
+    each conformer as they are produced. See generate_rdkit_conformer_coords
+
+    Arguments:
+        rdkit_mol_obj (rdkit.Chem.Mol): RDKit molecule
+        n_confs (int): Maximum number of conformers to generate
+
+    Yields:
+        (list(autode.atoms.Atom)): Atoms
+    """
+    labels = get_rdkit_atom_labels(rdkit_mol_obj)
+
+    for coords in generate_rdkit_conformer_coords(rdkit_mol_obj, n_confs):
+        for conf_coords in coords:
+            yield get_atoms_from_coords(labels, conf_coords)
 
 
-def get_unique_confs(conformers, energy_threshold_kj=1):
+def conformers_are_saturated(is_unique):
+    """
+    Determine if conformer generation has saturated i.e. the fraction of
+    unique conformers in the last autode.Config.conformer_saturation_window
+    generated conformers is below autode.Config.min_unique_conformer_rate
+
+    Arguments:
+        is_unique (list(bool)): Whether each generated conformer was unique,
+                                in the order they were generated
+
+    Returns:
+        (bool):
+    """
+    window = Config.conformer_saturation_window
+
+    if window <= 0 or len(is_unique) < window:
+        return False
+
+    unique_rate = sum(is_unique[-window:]) / window
+
+    if unique_rate < Config.min_unique_conformer_rate:
+        logger.info(f'Conformer generation saturated after {len(is_unique)} '
+                    f'conformers. Unique rate = {unique_rate:.3f}')
+        return True
+
+    return False
+
+
+def get_ff_energies(species, conformers):
+    """
+    Calculate the energies of a set of conformers of a species using the
+    bonded + repulsive force field used in the conformer generation, with
+    bonds from the molecular graph of the species
+
+    Arguments:
+        species (autode.species.Species):
+        conformers (list(autode.conformers.Conformer)):
+
+    Returns:
+        (list(float)): Energies in arbitrary units
+    """
+    bonds = list(species.graph.edges)
+    d0 = get_ideal_bond_length_matrix(atoms=species.atoms, bonds=bonds)
+
+    energies = []
+    for conformer in conformers:
+        conf_d0 = np.array(d0, copy=True)
+        dist_consts = {} if conformer.dist_consts is None else conformer.dist_consts
+
+        for (i, j), length in dist_consts.items():
+            conf_d0[i, j] = conf_d0[j, i] = length
+
+        energies.append(get_v(conformer.get_coordinates(), bonds=bonds,
+                              k=1.0, c=0.01, d0=conf_d0,
+                              fixed_bonds=list(dist_consts.keys())))
+    return energies
+
+
+def screen_conformers(conformers, energies, max_n=None, window_kj=None,
+                      tier='screening'):
+    """
+    Retain at most max_n of the conformers with the lowest energies, that are
+    within an energy window of the lowest
+
+    Arguments:
+        conformers (list(autode.conformers.Conformer)):
+        energies (list(float | None)): Energies of the conformers, None
+                                       energies are excluded
+
+    Keyword Arguments:
+        max_n (int | None): Maximum number of conformers to retain
+        window_kj (float | None): Energy window in kJ mol-1, with energies in
+                                  Hartrees
+        tier (str): Name of this screening tier
+
+    Returns:
+        (list(autode.conformers.Conformer)): Retained conformers, sorted by
+                                             energy
+    """
+    idxs = sorted((i for i, energy in enumerate(energies) if energy is not None),
+                  key=lambda i: energies[i])
+
+    if window_kj is not None and len(idxs) > 0:
+        threshold = energies[idxs[0]] + window_kj / Constants.ha2kJmol
+        idxs = [i for i in idxs if energies[i] <= threshold]
+
+    if max_n is not None:
+        idxs = idxs[:max_n]
+
+    logger.info(f'Retained {len(idxs)} of {len(conformers)} conformer(s) in '
+                f'the {tier} tier. {len(conformers) - len(idxs)} dropped')
+
+    return [conformers[i] for i in idxs]
+
+
+def _run_conformer_calculation(conformer, method, calc_type, n_cores):
+    """Optimise or calculate the single point energy of a conformer, returning
+    the conformer so the result is available from a process pool"""
+
+    if calc_type == 'opt':
+        conformer.optimise(method=method, n_cores=n_cores)
+
+    elif calc_type == 'sp':
+        conformer.single_point(method=method, n_cores=n_cores)
+
+    else:
+        raise ValueError(f'Unknown conformer calculation type: {calc_type}')
+
+    return conformer
+
+
+def run_conformer_calculations(conformers, method, calc_type='opt'):
+    """
+    Optimise, or calculate single point energies of, a list of conformers as
+    a single parallel batch. Each calculation uses autode.Config.n_cores
+    divided by the number of conformers, and at least one, cores
+
+    Arguments:
+        conformers (list(autode.conformers.Conformer)):
+        method (autode.wrappers.base.ElectronicStructureMethod):
+
+    Keyword Arguments:
+        calc_type (str): Either 'opt' or 'sp'
+
+    Returns:
+        (list(autode.conformers.Conformer)): Conformers with energies and
+                                             atoms set, in the same order
+    """
+    if len(conformers) == 0:
+        return conformers
+
+    n_cores_pp = max(Config.n_cores // len(conformers), 1)
+    logger.info(f'Running {len(conformers)} conformer calculations with '
+                f'{n_cores_pp} core(s) each')
+
+    if Config.n_cores == 1:
+        return [_run_conformer_calculation(conformer, method, calc_type, 1)
+                for conformer in conformers]
+
+    # Use custom NoDaemonPool here, as the calculations may spawn processes
+    with NoDaemonPool(processes=Config.n_cores) as pool:
+        results = [pool.apply_async(_run_conformer_calculation,
+                                    (conformer, method, calc_type, n_cores_pp))
+                   for conformer in conformers]
+
+        return [res.get(timeout=None) for res in results]
+
+
+def get_unique_confs(conformers, energy_threshold_kj=1, rmsd_threshold=None):
     """
     For a list of conformers return those that are unique based on an energy
-    threshold in kJ mol^-1
+    threshold in kJ mol^-1. Conformers are sorted by energy once then swept
+    in order, so the lowest energy conformer is always retained. If an RMSD
+    threshold is given then a conformer is only discarded if it is also
+    within the RMSD threshold of a retained conformer close in energy
 
     Arguments:
         conformers (list(autode.conformer.Conformer)):
         energy_threshold_kj (float): Energy threshold in kJ mol-1
 
+    Keyword Arguments:
+        rmsd_threshold (float | None): Heavy atom RMSD threshold in Å, or None
+                                       to compare only on energy
+
     Returns:
         (list(autode.conformers.conformers.Conformer)): List of conformers
     """
@@ -54,25 +301,39 @@ def get_unique_confs(conformers, energy_threshold_kj=1):
     # Conformer.energy is in Hartrees
     threshold = energy_threshold_kj / Constants.ha2kJmol
 
-    # The first conformer must be unique, if it has an energy
-    unique_conformers = []
+    if any(conformer.energy is None for conformer in conformers):
+        logger.error('Conformer had no energy. Excluding')
 
-    for conformer in conformers:
+    idxs = [i for i, conformer in enumerate(conformers)
+            if conformer.energy is not None]
+    idxs.sort(key=lambda i: conformers[i].energy)
+
+    unique_idxs = []
 
-        if conformer.energy is None:
-            logger.error('Conformer had no energy. Excluding')
-            continue
+    for i in idxs:
+        energy = conformers[i].energy
 
-        # Iterate through all the unique conformers already found and check
-        # that the energy is not similar
-        unique = True
-        for other_conformer in unique_conformers:
-            if np.abs(conformer.energy - other_conformer.energy) < threshold:
-                unique = False
+        # Retained conformers that are close in energy are at the end of
+        # the list, as the conformers are sorted by energy
+        close_idxs = []
+        for j in reversed(unique_idxs):
+            if energy - conformers[j].energy >= threshold:
                 break
+            close_idxs.append(j)
+
+        if len(close_idxs) == 0:
+            unique_idxs.append(i)
+
+        elif (rmsd_threshold is not None
+              and all(conformers[k].atoms is not None
+                      for k in close_idxs + [i])
+              and conf_is_unique_rmsd(conformers[i],
+                                      [conformers[k] for k in close_idxs],
+                                      rmsd_tol=rmsd_threshold)):
+            unique_idxs.append(i)
 
-        if unique:
-            unique_conformers.append(conformer)
+    # Retain the original ordering of the conformers
+    unique_conformers = [conformers[i] for i in sorted(unique_idxs)]
 
     n_unique_conformers = len(unique_conformers)
     logger.info(f'Stripped {n_conformers - n_unique_conformers} conformer(s) '
@@ -103,11 +364,26 @@ def conf_is_unique_rmsd(conf, conf_list, rmsd_tol=None):
     rmsd_tol = Config.rmsd_threshold if rmsd_tol is None else rmsd_tol
     logger.info(f'Removing conformers with RMSD < {rmsd_tol} Å to any other')
 
-    # Calculate the RMSD between this Conformer and the those in conf_list
-    # using the Kabsch algorithm
-    for other_conf in conf_list:
+    if len(conf_list) == 0:
+        return True
+
+    coords = get_heavy_atom_coords(conf.atoms)
+    if len(coords) == 0:
+        logger.warning('Cannot calculate a heavy atom RMSD with no heavy atoms')
+        return True
+
+    other_coords = np.array([get_heavy_atom_coords(other_conf.atoms)
+                             for other_conf in conf_list])
+
+    # Only calculate the RMSD, using the Kabsch algorithm, to conformers that
+    # could be within the threshold from their distance fingerprints
+    fingerprints = np.array([get_distance_fingerprint(other)
+                             for other in other_coords])
+    lower_bounds = calc_rmsd_lower_bounds(get_distance_fingerprint(coords),
+                                          fingerprints, n_atoms=len(coords))
 
-        if calc_heavy_atom_rmsd(conf.atoms, other_conf.atoms) < rmsd_tol:
-            return False
+    close_coords = other_coords[lower_bounds < rmsd_tol]
+    if len(close_coords) == 0:
+        return True
 
-    return True
+    return bool(np.min(calc_rmsds(coords, close_coords)) >= rmsd_tol)
@@ -0,0 +1,250 @@
+import itertools
+import numpy as np
+import networkx as nx
+from math import gcd
+from autode.atoms import Atom
+from autode.atoms import get_vdw_radius
+from autode.atoms import is_pi_atom
+from autode.config import Config
+from autode.geom import get_rot_mats
+from autode.log import logger
+from autode.mol_graphs import CompactGraph
+from autode.mol_graphs import get_separate_subgraphs
+from autode.mol_graphs import is_isomorphic
+from autode.mol_graphs import split_mol_across_bond
+from autode.exceptions import CannotSplitAcrossBond
+
+
+def get_rotor_symmetry_number(graph, atom, partner):
+    """
+    Get the symmetry number of a rotor e.g. 3 for a methyl group, defined by
+    the groups bonded to an atom other than the partner atom, which must all
+    be the same (isomorphic) for a symmetry number larger than one. Only
+    tetrahedral AX3 rotors (e.g. CH3, CF3) and planar AX2 rotors (e.g. a
+    phenyl) are symmetric, so a pyramidal NH2 group for example is not
+
+    Arguments:
+        graph (nx.Graph):
+        atom (int): Atom on the rotation axis
+        partner (int): Other atom on the rotation axis
+
+    Returns:
+        (int):
+    """
+    neighbours = [n for n in graph.neighbors(atom) if n != partner]
+
+    if len(neighbours) == 2:
+        atom_label = graph.nodes[atom]['atom_label']
+
+        # Rotating a non-planar AX2 group by 180° gives a different structure
+        if not is_pi_atom(atom_label, valency=graph.degree(atom)):
+            return 1
+
+    elif len(neighbours) != 3:
+        return 1
+
+    branches = []
+    for neighbour in neighbours:
+        graph_copy = graph.copy()
+        graph_copy.remove_edge(atom, neighbour)
+        branch = [subgraph for subgraph in get_separate_subgraphs(graph_copy)
+                  if neighbour in subgraph.nodes][0]
+
+        # Atoms in a ring are not rotors with any symmetry
+        if atom in branch.nodes:
+            return 1
+
+        branches.append(branch)
+
+    if all(is_isomorphic(branches[0], branch, ignore_active_bonds=True)
+           for branch in branches[1:]):
+        return len(neighbours)
+
+    return 1
+
+
+def get_rotatable_bonds(graph):
+    """
+    Get the bonds which can be rotated in a systematic conformer search:
+    bonds that are not π-bonds, active or in a ring and where neither atom
+    is terminal. The symmetry number is that of the combined rotors at either
+    end, so e.g. a bond to a methyl group has only one unique torsion on a
+    120° grid
+
+    Arguments:
+        graph (nx.Graph):
+
+    Returns:
+        (list(tuple)): Tuples of (i, j, idxs, symmetry number) where i, j are
+                       the atom indexes of the bond and idxs the indexes of
+                       the atoms that move (on the side of atom j)
+    """
+    rotatable_bonds = []
+    compact_graph = CompactGraph(graph)
+
+    for (i, j) in graph.edges:
+        if graph.edges[i, j]['pi'] or graph.edges[i, j].get('active', False):
+            continue
+
+        if graph.degree(i) < 2 or graph.degree(j) < 2:
+            continue
+
+        # Bonds in rings cannot be split across
+        try:
+            left_idxs, right_idxs = split_mol_across_bond(compact_graph, bond=(i, j))
+
+        except CannotSplitAcrossBond:
+            continue
+
+        # Rotate the smaller side of the molecule
+        if len(left_idxs) > len(right_idxs):
+            left_idxs, right_idxs = right_idxs, left_idxs
+
+        if i in left_idxs:
+            i, j = j, i
+
+        sym_i = get_rotor_symmetry_number(graph, atom=i, partner=j)
+        sym_j = get_rotor_symmetry_number(graph, atom=j, partner=i)
+
+        # Equivalent rotations from the symmetry of either end
+        symmetry_number = sym_i * sym_j // gcd(sym_i, sym_j)
+
+        rotatable_bonds.append((i, j, sorted(left_idxs), symmetry_number))
+
+    logger.info(f'Found {len(rotatable_bonds)} rotatable bond(s)')
+    return rotatable_bonds
+
+
+def get_torsion_angle_grid(rotatable_bonds, angle_step):
+    """
+    Get the unique angles for each rotatable bond, on a grid with a spacing
+    of angle_step, up to the period given by the rotor symmetry
+
+    Arguments:
+        rotatable_bonds (list(tuple)): See get_rotatable_bonds
+        angle_step (float): Spacing in degrees
+
+    Returns:
+        (list(np.ndarray)): Angles in radians for each bond
+    """
+    angles = []
+    for (_, _, _, symmetry_number) in rotatable_bonds:
+        period = 360.0 / symmetry_number
+        angles.append(np.deg2rad(np.arange(0.0, period - 1E-6, angle_step)))
+
+    return angles
+
+
+def get_non_clashing(coords_stack, min_dist_mat):
+    """
+    Determine which structures in a stack have no pairwise distances
+    shorter than a minimum
+
+    Arguments:
+        coords_stack (np.ndarray): shape = (m, n, 3)
+        min_dist_mat (np.ndarray): Minimum distance for each pair of atoms.
+                                   shape = (n, n)
+
+    Returns:
+        (np.ndarray): Boolean array. shape = (m,)
+    """
+    diffs = coords_stack[:, :, None, :] - coords_stack[:, None, :, :]
+    dist_mats = np.linalg.norm(diffs, axis=3)
+
+    return np.all(dist_mats >= min_dist_mat, axis=(1, 2))
+
+
+def get_torsion_combinations(angles, n_confs, rand):
+    """
+    Get combinations of torsion angles, all of them if there are no more
+    than n_confs, otherwise a random selection. The first combination is
+    always the unrotated structure
+
+    Arguments:
+        angles (list(np.ndarray)): Angles for each rotatable bond
+        n_confs (int): Maximum number of combinations
+        rand (np.random.RandomState):
+
+    Returns:
+        (np.ndarray): Angles in radians. shape = (n_combinations, n_bonds)
+    """
+    n_combinations = int(np.prod([len(bond_angles) for bond_angles in angles]))
+
+    if n_combinations <= n_confs:
+        return np.array(list(itertools.product(*angles)),
+                        dtype=float).reshape(n_combinations, len(angles))
+
+    idxs = {tuple(0 for _ in angles)}
+    for _ in range(10 * n_confs):
+        if len(idxs) == n_confs:
+            break
+
+        idxs.add(tuple(rand.randint(len(bond_angles)) for bond_angles in angles))
+
+    idxs = [tuple(0 for _ in angles)] + [idx for idx in idxs if any(idx)]
+    return np.array([[angles[k][n] for k, n in enumerate(idx)] for idx in idxs])
+
+
+def generate_torsion_atoms(species, n_confs=None, angle_step=None,
+                           batch_size=100):
+    """
+    Generate conformers of a species by systematically rotating about all
+    the rotatable bonds on a grid of torsion angles, discarding any that have
+    atoms, separated by more than two bonds, closer than the sum of their
+    van der Waals radii / 2
+
+    Arguments:
+        species (autode.species.Species): Species with a reasonable geometry
+                                          and a molecular graph
+
+    Keyword Arguments:
+        n_confs (int): Maximum number of conformers, if None default to
+                       autode.Config.num_conformers
+        angle_step (float): Grid spacing in degrees, if None default to
+                            autode.Config.torsion_angle_step
+        batch_size (int): Number of structures to generate at once
+
+    Yields:
+        (list(autode.atoms.Atom)): Atoms
+    """
+    n_confs = Config.num_conformers if n_confs is None else n_confs
+    angle_step = Config.torsion_angle_step if angle_step is None else angle_step
+
+    rotatable_bonds = get_rotatable_bonds(species.graph)
+    angles = get_torsion_angle_grid(rotatable_bonds, angle_step)
+
+    # Rotors with only a single unique torsion on the grid need not be rotated
+    rotatable_bonds = [bond for bond, bond_angles in zip(rotatable_bonds, angles)
+                       if len(bond_angles) > 1]
+    angles = [bond_angles for bond_angles in angles if len(bond_angles) > 1]
+
+    combinations = get_torsion_combinations(angles, n_confs,
+                                            rand=np.random.RandomState())
+    logger.info(f'Generating {len(combinations)} torsional conformers')
+
+    coords = species.get_coordinates()
+    labels = [atom.label for atom in species.atoms]
+
+    # Only atoms separated by more than two bonds can clash
+    path_lengths = dict(nx.all_pairs_shortest_path_length(species.graph, cutoff=2))
+    min_dist_mat = np.array([[0.5 * (get_vdw_radius(labels[i]) + get_vdw_radius(labels[j]))
+                              if j not in path_lengths[i] else 0.0
+                              for j in range(species.n_atoms)]
+                             for i in range(species.n_atoms)])
+
+    for batch_start in range(0, len(combinations), batch_size):
+        batch = combinations[batch_start:batch_start + batch_size]
+        coords_stack = np.repeat(coords[None, :, :], len(batch), axis=0)
+
+        # Apply the rotation about each bond to every structure in the batch
+        for k, (i, j, idxs, _) in enumerate(rotatable_bonds):
+            origins = coords_stack[:, j, :]
+            rot_mats = get_rot_mats(axes=origins - coords_stack[:, i, :],
+                                    thetas=batch[:, k])
+
+            shifted = coords_stack[:, idxs, :] - origins[:, None, :]
+            coords_stack[:, idxs, :] = (np.matmul(shifted, rot_mats.transpose(0, 2, 1))
+                                        + origins[:, None, :])
+
+        for conf_coords in coords_stack[get_non_clashing(coords_stack, min_dist_mat)]:
+            yield [Atom(label, *coord) for label, coord in zip(labels, conf_coords)]
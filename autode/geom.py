@@ -1,5 +1,5 @@
 import numpy as np
-from scipy.spatial.distance import cdist
+from scipy.spatial.distance import pdist
 from scipy.spatial import distance_matrix
 from autode.log import logger
 
@@ -9,7 +9,7 @@ def length(vec):
     return np.linalg.norm(vec)
 
 
-def are_coords_reasonable(coords):
+def are_coords_reasonable(coords, dist_mat=None):
     """
     Determine if a set of coords are reasonable. No distances can be < 0.7 Å
     and if there are more than 4 atoms ensure they do not all lie in the same
@@ -18,14 +18,22 @@ def are_coords_reasonable(coords):
     breaking
     Arguments:
         coords (np.ndarray): Species coordinates as a n_atoms x 3 array
+
+    Keyword Arguments:
+        dist_mat (np.ndarray | None): Distance matrix of the coordinates e.g.
+                                      from Species.get_distance_matrix(), if
+                                      None then it is calculated
     Returns:
         bool:
     """
 
     n_atoms = len(coords)
 
+    if dist_mat is None:
+        dist_mat = distance_matrix(coords, coords)
+
     # Generate a n_atoms x n_atoms matrix with ones on the diagonal
-    dist_mat = distance_matrix(coords, coords) + np.identity(n_atoms)
+    dist_mat = dist_mat + np.identity(n_atoms)
 
     if np.min(dist_mat) < 0.7:
         logger.warning('There is a distance < 0.7 Å. Structure is *not* '
@@ -100,6 +108,57 @@ def get_rot_mat_kabsch(p_matrix, q_matrix):
     return rot_matrix
 
 
+def get_rot_mat_euler(axis, theta):
+    """
+    Compute the 3D rotation matrix using the Euler Rodrigues formula
+    https://en.wikipedia.org/wiki/Euler–Rodrigues_formula
+    for an anticlockwise rotation of theta radians about a given axis
+
+    Arguments:
+        axis (np.ndarray): Axis to rotate in. shape = (3,)
+        theta (float): Angle in radians
+
+    Returns:
+        (np.ndarray): Rotation matrix. shape = (3, 3)
+    """
+    axis = np.asarray(axis)
+    axis = axis / np.linalg.norm(axis)
+
+    a = np.cos(theta / 2.0)
+    b, c, d = -axis * np.sin(theta / 2.0)
+    aa, bb, cc, dd = a * a, b * b, c * c, d * d
+    bc, ad, ac, ab, bd, cd = b * c, a * d, a * c, a * b, b * d, c * d
+
+    return np.array([[aa + bb - cc - dd, 2 * (bc + ad), 2 * (bd - ac)],
+                     [2 * (bc - ad), aa + cc - bb - dd, 2 * (cd + ab)],
+                     [2 * (bd + ac), 2 * (cd - ab), aa + dd - bb - cc]])
+
+
+def get_rot_mats(axes, thetas):
+    """
+    Get rotation matrices for anticlockwise rotations about a set of axes,
+    by a set of angles using the Rodrigues formula. Equivalent to
+    get_rot_mat_euler for each axis and angle
+
+    Arguments:
+        axes (np.ndarray): shape = (m, 3)
+        thetas (np.ndarray): Angles in radians. shape = (m,)
+
+    Returns:
+        (np.ndarray): shape = (m, 3, 3)
+    """
+    axes = axes / np.linalg.norm(axes, axis=1)[:, None]
+    cos, sin = np.cos(thetas)[:, None, None], np.sin(thetas)[:, None, None]
+
+    cross_mats = np.zeros(shape=(len(axes), 3, 3))
+    cross_mats[:, 0, 1], cross_mats[:, 0, 2] = -axes[:, 2], axes[:, 1]
+    cross_mats[:, 1, 0], cross_mats[:, 1, 2] = axes[:, 2], -axes[:, 0]
+    cross_mats[:, 2, 0], cross_mats[:, 2, 1] = -axes[:, 1], axes[:, 0]
+
+    return (cos * np.identity(3) + sin * cross_mats
+            + (1.0 - cos) * np.einsum('mi,mj->mij', axes, axes))
+
+
 def get_centered_matrix(mat):
     """For a list of coordinates n.e. a n_atoms x 3 matrix as a np array
     translate to the center of the coordinates"""
@@ -117,18 +176,11 @@ def get_neighbour_list(species, atom_i):
     Returns:
         (list(int)): list of atom ids in ascending distance away from atom_i
     """
-    coords = species.get_coordinates()
-    distance_vector = cdist(np.array([coords[atom_i]]), coords)[0]
-
-    dists_and_atom_labels = {}
-    for atom_j, dist in enumerate(distance_vector):
-        dists_and_atom_labels[dist] = species.atoms[atom_j].label
+    distance_vector = species.get_distance_matrix()[atom_i]
 
-    atom_label_neighbour_list = []
-    for dist, atom_label in sorted(dists_and_atom_labels.items()):
-        atom_label_neighbour_list.append(atom_label)
-
-    return atom_label_neighbour_list
+    # Atoms at the same distance are ordered by their index
+    return [species.atoms[atom_j].label
+            for atom_j in np.argsort(distance_vector, kind='stable')]
 
 
 def get_distance_constraints(species):
@@ -172,10 +224,21 @@ def calc_heavy_atom_rmsd(atoms1, atoms2):
         raise ValueError('RMSD must be computed between atom lists of the'
                          f'same length: {len(atoms1)} =/= {len(atoms2)}')
 
-    coords1 = np.array([atom.coord for atom in atoms1 if atom.label != 'H'])
-    coords2 = np.array([atom.coord for atom in atoms2 if atom.label != 'H'])
+    return calc_rmsd(get_heavy_atom_coords(atoms1),
+                     get_heavy_atom_coords(atoms2))
+
 
-    return calc_rmsd(coords1, coords2)
+def get_heavy_atom_coords(atoms):
+    """
+    Get the coordinates of the 'heavy' (non-hydrogen) atoms
+
+    Arguments:
+        atoms (list(autode.atoms.Atom)):
+
+    Returns:
+        (np.ndarray): shape = (n_heavy_atoms, 3)
+    """
+    return np.array([atom.coord for atom in atoms if atom.label != 'H'])
 
 
 def calc_rmsd(coords1, coords2):
@@ -204,10 +267,94 @@ def calc_rmsd(coords1, coords2):
     # Get the optimum rotation matrix
     rot_mat = get_rot_mat_kabsch(p_mat_trans, q_mat_trans)
 
-    fitted_coords = np.array([np.matmul(rot_mat, coord - p) + q for coord in coords2])
+    fitted_coords = np.matmul(coords2 - p, rot_mat.T) + q
     return np.sqrt(np.average(np.square(fitted_coords - coords1)))
 
 
+def calc_rmsds(coords, coords_stack):
+    """Calculate the RMSD between a set of coordinates and each set in a
+    stack of coordinates using the Kabsch algorithm, with all the singular
+    value decompositions performed at once
+
+    Arguments:
+        coords (np.ndarray): shape = (n, 3)
+        coords_stack (np.ndarray): shape = (m, n, 3)
+
+    Returns:
+        (np.ndarray): Root mean squared distances. shape = (m,)
+    """
+    coords_stack = np.asarray(coords_stack).reshape(-1, *np.shape(coords))
+    assert coords_stack.shape[1:] == coords.shape
+
+    q_mat = coords - np.average(coords, axis=0)
+    p_mats = coords_stack - np.average(coords_stack, axis=1)[:, None, :]
+
+    # Minimum squared deviation from the singular values of the covariance
+    # matrices, correcting the sign of the smallest for a reflection
+    h_mats = np.matmul(p_mats.transpose(0, 2, 1), q_mat)
+    u, s, vh = np.linalg.svd(h_mats)
+    s[:, 2] *= np.sign(np.linalg.det(np.matmul(u, vh)))
+
+    sq_devs = (np.sum(np.square(q_mat))
+               + np.sum(np.square(p_mats), axis=(1, 2))
+               - 2.0 * np.sum(s, axis=1))
+
+    return np.sqrt(np.maximum(sq_devs, 0.0) / q_mat.size)
+
+
+def calc_pairwise_rmsds(coords_stack):
+    """Calculate the RMSD between all pairs of coordinates in a stack
+
+    Arguments:
+        coords_stack (np.ndarray): shape = (m, n, 3)
+
+    Returns:
+        (np.ndarray): Symmetric matrix of RMSDs. shape = (m, m)
+    """
+    m = len(coords_stack)
+    rmsds = np.zeros(shape=(m, m))
+
+    for i in range(m - 1):
+        rmsds[i, i+1:] = calc_rmsds(coords_stack[i], coords_stack[i+1:])
+
+    return rmsds + rmsds.T
+
+
+def get_distance_fingerprint(coords):
+    """Get a rotation and translation invariant fingerprint of a set of
+    coordinates as the sorted list of all the pairwise distances
+
+    Arguments:
+        coords (np.ndarray): shape = (n, 3)
+
+    Returns:
+        (np.ndarray): shape = (n(n-1)/2,)
+    """
+    return np.sort(pdist(coords))
+
+
+def calc_rmsd_lower_bounds(fingerprint, fingerprints, n_atoms):
+    """Calculate lower bounds on the RMSD (as calc_rmsd) between a structure
+    and others from their distance fingerprints. After the optimal
+    superposition each pairwise distance changes by at most the sum of the
+    two atomic displacements, and sorting does not increase the distance
+    between two vectors, so  |Δfingerprint|^2 <= 2(n-1) Σ_i |δ_i|^2
+
+    Arguments:
+        fingerprint (np.ndarray): shape = (k,)
+        fingerprints (np.ndarray): shape = (m, k)
+        n_atoms (int): Number of atoms in each structure
+
+    Returns:
+        (np.ndarray): Lower bounds on the RMSD. shape = (m,)
+    """
+    if n_atoms < 2:
+        return np.zeros(len(fingerprints))
+
+    fp_diffs = np.linalg.norm(np.asarray(fingerprints) - fingerprint, axis=1)
+    return fp_diffs / np.sqrt(6.0 * n_atoms * (n_atoms - 1))
+
+
 def get_points_on_sphere(n_points, r=1):
     """
     Find n evenly spaced points on a sphere using the "How to generate
@@ -1,17 +1,31 @@
-from copy import deepcopy
+from collections import Counter
+from collections import OrderedDict
+from collections import namedtuple
+import hashlib
 import itertools
-import signal
+import threading
+import time
 from networkx.algorithms import isomorphism
 import networkx as nx
 import numpy as np
 import autode.exceptions as ex
-from scipy.spatial import distance_matrix
+from scipy.spatial import cKDTree
 from autode.atoms import get_maximal_valance
 from autode.atoms import is_pi_atom
 from autode.bond_lengths import get_avg_bond_length
+from autode.config import Config
 from autode.log import logger
 from autode.atoms import get_atomic_weight
 
+# Results of is_isomorphic shared across the process. Key = (fingerprint,
+# fingerprint, ignore_active_bonds), Value = bool. Least recently used first
+_isomorphism_cache = OrderedDict()
+_isomorphism_cache_stats = {'hits': 0, 'misses': 0}
+_isomorphism_cache_lock = threading.Lock()
+
+IsomorphismCacheInfo = namedtuple('IsomorphismCacheInfo',
+                                  ['hits', 'misses', 'maxsize', 'currsize'])
+
 
 def make_graph(species, rel_tolerance=0.25, bond_list=None,
                allow_invalid_valancies=False):
@@ -55,28 +69,18 @@ def make_graph(species, rel_tolerance=0.25, bond_list=None,
         return None
 
     else:
-        # Loop over the unique pairs of atoms and add 'bonds'
-        coordinates = species.get_coordinates()
-        dist_mat = distance_matrix(coordinates, coordinates)
-
-        for i in get_atom_ids_sorted_type(species):
+        pairs, distances = get_close_atom_pairs(species, rel_tolerance)
 
-            # Iterate through the closest atoms to atom i
-            for j in np.argsort(dist_mat[i]):
+        # Add 'bonds' from the lightest atoms first, to their closest atoms
+        neighbours = {i: [] for i in range(species.n_atoms)}
+        for (i, j), distance in zip(pairs.tolist(), distances):
+            neighbours[i].append((distance, j))
+            neighbours[j].append((distance, i))
 
-                if i == j:
-                    # Don't bond atoms to themselves
-                    continue
-
-                # Get r_avg for this X-Y bond e.g. C-C -> 1.5
-                avg_bond_length = get_avg_bond_length(species.atoms[i].label,
-                                                      species.atoms[j].label)
-
-                # If the distance between atoms i and j are less or equal to
-                # 1.25x average length add a 'bond'
-                if (dist_mat[i, j] <= avg_bond_length * (1.0 + rel_tolerance)
-                        and (i, j) not in graph.edges):
+        for i in get_atom_ids_sorted_type(species):
+            for _, j in sorted(neighbours[i]):
 
+                if (i, j) not in graph.edges:
                     graph.add_edge(i, j, pi=False, active=False)
 
     species.graph = graph
@@ -88,6 +92,48 @@ def make_graph(species, rel_tolerance=0.25, bond_list=None,
     return None
 
 
+def get_close_atom_pairs(species, rel_tolerance=0.25):
+    """
+    Get the pairs of atoms with a distance less than or equal to
+    (1 + rel_tolerance) × the average bond length for the pair of elements
+    e.g. 1.25 × 1.5 Å for C-C. Candidate pairs are found with a KD-tree,
+    so only atoms within the largest such distance are compared
+
+    Arguments:
+        species (autode.species.Species):
+
+    Keyword Arguments:
+        rel_tolerance (float):
+
+    Returns:
+        (tuple(np.ndarray)): Atom indexes of the pairs, shape = (n_pairs, 2)
+                             and their distances, shape = (n_pairs,)
+    """
+    coords = species.get_coordinates()[:species.n_atoms]
+
+    if species.n_atoms < 2:
+        return np.zeros(shape=(0, 2), dtype=int), np.zeros(0)
+
+    labels = [atom.label for atom in species.atoms[:species.n_atoms]]
+
+    # Maximum bonded distance for each pair of elements in the species
+    unique_labels = sorted(set(labels))
+    label_idxs = np.array([unique_labels.index(label) for label in labels])
+    max_distances = np.array([[(1.0 + rel_tolerance) * get_avg_bond_length(label_i, label_j)
+                               for label_j in unique_labels]
+                              for label_i in unique_labels])
+
+    pairs = cKDTree(coords).query_pairs(r=np.max(max_distances),
+                                        output_type='ndarray')
+    pairs = pairs.reshape(-1, 2)
+
+    distances = np.linalg.norm(coords[pairs[:, 0]] - coords[pairs[:, 1]], axis=1)
+    are_close = (distances <= max_distances[label_idxs[pairs[:, 0]],
+                                            label_idxs[pairs[:, 1]]])
+
+    return pairs[are_close], distances[are_close]
+
+
 def get_atom_ids_sorted_type(species):
     """
     Get a list of atom ids sorted by increasing atomic weight, useful for when
@@ -209,7 +255,9 @@ def species_are_isomorphic(species1, species2):
     if species1.graph is None or species2.graph is None:
         raise ex.NoMolecularGraph
 
-    if is_isomorphic(species1.graph, species2.graph):
+    if is_isomorphic(species1.graph, species2.graph,
+                     graph1_hash=species1.graph_hash,
+                     graph2_hash=species2.graph_hash):
         return True
 
     if species1.conformers is None and species2.conformers is None:
@@ -242,7 +290,9 @@ def species_are_isomorphic(species1, species2):
     for conformer1 in conformers_or_self(species1):
         for conformer2 in conformers_or_self(species2):
 
-            if is_isomorphic(conformer1.graph, conformer2.graph):
+            if is_isomorphic(conformer1.graph, conformer2.graph,
+                             graph1_hash=conformer1.graph_hash,
+                             graph2_hash=conformer2.graph_hash):
                 return True
 
     return False
@@ -405,9 +455,243 @@ def get_graphs_ignoring_active_edges(graph1, graph2):
     return g1, g2
 
 
-def is_isomorphic(graph1, graph2, ignore_active_bonds=False, timeout=5):
+def get_graph_hash(graph, match_active_bonds=True, n_iterations=3):
+    """
+    Get a Weisfeiler-Lehman hash of a graph from the atom labels and,
+    optionally, which bonds are active. Isomorphic graphs, as determined by
+    is_isomorphic, have the same hash, so graphs with different hashes are
+    not isomorphic. Graphs with the same hash are not necessarily isomorphic
+
+    Arguments:
+        graph (nx.Graph):
+
+    Keyword Arguments:
+        match_active_bonds (bool): Include the active flag of the edges
+        n_iterations (int): Number of neighbourhood aggregations
+
+    Returns:
+        (str): Hash
+    """
+    label_counts = Counter()
+
+    for labels in _get_wl_labels(graph, match_active_bonds, n_iterations):
+        label_counts.update(labels.values())
+
+    return _get_wl_hash(label_counts)
+
+
+def get_atom_signatures(graph, depth=6):
+    """
+    Get a signature of the environment of each atom in a graph, from the
+    labels of the atoms up to depth bonds away. Atoms that are equivalent by
+    symmetry have the same signature
+
+    Arguments:
+        graph (nx.Graph):
+
+    Keyword Arguments:
+        depth (int): Number of bonds away from an atom to consider
+
+    Returns:
+        (dict): Key = atom index, Value = signature (str)
+    """
+    return _get_wl_labels(graph, match_active_bonds=False,
+                          n_iterations=depth)[-1]
+
+
+def _get_wl_labels(graph, match_active_bonds, n_iterations):
+    """Weisfeiler-Lehman labels of the nodes in each iteration, starting
+    from the atom labels, as a list of dicts"""
+
+    def edge_label(i, j):
+        if match_active_bonds and graph.edges[i, j].get('active', False):
+            return '*'
+        return ''
+
+    # Nodes without labels are matched as carbon atoms in is_isomorphic
+    labels = [{node: str(data.get('atom_label', 'C'))
+               for node, data in graph.nodes(data=True)}]
+
+    for iteration in range(n_iterations):
+        prev_labels, new_labels = labels[iteration], {}
+
+        for node in graph.nodes:
+            neighbours = (edge_label(node, n) + prev_labels[n]
+                          for n in graph.neighbors(node))
+            new_labels[node] = _get_wl_label(prev_labels[node], neighbours)
+
+        labels.append(new_labels)
+
+    return labels
+
+
+def _get_wl_label(label, neighbour_labels):
+    """Weisfeiler-Lehman label of a node from its label and those of its
+    neighbours in the previous iteration"""
+    label += '(' + ','.join(sorted(neighbour_labels)) + ')'
+    return hashlib.blake2b(label.encode(), digest_size=8).hexdigest()
+
+
+def _get_wl_hash(label_counts):
+    """Hash of a graph from the number of each Weisfeiler-Lehman label"""
+    label_counts = sorted((label, n) for label, n in label_counts.items()
+                          if n > 0)
+
+    return hashlib.blake2b(str(label_counts).encode(),
+                           digest_size=16).hexdigest()
+
+
+class EditableGraph:
+
+    @property
+    def hash(self):
+        """Hash of the edited graph including active bonds, identical to
+        get_graph_hash() of the equivalent NX graph"""
+        return _get_wl_hash(self._label_counts)
+
+    def _wl_label(self, iteration, node):
+        """Weisfeiler-Lehman label of a node in an iteration (> 0)"""
+        labels = self._wl_labels[iteration - 1]
+
+        return _get_wl_label(labels[node],
+                             (('*' if frozenset((node, n)) in self.active_edges
+                               else '') + labels[n]
+                              for n in self.neighbours[node]))
+
+    def _set_wl_label(self, iteration, node, label):
+        """Set a Weisfeiler-Lehman label, updating the label counts"""
+        self._label_counts[self._wl_labels[iteration][node]] -= 1
+        self._label_counts[label] += 1
+        self._wl_labels[iteration][node] = label
+
+        return None
+
+    def edit(self, fbonds, bbonds):
+        """
+        Form and break bonds in the graph. Only the hash labels of atoms
+        within n_iterations bonds of an atom in a changed bond are updated.
+        Forming a bond that exists, or breaking one that does not, does
+        nothing
+
+        Arguments:
+            fbonds (list(tuple)): list of bonds to be made
+            bbonds (list(tuple)): list of bonds to be broken
+        """
+        added, removed, old_labels = [], [], []
+
+        for (i, j) in fbonds:
+            if j not in self.neighbours[i]:
+                self.neighbours[i].add(j)
+                self.neighbours[j].add(i)
+                added.append((i, j))
+
+        for (i, j) in bbonds:
+            if j in self.neighbours[i]:
+                self.neighbours[i].remove(j)
+                self.neighbours[j].remove(i)
+
+                active = frozenset((i, j)) in self.active_edges
+                self.active_edges.discard(frozenset((i, j)))
+                removed.append((i, j, active))
+
+        atoms = {atom for bond in added + removed for atom in bond[:2]}
+
+        for iteration in range(1, len(self._wl_labels)):
+            if iteration > 1:
+                atoms.update(*[self.neighbours[atom] for atom in atoms])
+
+            # Labels in this iteration are set after they are all computed
+            labels = [(atom, self._wl_label(iteration, atom)) for atom in atoms]
+
+            for atom, label in labels:
+                old_label = self._wl_labels[iteration][atom]
+
+                if label != old_label:
+                    old_labels.append((iteration, atom, old_label))
+                    self._set_wl_label(iteration, atom, label)
+
+        self._edits.append((added, removed, old_labels))
+        return None
+
+    def undo(self):
+        """Revert the last edit of the graph"""
+        added, removed, old_labels = self._edits.pop()
+
+        for (i, j, active) in removed:
+            self.neighbours[i].add(j)
+            self.neighbours[j].add(i)
+
+            if active:
+                self.active_edges.add(frozenset((i, j)))
+
+        for (i, j) in added:
+            self.neighbours[i].remove(j)
+            self.neighbours[j].remove(i)
+
+        for iteration, atom, label in reversed(old_labels):
+            self._set_wl_label(iteration, atom, label)
+
+        return None
+
+    def to_networkx(self):
+        """
+        NX graph with the edits applied. Attributes of the nodes and unchanged
+        edges are those of the initial graph
+
+        Returns:
+            (nx.Graph):
+        """
+        graph = self.graph.copy()
+
+        for added, removed, _ in self._edits:
+            graph.add_edges_from(added)
+            graph.remove_edges_from((i, j) for (i, j, _) in removed)
+
+        return graph
+
+    def __init__(self, graph, n_iterations=3):
+        """
+        Graph as sets of neighbours that can be edited by forming and
+        breaking bonds, then reverted, with a hash that is updated
+        incrementally. Used to check many rearrangements of a single graph
+
+        Arguments:
+            graph (nx.Graph):
+
+        Keyword Arguments:
+            n_iterations (int): Number of neighbourhood aggregations in the
+                                hash, see get_graph_hash
+        """
+        self.graph = graph
+
+        self.neighbours = {node: set(graph.neighbors(node))
+                           for node in graph.nodes}
+        self.active_edges = {frozenset((i, j))
+                             for i, j, data in graph.edges(data=True)
+                             if data.get('active', False)}
+
+        self._edits = []
+
+        # Nodes without labels are matched as carbon atoms in is_isomorphic
+        self._wl_labels = [{node: str(data.get('atom_label', 'C'))
+                            for node, data in graph.nodes(data=True)}]
+        self._label_counts = Counter(self._wl_labels[0].values())
+
+        for iteration in range(1, n_iterations + 1):
+            self._wl_labels.append({node: self._wl_label(iteration, node)
+                                    for node in graph.nodes})
+            self._label_counts.update(self._wl_labels[iteration].values())
+
+
+def is_isomorphic(graph1, graph2, ignore_active_bonds=False, timeout=5,
+                  graph1_hash=None, graph2_hash=None):
     """Check whether two NX graphs are isomorphic. Contains a timeout because
-    the gm.is_isomorphic() method occasionally gets stuck
+    the gm.is_isomorphic() method occasionally gets stuck. Graphs with
+    different hashes (see get_graph_hash) are not isomorphic, so the graph
+    matcher only runs on pairs with equal hashes. Results are cached for the
+    pair of graph fingerprints (see get_graph_fingerprint), with at most
+    Config.isomorphism_cache_size results kept in the cache. Graph hashes are
+    only used if both are given, and a rejection from them is not cached
 
     Arguments:
         graph1 (nx.Graph): graph 1
@@ -416,47 +700,166 @@ def is_isomorphic(graph1, graph2, ignore_active_bonds=False, timeout=5):
     Keyword Arguments:
         ignore_active_bonds (bool):
         timeout (float): Timeout in seconds
+        graph1_hash (str | None): Hash of graph 1 including active bonds,
+                                  e.g. species.graph_hash. Not used if
+                                  ignore_active_bonds is True
+        graph2_hash (str | None): Hash of graph 2
 
     Returns:
         (bool): if the graphs are isomorphic
     """
 
+    key = (*sorted((get_graph_fingerprint(graph1), get_graph_fingerprint(graph2))),
+           ignore_active_bonds)
+
+    with _isomorphism_cache_lock:
+        if key in _isomorphism_cache:
+            _isomorphism_cache.move_to_end(key)
+            _isomorphism_cache_stats['hits'] += 1
+            return _isomorphism_cache[key]
+
+        _isomorphism_cache_stats['misses'] += 1
+
+    if ignore_active_bonds or graph1_hash is None or graph2_hash is None:
+        graph1_hash = graph2_hash = None
+
+    # Don't cache a rejection from hashes passed in, which may be stale
+    elif graph1_hash != graph2_hash:
+        return False
+
+    result = _is_isomorphic(graph1, graph2,
+                            ignore_active_bonds=ignore_active_bonds,
+                            timeout=timeout,
+                            graph1_hash=graph1_hash,
+                            graph2_hash=graph2_hash)
+
+    # Don't cache a timed out graph match, which may not be correct
+    if result is None:
+        return False
+
+    with _isomorphism_cache_lock:
+        _isomorphism_cache[key] = result
+
+        while len(_isomorphism_cache) > max(Config.isomorphism_cache_size, 0):
+            _isomorphism_cache.popitem(last=False)
+
+    return result
+
+
+def get_graph_fingerprint(graph):
+    """
+    Get a fingerprint of a graph from the nodes, atom labels, edges and
+    active flags. Unlike get_graph_hash this depends on the atom numbering, so
+    graphs with the same fingerprint are identical
+
+    Arguments:
+        graph (nx.Graph):
+
+    Returns:
+        (str):
+    """
+    nodes = sorted((node, str(data.get('atom_label', 'C')))
+                   for node, data in graph.nodes(data=True))
+    edges = sorted((min(i, j), max(i, j), bool(data.get('active', False)))
+                   for i, j, data in graph.edges(data=True))
+
+    return hashlib.blake2b(str((nodes, edges)).encode(),
+                           digest_size=16).hexdigest()
+
+
+def get_isomorphism_cache_info():
+    """
+    Get the number of cache hits and misses in is_isomorphic, the maximum
+    and current size of the cache
+
+    Returns:
+        (autode.mol_graphs.IsomorphismCacheInfo):
+    """
+    with _isomorphism_cache_lock:
+        return IsomorphismCacheInfo(hits=_isomorphism_cache_stats['hits'],
+                                    misses=_isomorphism_cache_stats['misses'],
+                                    maxsize=Config.isomorphism_cache_size,
+                                    currsize=len(_isomorphism_cache))
+
+
+def clear_isomorphism_cache():
+    """Clear the cache of isomorphism results and the hit/miss counters"""
+    with _isomorphism_cache_lock:
+        _isomorphism_cache.clear()
+        _isomorphism_cache_stats.update(hits=0, misses=0)
+
+    return None
+
+
+def _is_isomorphic(graph1, graph2, ignore_active_bonds, timeout,
+                   graph1_hash, graph2_hash):
+    """Check whether two NX graphs are isomorphic, see is_isomorphic. Returns
+    None if the graph matching times out"""
+
     if ignore_active_bonds:
         graph1, graph2 = get_graphs_ignoring_active_edges(graph1, graph2)
+        graph1_hash = graph2_hash = None
 
     if not isomorphism.faster_could_be_isomorphic(graph1, graph2):
         return False
 
-    # Always match on atom types
-    node_match = isomorphism.categorical_node_match('atom_label', 'C')
+    if graph1_hash is None:
+        graph1_hash = get_graph_hash(graph1, match_active_bonds=not ignore_active_bonds)
 
-    if ignore_active_bonds:
-        gm = isomorphism.GraphMatcher(graph1, graph2,
-                                      node_match=node_match)
+    if graph2_hash is None:
+        graph2_hash = get_graph_hash(graph2, match_active_bonds=not ignore_active_bonds)
 
-    else:
-        # Also match on edges
-        edge_match = isomorphism.categorical_edge_match('active', False)
-        gm = isomorphism.GraphMatcher(graph1, graph2,
-                                      node_match=node_match,
-                                      edge_match=edge_match)
+    if graph1_hash != graph2_hash:
+        return False
 
-    # NX can hang here for not very large graphs, so kill after a timeout
+    # Always match on atom types
+    node_match = isomorphism.categorical_node_match('atom_label', 'C')
 
-    def handler(signum, frame):
-        raise TimeoutError
+    # and on active edges, if required
+    edge_match = None
+    if not ignore_active_bonds:
+        edge_match = isomorphism.categorical_edge_match('active', False)
 
-    signal.signal(signal.SIGALRM, handler)
-    signal.alarm(int(timeout))
+    # NX can hang here for not very large graphs, so stop after a timeout
+    gm = DeadlineGraphMatcher(graph1, graph2,
+                              deadline=time.monotonic() + timeout,
+                              node_match=node_match,
+                              edge_match=edge_match)
     try:
-        result = gm.is_isomorphic()
-        # Cancel the timer
-        signal.alarm(0)
-        return result
+        return gm.is_isomorphic()
 
     except TimeoutError:
         logger.error('NX graph matching hanging')
-        return False
+        return None
+
+
+class DeadlineGraphMatcher(isomorphism.GraphMatcher):
+
+    def syntactic_feasibility(self, G1_node, G2_node):
+        """Check the deadline every time a candidate pair of nodes is
+        tested, then test the pair as a standard GraphMatcher"""
+        if time.monotonic() > self.deadline:
+            raise TimeoutError
+
+        return super().syntactic_feasibility(G1_node, G2_node)
+
+    def __init__(self, G1, G2, deadline, node_match=None, edge_match=None):
+        """
+        VF2 graph matcher that raises TimeoutError once a deadline has
+        passed. Unlike a timeout with signals this can be used in any thread
+
+        Arguments:
+            G1 (nx.Graph):
+            G2 (nx.Graph):
+            deadline (float): Time from time.monotonic() after which
+                              matching is stopped
+
+        Keyword Arguments:
+            node_match (callable | None):
+            edge_match (callable | None):
+        """
+        super().__init__(G1, G2, node_match=node_match, edge_match=edge_match)
+        self.deadline = deadline
 
 
 def gm_is_isomorphic(gm, result):
@@ -464,20 +867,287 @@ def gm_is_isomorphic(gm, result):
 
 
 def find_cycles(graph):
-    """Finds all the cycles in a graph
+    """Finds all the cycles in a graph, as nx.cycle_basis
 
     Arguments:
-        graph (nx.Graph): the molecular graph
+        graph (nx.Graph | autode.mol_graphs.CompactGraph): the molecular graph
 
     Returns:
         list(list): each list has the atoms in a cycle
     """
-    return nx.cycle_basis(graph)
+    graph = get_compact_graph(graph)
+    neighbours = graph.adjacency
+
+    # Paton's algorithm over the node positions, in the order of NX
+    positions = dict.fromkeys(range(graph.n_nodes))
+    cycles = []
+
+    while positions:
+        root = positions.popitem()[0]
+        stack = [root]
+        pred = {root: root}
+        used = {root: set()}
+
+        while stack:
+            z = stack.pop()
+            z_used = used[z]
+
+            for n in neighbours[z]:
+                if n not in used:
+                    pred[n] = z
+                    stack.append(n)
+                    used[n] = {z}
+
+                elif n == z:
+                    cycles.append([z])
+
+                elif n not in z_used:
+                    n_used = used[n]
+                    cycle = [n, z]
+                    p = pred[z]
+                    while p not in n_used:
+                        cycle.append(p)
+                        p = pred[p]
+
+                    cycle.append(p)
+                    cycles.append(cycle)
+                    used[n].add(z)
+
+        for position in pred:
+            positions.pop(position, None)
+
+    return [[graph.nodes[i] for i in cycle] for cycle in cycles]
 
 
 def connected_components(graph):
-    """Connected sections of the nx.Graph"""
-    return list(nx.connected_components(graph))
+    """Connected sections of the nx.Graph or CompactGraph, as sets of nodes"""
+    graph = get_compact_graph(graph)
+
+    return [set(graph.nodes[i] for i in component)
+            for component in graph.get_components()]
+
+
+class CompactGraph:
+
+    # Flags of the edges and nodes
+    pi = 1
+    active = 2
+    stereo = 4
+
+    @property
+    def n_nodes(self):
+        return len(self.nodes)
+
+    @property
+    def n_edges(self):
+        return len(self.indices) // 2
+
+    @property
+    def adjacency(self):
+        """List of the neighbour positions of each node position"""
+        if self._adjacency is None:
+            self._adjacency = [self.indices[self.indptr[i]:self.indptr[i+1]].tolist()
+                               for i in range(self.n_nodes)]
+
+        return self._adjacency
+
+    @property
+    def degrees(self):
+        """Number of neighbours of each node (np.ndarray). shape = (n_nodes,)"""
+        return np.diff(self.indptr)
+
+    def position(self, node):
+        """Position of a node in the arrays"""
+        return self._positions[node]
+
+    def neighbours(self, node):
+        """List of the neighbours of a node"""
+        return [self.nodes[i] for i in self.adjacency[self._positions[node]]]
+
+    def degree(self, node):
+        i = self._positions[node]
+        return int(self.indptr[i+1] - self.indptr[i])
+
+    def atom_label(self, node):
+        return self.labels[self.label_codes[self._positions[node]]]
+
+    def has_flag(self, node, flag):
+        """Does a node have a flag e.g. CompactGraph.stereo"""
+        return bool(self.node_flags[self._positions[node]] & flag)
+
+    def edge_flags(self, i, j):
+        """Flags of an edge, or None if there is no edge between nodes i
+        and j"""
+        pos_i, pos_j = self._positions[i], self._positions[j]
+        start, end = self.indptr[pos_i], self.indptr[pos_i+1]
+
+        for k in range(start, end):
+            if self.indices[k] == pos_j:
+                return int(self.flags[k])
+
+        return None
+
+    def has_edge(self, i, j):
+        return self.edge_flags(i, j) is not None
+
+    def edges(self, flag=None):
+        """
+        Edges as tuples of nodes, optionally only those with a flag
+
+        Keyword Arguments:
+            flag (int | None): e.g. CompactGraph.active
+
+        Returns:
+            (list(tuple)):
+        """
+        rows = np.repeat(np.arange(self.n_nodes), self.degrees)
+        mask = rows < self.indices
+
+        if flag is not None:
+            mask &= (self.flags & flag) > 0
+
+        return [(self.nodes[i], self.nodes[j])
+                for i, j in zip(rows[mask].tolist(), self.indices[mask].tolist())]
+
+    def get_components(self, excluded_edge=None):
+        """
+        Connected components as lists of node positions, each in ascending
+        order, with the components ordered by their first position
+
+        Keyword Arguments:
+            excluded_edge (tuple | None): Edge (pair of nodes) to ignore
+
+        Returns:
+            (list(list(int))):
+        """
+        excluded = set()
+        if excluded_edge is not None:
+            i, j = (self._positions[node] for node in excluded_edge)
+            excluded = {(i, j), (j, i)}
+
+        adjacency = self.adjacency
+        component_idxs = [-1] * self.n_nodes
+        components = []
+
+        for root in range(self.n_nodes):
+            if component_idxs[root] != -1:
+                continue
+
+            component_idxs[root] = len(components)
+            component, stack = [root], [root]
+
+            while stack:
+                i = stack.pop()
+                for j in adjacency[i]:
+                    if component_idxs[j] == -1 and (i, j) not in excluded:
+                        component_idxs[j] = len(components)
+                        component.append(j)
+                        stack.append(j)
+
+            components.append(sorted(component))
+
+        return components
+
+    def to_networkx(self):
+        """
+        NX graph with the atom labels and stereo, pi and active flags. Built
+        once then cached, so should not be modified
+
+        Returns:
+            (nx.Graph):
+        """
+        if self._nx_graph is not None:
+            return self._nx_graph
+
+        graph = nx.Graph()
+        for i, node in enumerate(self.nodes):
+            graph.add_node(node, atom_label=self.labels[self.label_codes[i]],
+                           stereo=bool(self.node_flags[i] & self.stereo))
+
+        for i, j in self.edges():
+            flags = self.edge_flags(i, j)
+            graph.add_edge(i, j, pi=bool(flags & self.pi),
+                           active=bool(flags & self.active))
+
+        self._nx_graph = graph
+        return graph
+
+    def __init__(self, graph):
+        """
+        Molecular graph as arrays: the neighbours of each node in compressed
+        sparse row (CSR) form, integer codes for the atom labels and bit
+        flags for the stereo nodes and pi and active edges. Nodes are
+        indexed by their position in the NX graph
+
+        Arguments:
+            graph (nx.Graph):
+        """
+        self.nodes = list(graph.nodes)
+        self._positions = {node: i for i, node in enumerate(self.nodes)}
+
+        # Nodes without labels are matched as carbon atoms in is_isomorphic
+        atom_labels = [str(data.get('atom_label', 'C'))
+                       for _, data in graph.nodes(data=True)]
+        self.labels = sorted(set(atom_labels))
+        codes = {label: i for i, label in enumerate(self.labels)}
+        self.label_codes = np.array([codes[label] for label in atom_labels],
+                                    dtype=int)
+
+        self.node_flags = np.array([self.stereo if data.get('stereo', False)
+                                    else 0 for _, data in graph.nodes(data=True)],
+                                   dtype=np.uint8)
+
+        indices, flags = [], []
+        self.indptr = np.zeros(len(self.nodes) + 1, dtype=int)
+
+        for i, node in enumerate(self.nodes):
+            for n, data in graph.adj[node].items():
+                indices.append(self._positions[n])
+                flags.append((self.pi if data.get('pi', False) else 0)
+                             | (self.active if data.get('active', False) else 0))
+
+            self.indptr[i+1] = len(indices)
+
+        self.indices = np.array(indices, dtype=int)
+        self.flags = np.array(flags, dtype=np.uint8)
+
+        self._adjacency = None
+        self._nx_graph = None
+
+
+def get_compact_graph_key(graph):
+    """
+    Get a key of everything a CompactGraph holds for an NX graph: the nodes
+    and their labels and stereo flags, and the edges and their pi and active
+    flags. A compact graph with a different key is out of date
+
+    Arguments:
+        graph (nx.Graph):
+
+    Returns:
+        (tuple):
+    """
+    return (tuple(graph.nodes(data='atom_label')),
+            tuple(graph.nodes(data='stereo', default=False)),
+            tuple(graph.edges(data='pi', default=False)),
+            tuple(graph.edges(data='active', default=False)))
+
+
+def get_compact_graph(graph):
+    """
+    Get a compact graph from an NX graph, or the graph if it is already
+    compact
+
+    Arguments:
+        graph (nx.Graph | autode.mol_graphs.CompactGraph):
+
+    Returns:
+        (autode.mol_graphs.CompactGraph):
+    """
+    if isinstance(graph, CompactGraph):
+        return graph
+
+    return CompactGraph(graph)
 
 
 def reac_graph_to_prod_graph(reac_graph, bond_rearrang):
@@ -493,7 +1163,7 @@ def reac_graph_to_prod_graph(reac_graph, bond_rearrang):
         (nx.Graph): Graph of the product with each atom indexed as in the
                     reactants
     """
-    prod_graph = deepcopy(reac_graph)
+    prod_graph = reac_graph.copy()
 
     for fbond in bond_rearrang.fbonds:
         prod_graph.add_edge(*fbond)
@@ -521,21 +1191,24 @@ def split_mol_across_bond(graph, bond):
     into two graphs
 
     Arguments:
-        graph (nx.Graph): Molecular graph
+        graph (nx.Graph | autode.mol_graphs.CompactGraph): Molecular graph
         bond (tuple(int)): Bond to be split across e.g. (0, 1)
 
     Returns:
         (list(list(int))): List of atom indexes (as a list of integers)
     """
-    graph_copy = graph.copy()
+    graph = get_compact_graph(graph)
 
-    graph_copy.remove_edge(*bond)
-    split_subgraphs = get_separate_subgraphs(graph_copy)
+    if not graph.has_edge(*bond):
+        raise nx.NetworkXError(f'The edge {bond[0]}-{bond[1]} is not in the '
+                               f'graph')
 
-    if len(split_subgraphs) != 2:
+    components = graph.get_components(excluded_edge=bond)
+
+    if len(components) != 2:
         raise ex.CannotSplitAcrossBond
 
-    return [list(graph.nodes) for graph in split_subgraphs]
+    return [[graph.nodes[i] for i in component] for component in components]
 
 
 def get_bond_type_list(graph):
@@ -642,14 +1315,14 @@ def get_truncated_active_mol_graph(graph, active_bonds=None):
     atoms and their nearest neighbours
 
     Arguments:
-        graph (nx.Graph):
+        graph (nx.Graph | autode.mol_graphs.CompactGraph):
         active_bonds (list(tuple(int)):
     """
+    graph = get_compact_graph(graph)
 
     if active_bonds is None:
         # Molecular graph may already define the active edges
-        active_bonds = [pair for pair in graph.edges
-                        if graph.edges[pair]['active']]
+        active_bonds = graph.edges(flag=CompactGraph.active)
 
     if len(active_bonds) == 0:
         raise ValueError('Could not generate truncated active molecular '
@@ -662,21 +1335,18 @@ def get_truncated_active_mol_graph(graph, active_bonds=None):
 
         for idx in bond:
             if idx not in t_graph.nodes:
-
-                label = graph.nodes[idx]['atom_label']
-                t_graph.add_node(idx,  atom_label=label)
+                t_graph.add_node(idx, atom_label=graph.atom_label(idx))
 
         t_graph.add_edge(*bond, active=True, pi=False)
 
     # For every active atom add the nearest neighbours
-    for idx in deepcopy(t_graph.nodes):
-        neighbours = graph.neighbors(idx)
+    for idx in list(t_graph.nodes):
 
         # Add nodes and edges for all atoms and bonds to the neighbours that
         # don't already exist in the graph
-        for n_atom_index in neighbours:
+        for n_atom_index in graph.neighbours(idx):
             if n_atom_index not in t_graph.nodes:
-                label = graph.nodes[idx]['atom_label']
+                label = graph.atom_label(idx)
                 t_graph.add_node(n_atom_index, atom_label=label)
 
             if (idx, n_atom_index) not in t_graph.edges:
@@ -1,6 +1,7 @@
 import networkx as nx
 import numpy as np
 from autode.log import logger
+from autode.mol_graphs import get_graph_hash
 from autode.mol_graphs import is_isomorphic
 
 
@@ -36,6 +37,7 @@ def get_sum_energy_mep(saddle_point_r1r2, pes_2d):
 
     # Generate a grid graph (i.e. all nodes are corrected
     energy_graph = nx.grid_2d_graph(pes_2d.n_points_r1, pes_2d.n_points_r2)
+    product_hash = get_graph_hash(pes_2d.product_graph)
 
     min_energy = min([species.energy for species in pes_2d.species.flatten()])
 
@@ -49,7 +51,9 @@ def get_sum_energy_mep(saddle_point_r1r2, pes_2d):
 
             # Find the point where products are made
             if is_isomorphic(graph1=pes_2d.species[i, j].graph,
-                             graph2=pes_2d.product_graph):
+                             graph2=pes_2d.product_graph,
+                             graph1_hash=pes_2d.species[i, j].graph_hash,
+                             graph2_hash=product_hash):
 
                 # If products have not yet found, or they have and the energy
                 # are lower but are still isomorphic
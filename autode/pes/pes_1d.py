@@ -4,6 +4,7 @@ from autode.exceptions import FitFailed
 from autode.transition_states.ts_guess import get_ts_guess
 from autode.config import Config
 from autode.log import logger
+from autode.mol_graphs import get_graph_hash
 from autode.mol_graphs import is_isomorphic
 from autode.mol_graphs import make_graph
 from autode.plotting import plot_1dpes
@@ -43,10 +44,13 @@ class PES1d(PES):
     def products_made(self):
         logger.info('Checking that somewhere on the surface product(s) are made')
 
+        product_hash = get_graph_hash(self.product_graph)
+
         for i in range(self.n_points):
             make_graph(self.species[i])
 
-            if is_isomorphic(graph1=self.species[i].graph, graph2=self.product_graph):
+            if is_isomorphic(graph1=self.species[i].graph, graph2=self.product_graph,
+                             graph1_hash=self.species[i].graph_hash, graph2_hash=product_hash):
                 logger.info(f'Products made at point {i} in the 1D surface')
                 return True
 
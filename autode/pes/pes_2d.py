@@ -10,6 +10,7 @@ from autode.exceptions import AtomsNotFound
 from autode.log import logger
 from autode.methods import high_level_method_names
 from autode.pes.min_energy_pathway import get_sum_energy_mep
+from autode.mol_graphs import get_graph_hash
 from autode.mol_graphs import is_isomorphic
 from autode.mol_graphs import make_graph
 from autode.pes.pes import get_point_species
@@ -84,11 +85,14 @@ class PES2d(PES):
         isomorphic to the product"""
         logger.info('Checking product(s) are made somewhere on the surface')
 
+        product_hash = get_graph_hash(self.product_graph)
+
         for i in range(self.n_points_r1):
             for j in range(self.n_points_r2):
                 make_graph(self.species[i, j])
 
-                if is_isomorphic(graph1=self.species[i, j].graph, graph2=self.product_graph):
+                if is_isomorphic(graph1=self.species[i, j].graph, graph2=self.product_graph,
+                                 graph1_hash=self.species[i, j].graph_hash, graph2_hash=product_hash):
                     logger.info(f'Products made at ({i}, {j})')
                     return True
 
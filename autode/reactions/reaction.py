@@ -159,7 +159,8 @@ class Reaction:
                 logger.warning(f'{mol.name} current energy was None')
                 continue
 
-            if not are_coords_reasonable(mol.get_coordinates()):
+            if not are_coords_reasonable(mol.get_coordinates(),
+                                         dist_mat=mol.get_distance_matrix()):
                 logger.warning(f'{mol.name} coordinates not reasonable')
                 continue
 
@@ -65,7 +65,8 @@ def init_organic_smiles(molecule, smiles):
     molecule.set_atoms(atoms=get_atoms_from_rdkit_mol_object(molecule.rdkit_mol_obj, conf_id=0))
     make_graph(molecule, bond_list=bonds)
 
-    if not are_coords_reasonable(coords=molecule.get_coordinates()):
+    if not are_coords_reasonable(coords=molecule.get_coordinates(),
+                                 dist_mat=molecule.get_distance_matrix()):
         logger.warning('RDKit conformer was not reasonable')
         molecule.rdkit_conf_gen_is_fine = False
         molecule.set_atoms(atoms=get_simanl_atoms(molecule))
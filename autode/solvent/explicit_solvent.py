@@ -1,19 +1,32 @@
-from copy import deepcopy
 from math import ceil
 import numpy as np
+from scipy.spatial import cKDTree
+from autode.atoms import Atom
+from autode.geom import get_rot_mats
 from autode.log import logger
 
 
-def add_solvent_molecules(species, n_qm_solvent_mols, n_solvent_mols):
-    """Add a specific number of solvent molecules around a solute"""
+def add_solvent_molecules(species, n_qm_solvent_mols, n_solvent_mols,
+                          min_dist=1.5):
+    """
+    Add a specific number of solvent molecules around a solute, in shells of
+    increasing radius, retaining the n_solvent_mols closest to the solute of
+    which the closest n_qm_solvent_mols are QM solvent molecules
+
+    Arguments:
+        species (autode.species.Species): Solute with a solvent_mol
+        n_qm_solvent_mols (int):
+        n_solvent_mols (int):
+
+    Keyword Arguments:
+        min_dist (float): Minimum distance between a solvent atom and any
+                          atom in the solute or another solvent molecule (Å)
+    """
     # Initialise a new random seed and make a copy of the species' atoms. RandomState is thread safe
     rand = np.random.RandomState()
 
     logger.info(f'Adding solvent molecules around {species.name}')
 
-    solvent_n_atoms = species.solvent_mol.n_atoms
-    total_n_solvent_atoms = n_solvent_mols * solvent_n_atoms
-
     centre_species(species.solvent_mol)
     solvent_coords = species.solvent_mol.get_coordinates()
     solvent_size = np.linalg.norm(np.max(solvent_coords, axis=0) - np.min(solvent_coords, axis=0))
@@ -26,30 +39,32 @@ def add_solvent_molecules(species, n_qm_solvent_mols, n_solvent_mols):
 
     solvent_area = (0.9*solvent_size) ** 2 * np.pi
 
+    # Coordinates of all the solvent molecules that have been added
+    all_solvent_coords = np.zeros(shape=(0, species.solvent_mol.n_atoms, 3))
+
     i = 1
-    all_solvent_atoms = []
-    while len(all_solvent_atoms) <= total_n_solvent_atoms:
-        add_solvent_on_sphere(species, all_solvent_atoms, radius, solvent_area, i, rand)
+    while len(all_solvent_coords) < n_solvent_mols:
+        shell_coords = get_solvent_coords_on_sphere(solvent_coords, radius,
+                                                    solvent_area, i, rand)
+
+        shell_coords = get_non_clashing_solvent_coords(shell_coords,
+                                                       other_coords=np.concatenate((solute_coords,
+                                                                                    all_solvent_coords.reshape(-1, 3))),
+                                                       min_dist=min_dist)
+
+        all_solvent_coords = np.concatenate((all_solvent_coords, shell_coords))
         i += 1
 
-    # TODO make this nicer?
-    # Only take closest solvent molecules
-    distances = []
-    for i in range(int(len(all_solvent_atoms)/solvent_n_atoms)):
-        solvent_mol_atoms = all_solvent_atoms[i*solvent_n_atoms:(i+1)*solvent_n_atoms]
-        solvent_mol_coords = [atom.coord for atom in solvent_mol_atoms]
-        distances.append(np.linalg.norm(np.average(solvent_mol_coords, axis=0)))
-
-    species.qm_solvent_atoms = []
-    species.mm_solvent_atoms = []
-    sorted_distances = sorted(distances)
-    for i in range(n_solvent_mols):
-        original_index = distances.index(sorted_distances[i])
-        solvent_mol_atoms = all_solvent_atoms[original_index*solvent_n_atoms:(original_index+1)*solvent_n_atoms]
-        if i < n_qm_solvent_mols:
-            species.qm_solvent_atoms += solvent_mol_atoms
-        else:
-            species.mm_solvent_atoms += solvent_mol_atoms
+    # Only take the closest solvent molecules
+    distances = np.linalg.norm(np.average(all_solvent_coords, axis=1), axis=1)
+    closest_idxs = np.argsort(distances, kind='stable')[:n_solvent_mols]
+
+    labels = [atom.label for atom in species.solvent_mol.atoms]
+    solvent_atoms = [[Atom(label, *coord) for label, coord in zip(labels, all_solvent_coords[idx])]
+                     for idx in closest_idxs]
+
+    species.qm_solvent_atoms = [atom for atoms in solvent_atoms[:n_qm_solvent_mols] for atom in atoms]
+    species.mm_solvent_atoms = [atom for atoms in solvent_atoms[n_qm_solvent_mols:] for atom in atoms]
 
     return None
 
@@ -61,35 +76,109 @@ def centre_species(species):
     species.translate(-species_centre)
 
 
-def add_solvent_on_sphere(species, solvent_atoms, radius, solvent_mol_area, radius_mult, rand):
-    """Packs solvent molecules semi-evenly on a sphere around the solvent molecule"""
+def get_non_clashing_solvent_coords(solvent_coords, other_coords, min_dist):
+    """
+    Remove solvent molecules that have an atom closer than a minimum distance
+    to any of a set of other atoms, or to an atom in another solvent molecule
+    that is retained. Clashes are found with KD-trees
+
+    Arguments:
+        solvent_coords (np.ndarray): shape = (n_mols, n_atoms_per_mol, 3)
+        other_coords (np.ndarray): shape = (n, 3)
+        min_dist (float): Minimum distance (Å)
+
+    Returns:
+        (np.ndarray): Coordinates of the retained solvent molecules.
+                      shape = (n_retained_mols, n_atoms_per_mol, 3)
+    """
+    n_mols, n_atoms_per_mol, _ = solvent_coords.shape
+    flat_coords = solvent_coords.reshape(-1, 3)
+    mol_idxs = np.repeat(np.arange(n_mols), n_atoms_per_mol)
+
+    retained = np.ones(n_mols, dtype=bool)
+
+    # Solvent molecules that clash with the existing atoms
+    if len(other_coords) > 0:
+        dists, _ = cKDTree(other_coords).query(flat_coords, k=1)
+        retained[mol_idxs[dists < min_dist]] = False
+
+    # and with each other, removing the second of each clashing pair
+    for i, j in sorted(cKDTree(flat_coords).query_pairs(r=min_dist)):
+        mol_i, mol_j = sorted((mol_idxs[i], mol_idxs[j]))
+
+        if mol_i != mol_j and retained[mol_i]:
+            retained[mol_j] = False
+
+    return solvent_coords[retained]
+
+
+def get_solvent_coords_on_sphere(solvent_coords, radius, solvent_mol_area,
+                                 radius_mult, rand):
+    """
+    Pack solvent molecules semi-evenly on a sphere around the solute, each
+    with a random rotation
+
+    Arguments:
+        solvent_coords (np.ndarray): Coordinates of a solvent molecule
+                                     centred at the origin. shape = (n, 3)
+        radius (float): Radius of the solute (Å)
+        solvent_mol_area (float): Area occupied by a solvent molecule (Å^2)
+        radius_mult (int): Number of this shell
+        rand (np.random.RandomState):
+
+    Returns:
+        (np.ndarray): shape = (n_mols, n, 3)
+    """
+    positions = get_solvent_positions_on_sphere(radius, solvent_mol_area,
+                                                radius_mult, rand)
+
+    rot_mats = get_rot_mats(axes=rand.uniform(-1.0, 1.0, size=(len(positions), 3)),
+                            thetas=2 * np.pi * rand.rand(len(positions)))
+
+    return (np.matmul(solvent_coords[None, :, :], rot_mats.transpose(0, 2, 1))
+            + positions[:, None, :])
+
+
+def get_solvent_positions_on_sphere(radius, solvent_mol_area, radius_mult,
+                                    rand):
+    """
+    Get the positions of solvent molecules semi-evenly spaced on a sphere,
+    in rings of constant theta, with some random displacement
+
+    Arguments:
+        radius (float): Radius of the solute (Å)
+        solvent_mol_area (float): Area occupied by a solvent molecule (Å^2)
+        radius_mult (int): Number of this shell
+        rand (np.random.RandomState):
+
+    Returns:
+        (np.ndarray): shape = (n_mols, 3)
+    """
     rad_to_use = (radius * radius_mult * 0.8) + 0.4
     fit_on_sphere = ceil((4 * np.pi * rad_to_use**2) / solvent_mol_area)
     d = fit_on_sphere**(4/5)
     m_theta = ceil(d/np.pi)
-    total_circum = 0
-    for m in range(0, m_theta):
-        total_circum += 2 * np.pi * np.sin(np.pi * (m+0.5)/m_theta)
-    for m in range(0, m_theta):
-        theta = np.pi * (m+0.5)/m_theta
-        circum = 2 * np.pi * np.sin(theta)
-        n_on_ring = int(round(circum * fit_on_sphere / total_circum))
-        for n in range(0, n_on_ring):
-            if m % 2 == 0:
-                phi = (2 * np.pi * n/n_on_ring) + 0.7*np.pi*(rand.rand()-0.5)/(n_on_ring)
-            else:
-                phi = (2 * np.pi * (n+0.5)/n_on_ring) + 0.7*np.pi*(rand.rand()-0.5)/(n_on_ring)
-            # Add a little bit of randomness to the positioning
-            rand_theta = theta + 0.35*np.pi*(rand.rand()-0.5)/(m_theta-1)
-            rand_add = 0.4*radius * (rand.rand()-0.5)
-            x = (rad_to_use + rand_add) * np.sin(rand_theta) * np.cos(phi)
-            y = (rad_to_use + rand_add) * np.sin(rand_theta) * np.sin(phi)
-            z = (rad_to_use + rand_add) * np.cos(rand_theta)
-            position = [x, y, z]
-            species.solvent_mol.rotate(axis=rand.uniform(-1.0, 1.0, 3), theta=2*np.pi*rand.rand())
-            for atom in species.solvent_mol.atoms:
-                new_atom = deepcopy(atom)
-                new_atom.translate(position)
-                solvent_atoms.append(new_atom)
 
-    return None
+    thetas = np.pi * (np.arange(m_theta) + 0.5) / m_theta
+    circums = 2 * np.pi * np.sin(thetas)
+    n_on_rings = np.round(circums * fit_on_sphere / np.sum(circums)).astype(int)
+
+    positions = []
+    for m, (theta, n_on_ring) in enumerate(zip(thetas, n_on_rings)):
+        if n_on_ring == 0:
+            continue
+
+        # Every other ring is offset by half a spacing
+        ns = np.arange(n_on_ring) + (0.0 if m % 2 == 0 else 0.5)
+        phis = (2 * np.pi * ns / n_on_ring
+                + 0.7 * np.pi * (rand.rand(n_on_ring) - 0.5) / n_on_ring)
+
+        # Add a little bit of randomness to the positioning
+        rand_thetas = theta + 0.35 * np.pi * (rand.rand(n_on_ring) - 0.5) / max(m_theta - 1, 1)
+        rads = rad_to_use + 0.4 * radius * (rand.rand(n_on_ring) - 0.5)
+
+        positions.append(np.stack((rads * np.sin(rand_thetas) * np.cos(phis),
+                                   rads * np.sin(rand_thetas) * np.sin(phis),
+                                   rads * np.cos(rand_thetas)), axis=1))
+
+    return np.concatenate(positions) if len(positions) > 0 else np.zeros(shape=(0, 3))
@@ -2,17 +2,66 @@ from copy import deepcopy
 import numpy as np
 from itertools import product as iterprod
 from scipy.spatial import distance_matrix
+from autode.atoms import Atom
+from autode.atoms import get_vdw_radius
 from autode.log import logger
+from autode.geom import calc_rmsds
 from autode.geom import get_points_on_sphere
+from autode.geom import get_rot_mat_euler
 from autode.mol_graphs import union
 from autode.species.species import Species
 from autode.utils import requires_atoms
 from autode.config import Config
 from autode.methods import get_lmethod
 from autode.conformers.conformer import get_conformer
+from autode.conformers.conformers import run_conformer_calculations
+from autode.conformers.conformers import screen_conformers
 from autode.exceptions import MethodUnavailable
 
 
+def get_shift_to_avoid_overlap(coords, mol_coords, direction, min_dist=2.0,
+                               min_shift=0.1):
+    """
+    Get the smallest shift of a molecule along a direction such that none of
+    its atoms are within a minimum distance of any of a set of other atoms.
+    Atoms i and j overlap when shifted by s if |c_j - m_i - s d| < r, which
+    is satisfied for s in an interval given by the roots of a quadratic,
+    so the shift is the smallest s not in the union of these intervals
+
+    Arguments:
+        coords (np.ndarray): Coordinates of the fixed atoms. shape = (n, 3)
+        mol_coords (np.ndarray): Coordinates of the molecule. shape = (m, 3)
+        direction (np.ndarray): Unit vector to shift along. shape = (3,)
+
+    Keyword Arguments:
+        min_dist (float): Minimum distance between atoms (Å)
+        min_shift (float): Smallest shift to return (Å)
+
+    Returns:
+        (float): Shift (Å)
+    """
+    vecs = (mol_coords[None, :, :] - coords[:, None, :]).reshape(-1, 3)
+    vecs_dot_d = np.dot(vecs, direction)
+
+    discriminants = (np.square(vecs_dot_d) - np.sum(np.square(vecs), axis=1)
+                     + min_dist**2)
+    overlapping = discriminants > 0.0
+
+    roots = np.sqrt(discriminants[overlapping])
+    starts = -vecs_dot_d[overlapping] - roots
+    ends = -vecs_dot_d[overlapping] + roots
+
+    shift = min_shift
+    for idx in np.argsort(starts):
+        if starts[idx] >= shift:
+            break
+
+        shift = max(shift, ends[idx])
+
+    # Ensure atoms are further apart than the minimum distance
+    return shift + 1E-6
+
+
 def get_complex_conformer_atoms(molecules, rotations, points):
     """
     Generate a conformer of a complex given a set of molecules, rotations for
@@ -32,51 +81,34 @@ def get_complex_conformer_atoms(molecules, rotations, points):
     assert len(molecules) - 1 == len(rotations) == len(points) > 0
 
     # First molecule is static so start with those atoms
-    atoms = deepcopy(molecules[0].atoms)
+    coords = molecules[0].get_coordinates()
 
     # For each molecule add it to the current set of atoms with the centroid
     # ~ COM located at the origin
     for i, molecule in enumerate(molecules[1:]):
 
-        centroid = np.average(np.array([atom.coord for atom in atoms]), axis=0)
+        centroid = np.average(coords, axis=0)
 
         # Shift to the origin and rotate randomly, by the same amount
         theta, axis = np.random.uniform(-np.pi, np.pi), np.random.uniform(-1, 1, size=3)
-        for atom in atoms:
-            atom.translate(vec=-centroid)
-            atom.rotate(axis, theta)
-
-        coords = np.array([atom.coord for atom in atoms])
-
-        mol_centroid = np.average(molecule.get_coordinates(), axis=0)
-        shifted_mol_atoms = deepcopy(molecule.atoms)
+        coords = np.matmul(coords - centroid, get_rot_mat_euler(axis, theta).T)
 
         # Shift the molecule to the origin then rotate randomly
-        theta, axis = rotations[i][0], rotations[i][1:]
-        for atom in shifted_mol_atoms:
-            atom.translate(vec=-mol_centroid)
-            atom.rotate(axis, theta)
-
-        # Shift until the current molecules don't overlap with the current
-        #  atoms, i.e. aren't far enough apart
-        far_enough_apart = False
-
-        # Shift the molecule by 0.1 Å in the direction of the point
-        # (which has length 1) until the
-        # minimum distance to the rest of the complex is 2.0 Å
-        while not far_enough_apart:
+        mol_coords = molecule.get_coordinates()
+        mol_coords -= np.average(mol_coords, axis=0)
 
-            for atom in shifted_mol_atoms:
-                atom.coord += points[i] * 0.1
-
-            mol_coords = np.array([atom.coord for atom in shifted_mol_atoms])
+        theta, axis = rotations[i][0], rotations[i][1:]
+        mol_coords = np.matmul(mol_coords, get_rot_mat_euler(axis, theta).T)
 
-            if np.min(distance_matrix(coords, mol_coords)) > 2.0:
-                far_enough_apart = True
+        # Shift the molecule in the direction of the point (which has length
+        # 1) until the minimum distance to the rest of the complex is 2.0 Å
+        shift = get_shift_to_avoid_overlap(coords, mol_coords,
+                                           direction=points[i])
 
-        atoms += shifted_mol_atoms
+        coords = np.concatenate((coords, mol_coords + shift * points[i]))
 
-    return atoms
+    labels = [atom.label for molecule in molecules for atom in molecule.atoms]
+    return [Atom(label, *coord) for label, coord in zip(labels, coords)]
 
 
 class Complex(Species):
@@ -131,22 +163,62 @@ class Complex(Species):
         logger.info(f'Generated {n} conformers')
         return None
 
+    def _screen_conformers(self, max_n):
+        """
+        Retain at most max_n conformers with the lowest intermolecular
+        energies that are distinct, i.e. have an RMSD of at least
+        autode.Config.rmsd_threshold to all other retained conformers
+
+        Arguments:
+            max_n (int): Maximum number of conformers to retain
+        """
+        if len(self.conformers) <= max_n:
+            return None
+
+        energies = [self.calc_intermolecular_energy(conf.get_coordinates())
+                    for conf in self.conformers]
+        conformers = screen_conformers(self.conformers, energies,
+                                       tier='intermolecular energy')
+
+        retained, retained_coords = [], []
+        for conformer in conformers:
+            coords = conformer.get_coordinates()
+
+            if (len(retained) > 0 and np.min(calc_rmsds(coords, np.array(retained_coords)))
+                    < Config.rmsd_threshold):
+                continue
+
+            retained.append(conformer)
+            retained_coords.append(coords)
+
+            if len(retained) == max_n:
+                break
+
+        logger.info(f'Retained {len(retained)} distinct complex conformers')
+        self.conformers = retained
+        return None
+
     def populate_conformers(self):
         """
         Generate and optimise with a low level method a set of conformers, the
         number of which is
         Config.num_complex_sphere_points ×  Config.num_complex_random_rotations
-         ^ (n molecules in complex - 1)
+         ^ (n molecules in complex - 1), screened on intermolecular energy to
+        at most Config.max_num_opt_complex_conformers if it is set
         """
         n_confs = Config.num_complex_sphere_points * Config.num_complex_random_rotations * (len(self.molecules) - 1 )
         logger.info(f'Generating and optimising {n_confs} conformers of {self.name}')
 
         self._generate_conformers()
 
+        if Config.max_num_opt_complex_conformers is not None:
+            self._screen_conformers(max_n=Config.max_num_opt_complex_conformers)
+
         try:
             lmethod = get_lmethod()
+            self.conformers = run_conformer_calculations(self.conformers,
+                                                         method=lmethod)
             for conformer in self.conformers:
-                conformer.optimise(method=lmethod)
                 conformer.print_xyz_file()
 
         except MethodUnavailable:
@@ -168,9 +240,7 @@ class Complex(Species):
         """
         logger.info(f'Translating molecule {mol_index} by {vec} in {self.name}')
 
-        for atom_index in self.get_atom_indexes(mol_index):
-            self.atoms[atom_index].translate(vec)
-
+        self.translate(vec, idxs=self.get_atom_indexes(mol_index))
         return None
 
     @requires_atoms()
@@ -190,11 +260,8 @@ class Complex(Species):
         """
         logger.info(f'Rotating molecule {mol_index} by {theta:.4f} radians in {self.name}')
 
-        for atom_index in self.get_atom_indexes(mol_index):
-            self.atoms[atom_index].translate(vec=-origin)
-            self.atoms[atom_index].rotate(axis, theta)
-            self.atoms[atom_index].translate(vec=origin)
-
+        self.rotate(axis, theta, origin=origin,
+                    idxs=self.get_atom_indexes(mol_index))
         return None
 
     @requires_atoms()
@@ -202,18 +269,56 @@ class Complex(Species):
         """Calculate the repulsion between a molecule and the rest of the
         complex"""
 
-        coordinates = self.get_coordinates()
-
         mol_indexes = self.get_atom_indexes(mol_index)
-        mol_coords = [coordinates[i] for i in mol_indexes]
-        other_coords = [coordinates[i] for i in range(self.n_atoms) if i not in mol_indexes]
+        is_other = np.ones(self.n_atoms, dtype=bool)
+        is_other[mol_indexes] = False
+
+        # Use the cached distance matrix if it is current, otherwise only the
+        # block between this molecule and the rest of the complex is needed
+        if self._dist_mat_version == self.geometry_version:
+            distance_mat = self._dist_mat[mol_indexes, :self.n_atoms][:, is_other]
+
+        else:
+            coordinates = self.get_coordinates()[:self.n_atoms]
+            distance_mat = distance_matrix(coordinates[mol_indexes],
+                                           coordinates[is_other])
 
         # Repulsion is the sum over all pairs 1/r^4
-        distance_mat = distance_matrix(mol_coords, other_coords)
         repulsion = 0.5 * np.sum(np.power(distance_mat, -4))
 
         return repulsion
 
+    def calc_intermolecular_energy(self, coords=None):
+        """
+        Calculate a cheap intermolecular energy, summed over all pairs of atoms
+        in different molecules, with a 12-6 potential with the minimum at the
+        sum of the van der Waals radii (r0)
+
+        E = Σ_ij (r0/r)^12 - 2(r0/r)^6
+
+        Keyword Arguments:
+            coords (np.ndarray): Coordinates, if None then use the current
+                                 ones. shape = (n_atoms, 3)
+
+        Returns:
+            (float): Energy (arbitrary units)
+        """
+        if coords is None:
+            dist_mat = self.get_distance_matrix()
+        else:
+            dist_mat = distance_matrix(coords, coords)
+
+        mol_idxs = np.array([i for i, mol in enumerate(self.molecules)
+                             for _ in range(mol.n_atoms)])
+        radii = np.array([get_vdw_radius(atom.label) for atom in self.atoms])
+
+        # Only include each pair of atoms in different molecules once
+        pairs = np.triu(mol_idxs[:, None] != mol_idxs[None, :])
+        r0_r = (np.add.outer(radii, radii)[pairs]
+                / dist_mat[pairs])
+
+        return float(np.sum(np.power(r0_r, 12) - 2.0 * np.power(r0_r, 6)))
+
     def __init__(self, *args, name='complex'):
         """
         Molecular complex e.g. VdW complex of one or more Molecules
@@ -1,12 +1,13 @@
-from multiprocessing import Pool
-from rdkit.Chem import AllChem
 from autode.input_output import xyz_file_to_atoms
 from autode.conformers.conformer import Conformer
-from autode.conformers.conf_gen import get_simanl_atoms
+from autode.conformers.conf_gen import generate_simanl_atoms
 from autode.conformers.conformers import conf_is_unique_rmsd
-from autode.conformers.conformers import get_atoms_from_rdkit_mol_object
+from autode.conformers.conformers import conformers_are_saturated
+from autode.conformers.conformers import generate_rdkit_conformer_atoms
+from autode.conformers.torsions import generate_torsion_atoms
 from autode.atoms import metals
 from autode.config import Config
+from autode.geom import are_coords_reasonable
 from autode.log import logger
 from autode.mol_graphs import make_graph
 from autode.smiles.smiles import init_organic_smiles
@@ -47,8 +48,11 @@ class Molecule(Species):
     @requires_atoms()
     def _generate_conformers(self, n_confs=None):
         """
-        Use a simulated annealing approach to generate conformers for this
-        molecule.
+        Use RDKit, a simulated annealing approach or, if
+        autode.Config.torsion_conformers, a systematic rotation about the
+        rotatable bonds to generate conformers for this molecule. Generation
+        stops early if the rate of new unique conformers
+        drops below autode.Config.min_unique_conformer_rate
 
         Keyword Arguments:
             n_confs (int): Number of conformers requested if None default to
@@ -57,39 +61,44 @@ class Molecule(Species):
 
         n_confs = n_confs if n_confs is not None else Config.num_conformers
         self.conformers = []
+        archived = False
 
-        if self.smiles is not None and self.rdkit_conf_gen_is_fine:
-            logger.info(f'Using RDKit to gen conformers. {n_confs} requested')
-
-            method = AllChem.ETKDGv2()
-            method.pruneRmsThresh = Config.rmsd_threshold
-            method.numThreads = Config.n_cores
+        if (Config.torsion_conformers and self.graph is not None
+                and are_coords_reasonable(self.get_coordinates(),
+                                          dist_mat=self.get_distance_matrix())):
+            logger.info('Rotating about bonds to generate conformers')
+            conf_atoms_generator = generate_torsion_atoms(self, n_confs=n_confs)
 
-            logger.info('Running conformation generation with RDKit... running')
-            conf_ids = list(AllChem.EmbedMultipleConfs(self.rdkit_mol_obj,
-                                                       numConfs=n_confs,
-                                                       params=method))
-            logger.info('                                          ... done')
-
-            conf_atoms_list = [get_atoms_from_rdkit_mol_object(self.rdkit_mol_obj, conf_id) for conf_id in conf_ids]
+        elif self.smiles is not None and self.rdkit_conf_gen_is_fine:
+            logger.info(f'Using RDKit to gen conformers. {n_confs} requested')
+            conf_atoms_generator = generate_rdkit_conformer_atoms(self.rdkit_mol_obj,
+                                                                  n_confs=n_confs)
 
         else:
             logger.info('Using simulated annealing to generate conformers')
-            with Pool(processes=Config.n_cores) as pool:
-                results = [pool.apply_async(get_simanl_atoms, (self, None, i)) for i in range(n_confs)]
-                conf_atoms_list = [res.get(timeout=None) for res in results]
+            conf_atoms_generator = generate_simanl_atoms(self, n_confs=n_confs)
+            archived = True
 
-        for i, atoms in enumerate(conf_atoms_list):
+        is_unique = []
+        for i, atoms in enumerate(conf_atoms_generator):
             conf = Conformer(name=f'{self.name}_conf{i}',
                              charge=self.charge,
                              mult=self.mult,
-                             atoms=atoms)
+                             atoms=atoms,
+                             conf_n=i if archived else None)
 
             # If the conformer is unique on an RMSD threshold
-            if conf_is_unique_rmsd(conf, self.conformers):
+            is_unique.append(conf_is_unique_rmsd(conf, self.conformers))
+
+            if is_unique[-1]:
                 conf.solvent = self.solvent
                 self.conformers.append(conf)
 
+            if conformers_are_saturated(is_unique):
+                break
+
+        conf_atoms_generator.close()
+
         logger.info(f'Generated {len(self.conformers)} unique conformer(s)')
         return None
 
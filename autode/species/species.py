@@ -1,11 +1,21 @@
-import numpy as np
 from copy import deepcopy
+from scipy.spatial import distance_matrix
+from scipy.spatial.distance import squareform
+from autode.conformers.archive import save_conformer_energies
+from autode.conformers.conformers import get_ff_energies
 from autode.conformers.conformers import get_unique_confs
+from autode.conformers.conformers import run_conformer_calculations
+from autode.conformers.conformers import screen_conformers
 from autode.solvent.solvents import ExplicitSolvent
 from autode.solvent.solvents import get_solvent
+from autode.atoms import Atoms
 from autode.calculation import Calculation
 from autode.config import Config
 from autode.input_output import atoms_to_xyz_file
+from autode.mol_graphs import CompactGraph
+from autode.mol_graphs import get_compact_graph_key
+from autode.mol_graphs import get_graph_fingerprint
+from autode.mol_graphs import get_graph_hash
 from autode.mol_graphs import is_isomorphic
 from autode.geom import length
 from autode.log import logger
@@ -97,21 +107,101 @@ class Species:
     def is_explicitly_solvated(self):
         return isinstance(self.solvent, ExplicitSolvent)
 
+    @property
+    def atoms(self):
+        """Atoms of this species (autode.atoms.Atoms), or None"""
+        return self._atoms
+
+    @atoms.setter
+    def atoms(self, value):
+        if value is None or isinstance(value, Atoms):
+            self._atoms = value
+
+        else:
+            self._atoms = Atoms(value)
+
+    @property
+    def graph(self):
+        """Molecular graph (nx.Graph) with atoms and bonds, or None"""
+        return self._graph
+
+    @graph.setter
+    def graph(self, value):
+        self._graph = value
+        self._graph_hash = None
+        self._compact_graph = None
+
+    @property
+    def graph_hash(self):
+        """
+        Hash of the molecular graph including the atom labels and active
+        bonds (see autode.mol_graphs.get_graph_hash), computed once until the
+        graph is set again or any of its nodes, edges, atom labels or active
+        flags change
+
+        Returns:
+            (str | None): Hash, or None if there is no graph
+        """
+        if self.graph is None:
+            return None
+
+        fingerprint = get_graph_fingerprint(self.graph)
+
+        if self._graph_hash is None or self._graph_hash[0] != fingerprint:
+            self._graph_hash = (fingerprint, get_graph_hash(self.graph))
+
+        return self._graph_hash[1]
+
+    @property
+    def compact_graph(self):
+        """
+        Molecular graph as arrays (see autode.mol_graphs.CompactGraph), built
+        once until the graph is set again or any of its nodes, edges, atom
+        labels or flags change
+
+        Returns:
+            (autode.mol_graphs.CompactGraph | None): Graph, or None if there
+                                                     is no graph
+        """
+        if self.graph is None:
+            return None
+
+        key = get_compact_graph_key(self.graph)
+
+        if self._compact_graph is None or self._compact_graph[0] != key:
+            self._compact_graph = (key, CompactGraph(self.graph))
+
+        return self._compact_graph[1]
+
     @requires_atoms()
-    def translate(self, vec):
-        """Translate the molecule by vector (np.ndarray, length 3)"""
-        for atom in self.atoms:
-            atom.translate(vec)
+    def translate(self, vec, idxs=None):
+        """Translate the molecule, or only the atoms with indexes idxs, by
+        vector (np.ndarray, length 3)"""
+        self.atoms.translate(vec, idxs=idxs)
+        return None
 
+    @requires_atoms()
+    def rotate(self, axis, theta, origin=None, idxs=None):
+        """Rotate the molecule, or only the atoms with indexes idxs, by
+        around an axis (np.ndarray, length 3) an theta radians"""
+        self.atoms.rotate(axis, theta, origin=origin, idxs=idxs)
         return None
 
     @requires_atoms()
-    def rotate(self, axis, theta, origin=None):
-        """Rotate the molecule by around an axis (np.ndarray, length 3) an
-        theta radians"""
-        for atom in self.atoms:
-            atom.rotate(axis, theta, origin=origin)
+    def apply_transform(self, rot_matrix=None, vec=None, origin=None,
+                        idxs=None):
+        """
+        Rotate then translate the molecule, or only the atoms with indexes
+        idxs, in a single operation. See autode.atoms.Atoms.apply_transform
 
+        Keyword Arguments:
+            rot_matrix (np.ndarray | None): Rotation matrix. shape = (3, 3)
+            vec (np.ndarray | None): Translation vector. shape = (3,)
+            origin (np.ndarray | None): Origin of the rotation. shape = (3,)
+            idxs (list(int) | None): Indexes of the atoms to transform
+        """
+        self.atoms.apply_transform(rot_matrix, vec=vec, origin=origin,
+                                   idxs=idxs)
         return None
 
     @requires_atoms()
@@ -127,7 +217,7 @@ class Species:
     def get_coordinates(self):
         """Return a np.ndarray of size n_atoms x 3 containing the xyz
         coordinates of the molecule"""
-        return np.array([atom.coord for atom in self.atoms])
+        return self.atoms.coordinates
 
     @requires_atoms()
     def optimise(self, method=None, reset_graph=False, calc=None):
@@ -212,9 +302,54 @@ class Species:
 
         return None
 
+    @property
+    def geometry_version(self):
+        """Version of the geometry (int), which changes whenever the atoms
+        or any of their coordinates change. None if there are no atoms"""
+        return None if self.atoms is None else self.atoms.version
+
+    @requires_atoms()
+    def get_distance_matrix(self):
+        """
+        Get the distances between all pairs of atoms, computed only once for
+        each geometry. The matrix is read-only as it is shared by all callers
+
+        Returns:
+            (np.ndarray): shape = (n_atoms, n_atoms)
+        """
+        if self._dist_mat_version != self.geometry_version:
+            coords = self.get_coordinates()
+
+            self._dist_mat = distance_matrix(coords, coords)
+            self._dist_mat.setflags(write=False)
+            self._condensed_dist_mat = None
+            self._dist_mat_version = self.geometry_version
+
+        return self._dist_mat
+
+    @requires_atoms()
+    def get_condensed_distance_matrix(self):
+        """
+        Get the condensed distance matrix, as scipy.spatial.distance.pdist,
+        computed only once for each geometry
+
+        Returns:
+            (np.ndarray): shape = (n_atoms(n_atoms-1)/2,)
+        """
+        dist_mat = self.get_distance_matrix()
+
+        if self._condensed_dist_mat is None:
+            self._condensed_dist_mat = squareform(dist_mat, checks=False)
+            self._condensed_dist_mat.setflags(write=False)
+
+        return self._condensed_dist_mat
+
     @requires_atoms()
     def get_distance(self, atom_i, atom_j):
         """Get the distance between two atoms in the species"""
+        if self._dist_mat_version == self.geometry_version:
+            return float(self._dist_mat[atom_i, atom_j])
+
         return length(self.atoms[atom_i].coord - self.atoms[atom_j].coord)
 
     @work_in('conformers')
@@ -240,17 +375,51 @@ class Species:
 
         self._generate_conformers()
 
-        # For all generated conformers optimise with the low level of theory
-        for conformer in self.conformers:
-            conformer.optimise(lmethod)
+        # Screen the conformers with increasingly expensive methods, first
+        # with the force field used to generate them
+        if Config.max_num_ff_conformers is not None and self.graph is not None:
+            self.conformers = screen_conformers(self.conformers,
+                                                energies=get_ff_energies(self, self.conformers),
+                                                max_n=Config.max_num_ff_conformers,
+                                                tier='force field')
+
+        # then with low level single point energies
+        if (Config.max_num_lsp_conformers is not None
+                or Config.lsp_conformer_window is not None):
+            self.conformers = run_conformer_calculations(self.conformers,
+                                                         method=lmethod,
+                                                         calc_type='sp')
+
+            self.conformers = screen_conformers(self.conformers,
+                                                energies=[conf.energy for conf in self.conformers],
+                                                max_n=Config.max_num_lsp_conformers,
+                                                window_kj=Config.lsp_conformer_window,
+                                                tier='low level single point')
+
+        # For all remaining conformers optimise with the low level of theory
+        self.conformers = run_conformer_calculations(self.conformers,
+                                                     method=lmethod)
+
+        # Save the low level energies in the conformer archive
+        save_conformer_energies(self, self.conformers)
 
         # Strip conformers that are similar based on an energy criteria or
         # don't have an energy
         self.conformers = get_unique_confs(conformers=self.conformers)
 
         if hmethod is not None:
-            # Re-optimise all the conformers with the higher level of theory
-            # to get more accurate energies
+
+            if (Config.max_num_hmethod_conformers is not None
+                    or Config.hmethod_conformer_window is not None):
+                self.conformers = screen_conformers(self.conformers,
+                                                    energies=[conf.energy for conf in self.conformers],
+                                                    max_n=Config.max_num_hmethod_conformers,
+                                                    window_kj=Config.hmethod_conformer_window,
+                                                    tier='low level optimisation')
+
+            # Re-optimise the retained conformers with the higher level of
+            # theory to get more accurate energies. These are run in series
+            # so each calculation can use all the cores
             for conformer in self.conformers:
                 conformer.optimise(hmethod)
 
@@ -273,11 +442,18 @@ class Species:
 
         assert coords.shape == (self.n_atoms, 3)
 
-        for i, coord in enumerate(coords):
-            self.atoms[i].coord = coord
-
+        self.atoms.coordinates = coords
         return None
 
+    def __getstate__(self):
+        """Geometry versions are only unique within a process, so the cached
+        distance matrices are not pickled"""
+        state = self.__dict__.copy()
+        state.update(_dist_mat=None, _condensed_dist_mat=None,
+                     _dist_mat_version=None)
+
+        return state
+
     def __init__(self, name, atoms, charge, mult, solvent_name=None):
         """
         A molecular species. A collection of atoms with a charge and spin
@@ -309,4 +485,9 @@ class Species:
 
         self.graph = None       # NetworkX.Graph object with atoms and bonds
 
+        # Distance matrices cached for a version of the geometry
+        self._dist_mat = None
+        self._condensed_dist_mat = None
+        self._dist_mat_version = None
+
         self.conformers = None  # List autode.conformers.conformers.Conformer
@@ -1,8 +1,8 @@
-from copy import deepcopy
 import numpy as np
 from autode.atoms import DummyAtom
 from autode.mol_graphs import connected_components
 from autode.bond_lengths import get_avg_bond_length
+from autode.geom import get_rot_mat_euler
 from autode.geom import length
 from autode.log import logger
 
@@ -140,7 +140,7 @@ def add_dummy_atom(reactant, bond_rearrangement):
     fbond = bond_rearrangement.fbonds[0]
     bbond = bond_rearrangement.bbonds[0]
 
-    components = connected_components(reactant.graph)
+    components = connected_components(reactant.compact_graph)
 
     if len(components) != 2:
         raise NotImplementedError('Must have two components for dummy add')
@@ -255,13 +255,17 @@ def get_cost_rotate_translate(x, reactant, subst_centres, attacking_mol_idx):
         (float):
     """
 
-    moved_reactant = deepcopy(reactant)
-    moved_reactant.rotate_mol(axis=x[:3], theta=x[3],
-                              mol_index=attacking_mol_idx)
+    # Rotation, translation then rotation of the attacking molecule as a
+    # single transform, applied in place and reverted once the cost is known
+    rot_matrix_1 = get_rot_mat_euler(axis=x[:3], theta=x[3])
+    rot_matrix_2 = get_rot_mat_euler(axis=x[7:10], theta=x[10])
 
-    moved_reactant.translate_mol(vec=x[4:7], mol_index=attacking_mol_idx)
-
-    moved_reactant.rotate_mol(axis=x[7:10], theta=x[10],
-                              mol_index=attacking_mol_idx)
-
-    return attack_cost(moved_reactant, subst_centres, attacking_mol_idx)
+    coords = reactant.get_coordinates()
+    reactant.apply_transform(rot_matrix=np.matmul(rot_matrix_2, rot_matrix_1),
+                             vec=np.matmul(rot_matrix_2, x[4:7]),
+                             idxs=reactant.get_atom_indexes(attacking_mol_idx))
+    try:
+        return attack_cost(reactant, subst_centres, attacking_mol_idx)
+
+    finally:
+        reactant.atoms.coordinates = coords
@@ -1,5 +1,5 @@
 from copy import deepcopy
-from multiprocessing import Pool
+import numpy as np
 from autode.transition_states.base import get_displaced_atoms_along_mode
 from autode.transition_states.base import TSbase
 from autode.transition_states.templates import TStemplate
@@ -7,7 +7,8 @@ from autode.calculation import Calculation
 from autode.config import Config
 from autode.exceptions import AtomsNotFound, NoNormalModesFound
 from autode.geom import get_distance_constraints
-from autode.geom import calc_heavy_atom_rmsd
+from autode.geom import calc_rmsds
+from autode.geom import get_heavy_atom_coords
 from autode.log import logger
 from autode.methods import get_hmethod
 from autode.mol_graphs import set_active_mol_graph
@@ -89,31 +90,36 @@ class TransitionState(TSbase):
     def _generate_conformers(self, n_confs=None):
         """Generate conformers at the TS """
         from autode.conformers.conformer import Conformer
-        from autode.conformers.conf_gen import get_simanl_atoms
+        from autode.conformers.conf_gen import generate_simanl_atoms
         from autode.conformers.conformers import conf_is_unique_rmsd
+        from autode.conformers.conformers import conformers_are_saturated
 
         n_confs = Config.num_conformers if n_confs is None else n_confs
         self.conformers = []
 
         distance_consts = get_distance_constraints(self)
+        conf_atoms_generator = generate_simanl_atoms(self, distance_consts,
+                                                     n_confs=n_confs)
 
-        with Pool(processes=Config.n_cores) as pool:
-            results = [pool.apply_async(get_simanl_atoms, (self, distance_consts, i))
-                       for i in range(n_confs)]
-
-            conf_atoms_list = [res.get(timeout=None) for res in results]
-
-        for i, atoms in enumerate(conf_atoms_list):
+        is_unique = []
+        for i, atoms in enumerate(conf_atoms_generator):
             conf = Conformer(name=f'{self.name}_conf{i}', charge=self.charge,
                              mult=self.mult, atoms=atoms,
-                             dist_consts=distance_consts)
+                             dist_consts=distance_consts, conf_n=i)
 
             # If the conformer is unique on an RMSD threshold
-            if conf_is_unique_rmsd(conf, self.conformers):
+            is_unique.append(conf_is_unique_rmsd(conf, self.conformers))
+
+            if is_unique[-1]:
                 conf.solvent = self.solvent
                 conf.graph = deepcopy(self.graph)
                 self.conformers.append(conf)
 
+            if conformers_are_saturated(is_unique):
+                break
+
+        conf_atoms_generator.close()
+
         logger.info(f'Generated {len(self.conformers)} conformer(s)')
         return None
 
@@ -183,8 +189,12 @@ class TransitionState(TSbase):
         # Remove similar TS conformer that are similar to this TS based on root
         # mean squared differences in their structures
         thresh = Config.rmsd_threshold if rmsd_threshold is None else rmsd_threshold
-        self.conformers = [conf for conf in self.conformers if
-                           calc_heavy_atom_rmsd(conf.atoms, atoms) > thresh]
+        if len(self.conformers) > 0:
+            rmsds = calc_rmsds(get_heavy_atom_coords(atoms),
+                               np.array([get_heavy_atom_coords(conf.atoms)
+                                         for conf in self.conformers]))
+            self.conformers = [conf for conf, rmsd in zip(self.conformers, rmsds)
+                               if rmsd > thresh]
 
         logger.info(f'Generated {len(self.conformers)} unique (RMSD > '
                     f'{thresh} Å) TS conformer(s)')
@@ -1,6 +1,9 @@
 from autode import atoms
 from autode.atoms import Atom
+from autode.species.molecule import Molecule
+from copy import deepcopy
 import numpy as np
+import pickle
 
 
 def test_atoms():
@@ -41,3 +44,103 @@ def test_atom():
 
     # Ensure that the atoms has a string representation
     assert len(str(h)) > 0
+
+
+def test_atoms_container():
+
+    h2o = atoms.Atoms([Atom('O'), Atom('H', 0.96), Atom('H', -0.24, 0.93)])
+    assert len(h2o) == 3
+    assert h2o.labels == ['O', 'H', 'H']
+    assert h2o.coordinates.shape == (3, 3)
+
+    # Atom coordinates are views into the coordinate array
+    h2o[1].translate(vec=np.array([1.0, 0.0, 0.0]))
+    assert np.isclose(h2o.coordinates[1, 0], 1.96)
+
+    h2o.translate(vec=np.array([0.0, 0.0, 1.0]))
+    assert np.isclose(h2o[2].coord[2], 1.0)
+
+    # Coordinates are a copy
+    coords = h2o.coordinates
+    coords += 1.0
+    assert np.isclose(h2o[0].coord[0], 0.0)
+
+    # Rotations are the same as for each atom
+    axis, theta = np.array([1.0, 1.0, 0.0]), 0.7
+    atom = Atom('H', -0.24, 0.93, 1.0)
+    atom.rotate(axis, theta, origin=np.ones(3))
+    h2o.rotate(axis, theta, origin=np.ones(3))
+    assert np.allclose(h2o[2].coord, atom.coord)
+
+    # Copies are independent
+    h2o_copy = deepcopy(h2o)
+    h2o_copy.translate(vec=np.ones(3))
+    assert np.allclose(h2o_copy.coordinates - 1.0, h2o.coordinates)
+    assert h2o_copy[0] is not h2o[0]
+
+    # as are atoms added to a different container
+    other = atoms.Atoms(h2o[:2])
+    other[0].translate(vec=np.ones(3))
+    assert not np.allclose(other[0].coord, h2o[0].coord)
+
+    # Adding atoms keeps the coordinates as views
+    h2o.append(Atom('C', 5.0))
+    h2o += [Atom('N', 6.0)]
+    assert len(h2o) == 5 and h2o.coordinates.shape == (5, 3)
+    h2o.translate(vec=np.array([1.0, 0.0, 0.0]))
+    assert np.isclose(h2o[3].coord[0], 6.0)
+    assert np.isclose(h2o[4].coord[0], 7.0)
+
+    del h2o[0]
+    assert h2o.labels == ['H', 'H', 'C', 'N']
+
+    replaced_atom, replaced_coord = h2o[0], h2o[0].coord.copy()
+    h2o[0] = Atom('F')
+    assert h2o.labels[0] == 'F'
+    assert np.allclose(h2o.coordinates[0], np.zeros(3))
+
+    # The replaced atom keeps its own coordinate
+    assert np.allclose(replaced_atom.coord, replaced_coord)
+
+    # and pickling
+    h2o_copy = pickle.loads(pickle.dumps(h2o))
+    h2o_copy.translate(vec=np.ones(3))
+    assert np.allclose(h2o_copy[0].coord, np.ones(3))
+
+
+def test_species_atoms():
+
+    mol = Molecule(name='h2', atoms=[Atom('H'), Atom('H', 0.7)])
+    assert isinstance(mol.atoms, atoms.Atoms)
+
+    mol.set_coordinates(np.array([[0.0, 0.0, 0.0], [0.0, 0.0, 0.8]]))
+    assert np.isclose(mol.get_distance(0, 1), 0.8)
+
+    mol.translate(vec=np.ones(3))
+    assert np.allclose(mol.atoms[0].coord, np.ones(3))
+
+
+def test_atoms_transforms():
+
+    h3 = atoms.Atoms([Atom('H'), Atom('H', 1.0), Atom('H', 1.0, 1.0)])
+    atom_list = [Atom('H'), Atom('H', 1.0), Atom('H', 1.0, 1.0)]
+
+    # Rotating a subset is the same as rotating each atom
+    axis, origin = np.array([0.3, 1.0, 0.1]), np.array([1.0, 0.0, 0.0])
+    h3.rotate(axis=axis, theta=1.2, origin=h3[1].coord, idxs=[0, 2])
+    for atom in (atom_list[0], atom_list[2]):
+        atom.rotate(axis=axis, theta=1.2, origin=origin)
+
+    assert np.allclose(h3.coordinates,
+                       np.array([atom.coord for atom in atom_list]))
+
+    h3.translate(vec=np.ones(3), idxs=[1])
+    assert np.allclose(h3[1].coord, [2.0, 1.0, 1.0])
+
+    # A rotation by π about z then a translation
+    mol = Molecule(name='h3', atoms=[Atom('H'), Atom('H', 1.0), Atom('H', 1.0, 1.0)])
+    mol.apply_transform(rot_matrix=np.diag([-1.0, -1.0, 1.0]),
+                        vec=np.array([0.0, 0.0, 1.0]), idxs=[1, 2])
+
+    assert np.allclose(mol.get_coordinates(),
+                       [[0.0, 0.0, 0.0], [-1.0, 0.0, 1.0], [-1.0, -1.0, 1.0]])
@@ -3,6 +3,7 @@ from autode.species.molecule import Molecule
 from autode.bond_rearrangement import BondRearrangement
 from autode.species.complex import ReactantComplex, ProductComplex
 from autode.atoms import Atom
+from autode import mol_graphs
 from autode.mol_graphs import is_isomorphic
 from autode.mol_graphs import make_graph
 import networkx as nx
@@ -52,6 +53,28 @@ def test_bondrearr_obj():
     assert active_atom_nl == [['H'], ['H'], ['H']]
 
 
+def test_strip_equiv_bond_rearrs():
+    # H + CH4 with the H atoms of methane in arbitrary positions
+    reac = ReactantComplex(Molecule(name='h_dot', smiles='[H]'),
+                           Molecule(name='methane', smiles='C'))
+    assert reac.atoms[1].label == 'C'
+
+    # Abstracting any of the H atoms of methane is equivalent
+    h_abstractions = [br.BondRearrangement(forming_bonds=[(0, i)],
+                                           breaking_bonds=[(1, i)])
+                      for i in range(2, 6)]
+    # but not forming a bond to C while breaking a C-H bond
+    c_addition = br.BondRearrangement(forming_bonds=[(0, 1)],
+                                      breaking_bonds=[(1, 2)])
+
+    atom_signatures = mol_graphs.get_atom_signatures(reac.graph)
+    assert len(set(atom_signatures[i] for i in range(2, 6))) == 1
+    assert atom_signatures[0] != atom_signatures[2]
+
+    stripped = br.strip_equiv_bond_rearrs(reac, h_abstractions + [c_addition])
+    assert stripped == [h_abstractions[0], c_addition]
+
+
 def test_get_bond_rearrangs():
 
     if os.path.exists('test_bond_rearrangs.txt'):
@@ -115,6 +138,31 @@ def test_add_bond_rearrang():
     assert br.add_bond_rearrangment([], reac, prod, [], [(0, 1)]) == [br.BondRearrangement(breaking_bonds=[(0, 1)])]
 
 
+def test_could_make_product():
+    # H2 + F -> H + HF
+    reac = Molecule(atoms=[Atom('H', 0, 0, 0), Atom('H', 0.7, 0, 0),
+                           Atom('F', 3.0, 0, 0)])
+    prod = Molecule(atoms=[Atom('H', -3.0, 0, 0), Atom('H', 0.7, 0, 0),
+                           Atom('F', 1.6, 0, 0)])
+
+    reac_envs = br.get_atom_environments(reac.graph)
+    env_changes = br.get_atom_environment_changes(reac.graph, prod.graph)
+    assert env_changes == {('H', ('H',)): -2, ('H', ()): 1, ('H', ('F',)): 1,
+                           ('F', ()): -1, ('F', ('H',)): 1}
+
+    assert br.could_make_product(reac.graph, reac_envs, env_changes,
+                                 fbonds=[(1, 2)], bbonds=[(0, 1)])
+
+    # Breaking the H-H bond alone cannot make HF
+    assert not br.could_make_product(reac.graph, reac_envs, env_changes,
+                                     fbonds=[], bbonds=[(0, 1)])
+
+    assert br.add_bond_rearrangements([], reac, prod,
+                                      candidates=[([], [(0, 1)]),
+                                                  ([(1, 2)], [(0, 1)])]) == [
+        br.BondRearrangement(forming_bonds=[(1, 2)], breaking_bonds=[(0, 1)])]
+
+
 def test_generate_rearranged_graph():
     init_graph = nx.Graph()
     final_graph = nx.Graph()
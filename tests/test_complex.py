@@ -1,8 +1,12 @@
+from autode.species.complex import get_complex_conformer_atoms
+from autode.species.complex import get_shift_to_avoid_overlap
 from autode.species.complex import Complex
 from autode.config import Config
 from autode.species.molecule import Molecule
 from autode.atoms import Atom
 import numpy as np
+from scipy.spatial import distance_matrix
+from autode.geom import calc_rmsd
 from copy import deepcopy
 import pytest
 
@@ -112,3 +116,108 @@ def test_conformer_generation2():
 
     dimer._generate_conformers()
     assert len(dimer.conformers) == 6 * 2
+
+
+def test_complex_conformer_atoms():
+
+    water = Molecule(name='water', atoms=[Atom('O', -0.0011, 0.3631, -0.0),
+                                          Atom('H', -0.8250, -0.1819, -0.0),
+                                          Atom('H', 0.8261, -0.1812, 0.0)])
+
+    direction = np.array([1.0, 0.0, 0.0])
+    atoms = get_complex_conformer_atoms([water, water, water],
+                                        rotations=[np.array([1.0, 0.0, 0.0, 1.0]),
+                                                   np.array([0.5, 1.0, 0.0, 0.0])],
+                                        points=[direction, -direction])
+
+    assert [atom.label for atom in atoms] == ['O', 'H', 'H'] * 3
+    coords = np.array([atom.coord for atom in atoms])
+
+    # Rotations are rigid, so the molecules are not distorted
+    for idxs in ([0, 1, 2], [3, 4, 5], [6, 7, 8]):
+        assert np.allclose(distance_matrix(coords[idxs], coords[idxs]),
+                           distance_matrix(water.get_coordinates(),
+                                           water.get_coordinates()))
+
+    # Molecules are added no closer than 2 Å to the others
+    assert np.min(distance_matrix(coords[:3], coords[3:])) > 2.0
+    assert np.min(distance_matrix(coords[:6], coords[6:])) > 2.0
+
+
+def test_shift_to_avoid_overlap():
+
+    coords = np.array([[0.0, 0.0, 0.0], [1.0, 0.0, 0.0]])
+    mol_coords = np.array([[0.0, 0.0, 0.0]])
+
+    # Moving along x the atom needs to be 2 Å from the atom at x = 1
+    shift = get_shift_to_avoid_overlap(coords, mol_coords,
+                                       direction=np.array([1.0, 0.0, 0.0]))
+    assert np.isclose(shift, 3.0)
+
+    # and along y 2 Å from the atom at the origin
+    shift = get_shift_to_avoid_overlap(coords, mol_coords,
+                                       direction=np.array([0.0, 1.0, 0.0]))
+    assert np.isclose(shift, 2.0)
+
+    # No overlap should return the minimum shift
+    shift = get_shift_to_avoid_overlap(coords + 10.0, mol_coords,
+                                       direction=np.array([0.0, 1.0, 0.0]))
+    assert np.isclose(shift, 0.1)
+
+
+def test_intermolecular_energy():
+
+    he_dimer = Complex(Molecule(name='He', atoms=[Atom('He')], mult=1),
+                       Molecule(name='He', atoms=[Atom('He')], mult=1))
+
+    # Energy minimum is at the sum of the vdW radii
+    coords = np.array([[0.0, 0.0, 0.0], [2.8, 0.0, 0.0]])
+    assert np.isclose(he_dimer.calc_intermolecular_energy(coords), -1.0)
+
+    coords[1, 0] = 100.0
+    assert np.isclose(he_dimer.calc_intermolecular_energy(coords), 0.0)
+
+    # Atoms in the same molecule do not contribute
+    assert np.isclose(monomer.calc_intermolecular_energy(), 0.0)
+
+
+def test_repulsion():
+
+    h2_dimer = Complex(hydrogen, hydrogen)
+    h2_dimer.translate_mol(vec=np.array([0.0, 2.0, 0.0]), mol_index=1)
+
+    # Sum over the four intermolecular pairs of 1/r^4
+    dists = [2.0, 2.0, np.sqrt(5.0), np.sqrt(5.0)]
+    repulsion = 0.5 * sum(dist**-4 for dist in dists)
+    assert np.isclose(h2_dimer.calc_repulsion(mol_index=0), repulsion)
+
+    # with or without a cached distance matrix
+    h2_dimer.get_distance_matrix()
+    assert np.isclose(h2_dimer.calc_repulsion(mol_index=1), repulsion)
+
+
+def test_screen_complex_conformers():
+
+    Config.num_complex_random_rotations = 3
+    Config.num_complex_sphere_points = 6
+    Config.max_num_complex_conformers = 10000
+
+    water = Molecule(name='water', atoms=[Atom('O', -0.0011, 0.3631, -0.0),
+                                          Atom('H', -0.8250, -0.1819, -0.0),
+                                          Atom('H', 0.8261, -0.1812, 0.0)])
+    water_dimer = Complex(water, water)
+    water_dimer._generate_conformers()
+    assert len(water_dimer.conformers) == 18
+
+    water_dimer._screen_conformers(max_n=4)
+    assert 0 < len(water_dimer.conformers) <= 4
+
+    energies = [water_dimer.calc_intermolecular_energy(conf.get_coordinates())
+                for conf in water_dimer.conformers]
+    assert energies == sorted(energies)
+
+    for conf_i in water_dimer.conformers:
+        for conf_j in water_dimer.conformers:
+            if conf_i is not conf_j:
+                assert calc_rmsd(conf_i.get_coordinates(),
+                                 conf_j.get_coordinates()) >= Config.rmsd_threshold
@@ -10,7 +10,11 @@ from autode.transition_states.ts_guess import TSguess
 from autode.transition_states.transition_state import TransitionState
 from autode.bond_rearrangement import BondRearrangement
 from autode.geom import get_distance_constraints
+from autode.exceptions import NoMolecularGraph
+from copy import deepcopy
 import numpy as np
+import pickle
+import pytest
 import os
 
 here = os.path.dirname(os.path.abspath(__file__))
@@ -45,13 +49,15 @@ def test_conf_gen(tmpdir):
 
     atoms = conf_gen.get_simanl_atoms(species=methane)
     assert len(atoms) == 5
-    assert os.path.exists('methane_conf0_siman.xyz')
+    assert os.path.exists('methane_confs.npz')
 
-    # Rerunning the conformer generation should read the generated .xyz file
-    atoms = conf_gen.get_simanl_atoms(species=methane)
-    assert len(atoms) == 5
+    # Rerunning the conformer generation should use the conformer archive
+    regen_atoms = conf_gen.get_simanl_atoms(species=methane)
+    assert len(regen_atoms) == 5
+    assert all(np.allclose(atom.coord, regen_atom.coord)
+               for atom, regen_atom in zip(atoms, regen_atoms))
 
-    os.remove('methane_conf0_siman.xyz')
+    os.remove('methane_confs.npz')
 
     # Ensure the new graph is identical
     regen = Molecule(name='regenerated_methane', atoms=atoms)
@@ -220,7 +226,7 @@ def test_salt():
     salt = Molecule(name='salt', smiles='[Li][Br]')
     assert salt.n_atoms == 2
     assert are_coords_reasonable(coords=salt.get_coordinates())
-    os.remove('salt_conf0_siman.xyz')
+    os.remove('salt_confs.npz')
 
 
 def test_potential():
@@ -244,3 +250,90 @@ def test_potential():
 
     expected_v = 0.7 * (bond_length - eq_bond_length)**2 + 0.3 / bond_length**8
     assert np.abs(v - expected_v) < 1E-6
+
+
+def test_fragments():
+
+    # Butane has two CH3 and two CH2 fragments, all connected in a chain
+    fragments = conf_gen.get_fragments(butane.graph)
+    assert len(fragments) == 4
+    assert sorted(len(fragment) for fragment in fragments) == [3, 3, 4, 4]
+    assert sorted(idx for fragment in fragments for idx in fragment) == list(range(14))
+
+    for n, fragment in enumerate(fragments[1:]):
+        built_idxs = [idx for frag in fragments[:n+1] for idx in frag]
+        assert any((i, j) in butane.graph.edges
+                   for i in fragment for j in built_idxs)
+
+    # Rings are a single fragment
+    benzene = Molecule(smiles='c1ccccc1')
+    fragments = conf_gen.get_fragments(benzene.graph)
+    assert len(fragments) == 1
+    assert len(fragments[0]) == 12
+
+
+def test_no_init_structure_fragments(tmpdir):
+    os.chdir(tmpdir)
+
+    # Metal containing SMILES are built with no initial structure
+    mol = Molecule(smiles='[Li]CCCCCCC1CCCCC1')
+    assert are_coords_reasonable(coords=mol.get_coordinates())
+
+    regen = Molecule(name='regen', atoms=mol.atoms)
+    assert regen.graph.number_of_edges() == mol.graph.number_of_edges()
+
+    os.chdir(here)
+
+
+def test_parallel_conf_gen(tmpdir, monkeypatch):
+    os.chdir(tmpdir)
+
+    mol = Molecule(name='butane', smiles='CCCC')
+    mol.conformers = [deepcopy(mol) for _ in range(10)]
+
+    # Workers only receive the attributes required to generate conformers
+    species = conf_gen.get_species_for_workers(mol)
+    assert species.conformers is None
+    assert species.name == mol.name and species.graph is mol.graph
+    assert len(pickle.dumps(species)) < len(pickle.dumps(mol))
+
+    monkeypatch.setattr(Config, 'n_cores', 2)
+    confs = list(conf_gen.generate_simanl_atoms(mol, n_confs=3))
+
+    assert len(confs) == 3
+    assert all(len(atoms) == 14 for atoms in confs)
+    assert os.path.exists('butane_confs.npz')
+
+    # Conformers have different random seeds so are different
+    coords = [np.array([atom.coord for atom in atoms]) for atoms in confs]
+    assert not np.allclose(coords[0], coords[1])
+
+    os.chdir(here)
+
+
+def test_conf_gen_plan(tmpdir):
+    os.chdir(tmpdir)
+
+    butene = Molecule(name='z_butene', smiles=r'C/C=C\C')
+    dist_consts = {(0, 3): 3.0}
+    plan = conf_gen.ConformerGenerationPlan(butene, dist_consts=dist_consts)
+
+    # Stereochemistry constraints are added to the plan but not to the
+    # distance constraints passed
+    assert dist_consts == {(0, 3): 3.0}
+    assert len(plan.dist_consts) > 1
+
+    for (i, j), dist in plan.dist_consts.items():
+        assert plan.d0[i, j] == plan.d0[j, i] == dist
+    assert plan.init_coords_are_reasonable
+
+    # The same plan can be used for all conformers
+    for n in range(2):
+        atoms = conf_gen.get_simanl_atoms(butene, conf_n=n, plan=plan)
+        assert len(atoms) == butene.n_atoms
+
+    # A plan requires a molecular graph
+    with pytest.raises(NoMolecularGraph):
+        _ = conf_gen.ConformerGenerationPlan(Molecule(name='H'))
+
+    os.chdir(here)
@@ -0,0 +1,109 @@
+from autode.atoms import Atom
+from autode.conformers.archive import ConformerArchive
+from autode.conformers.archive import get_conformer_archive_key
+from autode.conformers.archive import save_conformer_energies
+from autode.conformers.conformer import Conformer
+from autode.conformers import conf_gen
+from autode.species.molecule import Molecule
+from autode.config import Config
+import numpy as np
+import os
+
+here = os.path.dirname(os.path.abspath(__file__))
+Config.n_cores = 1
+
+h2o = Molecule(name='h2o', atoms=[Atom('O', -0.0011, 0.3631, -0.0),
+                                  Atom('H', -0.8250, -0.1819, -0.0),
+                                  Atom('H', 0.8261, -0.1812, 0.0)])
+
+
+def test_archive_key():
+
+    key = get_conformer_archive_key(h2o)
+    assert key == get_conformer_archive_key(h2o, dist_consts={})
+
+    # Different distance constraints give a different key
+    assert key != get_conformer_archive_key(h2o, dist_consts={(0, 1): 1.5})
+
+    # as do different molecular graphs
+    h2o_no_bond = Molecule(name='h2o', atoms=h2o.atoms)
+    h2o_no_bond.graph.remove_edge(0, 1)
+    assert key != get_conformer_archive_key(h2o_no_bond)
+
+
+def test_archive(tmpdir):
+    os.chdir(tmpdir)
+
+    archive = ConformerArchive(h2o)
+    assert len(archive) == 0
+    assert archive.filename == 'h2o_confs.npz'
+
+    coords = h2o.get_coordinates()
+    archive.append(3, coords, seed=1, ff_energy=0.1)
+    archive.append(0, coords + 1.0)
+    assert len(archive) == 2
+    assert 3 in archive and 1 not in archive
+
+    # Random access by conformer number
+    assert np.allclose(archive.get_coords(0), coords + 1.0)
+    atoms = archive.get_atoms(3)
+    assert [atom.label for atom in atoms] == ['O', 'H', 'H']
+    assert np.allclose(atoms[0].coord, coords[0])
+
+    archive.set_energy(3, -76.0)
+    archive.save()
+    assert os.path.exists('h2o_confs.npz')
+
+    # Reloading gives the same conformers
+    archive = ConformerArchive(h2o)
+    assert len(archive) == 2
+    assert archive.seeds[archive.conf_ns == 3][0] == 1
+    assert np.isclose(archive.energies[archive.conf_ns == 3][0], -76.0)
+    assert np.isnan(archive.energies[archive.conf_ns == 0][0])
+
+    # Replacing a conformer doesn't add another
+    archive.append(0, coords)
+    assert len(archive) == 2
+
+    # but an archive with different constraints is not reused
+    assert len(ConformerArchive(h2o, dist_consts={(0, 1): 1.5})) == 0
+
+    os.chdir(here)
+
+
+def test_archive_conf_gen(tmpdir):
+    os.chdir(tmpdir)
+
+    butane = Molecule(name='butane', smiles='CCCC')
+    confs = list(conf_gen.generate_simanl_atoms(butane, n_confs=3))
+
+    archive = ConformerArchive(butane)
+    assert len(archive) == 3
+    assert np.all(np.isfinite(archive.ff_energies))
+
+    # Regenerating uses the archived conformers
+    regen_confs = list(conf_gen.generate_simanl_atoms(butane, n_confs=4))
+    for atoms, regen_atoms in zip(confs, regen_confs):
+        assert np.allclose(np.array([atom.coord for atom in atoms]),
+                           np.array([atom.coord for atom in regen_atoms]))
+
+    assert len(ConformerArchive(butane)) == 4
+
+    # Closing the generator early saves the conformers generated so far
+    generator = conf_gen.generate_simanl_atoms(butane, n_confs=6)
+    for _ in range(5):
+        next(generator)
+    generator.close()
+    assert len(ConformerArchive(butane)) == 5
+
+    # Energies of the conformers are saved
+    confs = [Conformer(name=f'butane_conf{i}', atoms=atoms, conf_n=i)
+             for i, atoms in enumerate(confs)]
+    confs[1].energy = -158.0
+    save_conformer_energies(butane, confs)
+
+    archive = ConformerArchive(butane)
+    assert np.isclose(archive.energies[archive.conf_ns == 1][0], -158.0)
+    assert np.isnan(archive.energies[archive.conf_ns == 0][0])
+
+    os.chdir(here)
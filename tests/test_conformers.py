@@ -1,12 +1,27 @@
 from autode.atoms import Atom
+from autode.calculation import Calculation
 from autode.conformers.conformer import Conformer
+from autode.conformers.conformer import get_low_sp_keywords
+from autode.wrappers.G09 import G09
+from autode.wrappers.NWChem import NWChem
 from autode.wrappers.ORCA import orca
+from autode.wrappers.keywords import SinglePointKeywords
 from scipy.spatial import distance_matrix
 from rdkit import Chem
 from rdkit.Chem import AllChem
 from autode.conformers.conformers import get_atoms_from_rdkit_mol_object
 from autode.conformers.conformers import conf_is_unique_rmsd
 from autode.conformers.conformers import get_unique_confs
+from autode.conformers.conformers import run_conformer_calculations
+from autode.conformers.conformers import get_ff_energies
+from autode.conformers.conformers import screen_conformers
+from autode.species.molecule import Molecule
+from autode.conformers.conformers import conformers_are_saturated
+from autode.conformers.conformers import generate_rdkit_conformer_atoms
+from autode.conformers.conformers import generate_rdkit_conformer_coords
+from autode.conformers.conformers import get_coords_from_rdkit_mol_object
+from autode.conformers.conformers import get_rdkit_atom_labels
+from autode.config import Config
 from autode.constants import Constants
 from . import testutils
 import numpy as np
@@ -123,3 +138,157 @@ def test_rmsd_confs():
     # Methane but rotated should have an RMSD ~ 0 Angstroms
     assert not conf_is_unique_rmsd(conf=methane2, conf_list=[methane1],
                                    rmsd_tol=0.1)
+
+
+def test_conformer_saturation():
+
+    window = Config.conformer_saturation_window
+    Config.conformer_saturation_window = 10
+
+    # Not enough conformers have been generated to determine saturation
+    assert not conformers_are_saturated([False] * 9)
+
+    assert conformers_are_saturated([True] + [False] * 10)
+    assert not conformers_are_saturated([True] * 10)
+
+    Config.min_unique_conformer_rate, rate = 0, Config.min_unique_conformer_rate
+    assert not conformers_are_saturated([False] * 20)
+
+    Config.conformer_saturation_window = window
+    Config.min_unique_conformer_rate = rate
+
+
+def test_rdkit_conformer_generator():
+
+    mol = Chem.AddHs(Chem.MolFromSmiles('CC'))
+    conf_atoms = list(generate_rdkit_conformer_atoms(mol, n_confs=3))
+
+    assert len(conf_atoms) == 3
+    assert all(len(atoms) == 8 for atoms in conf_atoms)
+
+
+def test_rdkit_conformer_coords():
+
+    mol = Chem.AddHs(Chem.MolFromSmiles('CO'))
+    coords = np.concatenate(list(generate_rdkit_conformer_coords(mol, n_confs=4)))
+    assert coords.shape == (4, 6, 3)
+
+    labels = get_rdkit_atom_labels(mol)
+    assert labels == ['C', 'O', 'H', 'H', 'H', 'H']
+
+    # Coordinates are the same as those from the RDKit conformers
+    conf_ids = [conf.GetId() for conf in mol.GetConformers()]
+    assert np.allclose(get_coords_from_rdkit_mol_object(mol, conf_ids), coords)
+
+    atoms = get_atoms_from_rdkit_mol_object(mol, conf_id=conf_ids[-1])
+    assert [atom.label for atom in atoms] == labels
+    assert np.allclose(np.array([atom.coord for atom in atoms]), coords[-1])
+
+
+def test_unique_confs_sorted():
+
+    energies = [0.3, 0.1, 0.1 + 0.5 / Constants.ha2kJmol, 0.2, None]
+    confs = [Conformer(name=f'conf{i}') for i in range(len(energies))]
+    for conf, energy in zip(confs, energies):
+        conf.energy = energy
+
+    # The lowest energy conformer is retained and the ordering preserved
+    unique_confs = get_unique_confs(conformers=confs)
+    assert [conf.name for conf in unique_confs] == ['conf0', 'conf1', 'conf3']
+
+
+def test_unique_confs_rmsd():
+
+    h_atoms = [Atom('H', 1.0, 0.0, 0.0), Atom('H', 0.0, 1.0, 0.0)]
+    conf1 = Conformer(name='conf1', atoms=[Atom('C'), Atom('O', 1.2)] + h_atoms)
+    conf2 = Conformer(name='conf2', atoms=[Atom('C'), Atom('O', 1.21)] + h_atoms)
+    conf3 = Conformer(name='conf3', atoms=[Atom('C'), Atom('O', 2.5)] + h_atoms)
+
+    for conf in (conf1, conf2, conf3):
+        conf.energy = 1.0
+
+    # All the same energy, so only one unique conformer on energy alone
+    assert len(get_unique_confs(conformers=[conf1, conf2, conf3])) == 1
+
+    # but conf3 has a different structure
+    unique_confs = get_unique_confs(conformers=[conf1, conf2, conf3],
+                                    rmsd_threshold=0.1)
+    assert [conf.name for conf in unique_confs] == ['conf1', 'conf3']
+
+
+def test_screen_conformers():
+
+    energies = [0.3, None, 0.1, 0.1 + 2.0 / Constants.ha2kJmol, 0.2]
+    confs = [Conformer(name=f'conf{i}') for i in range(len(energies))]
+
+    # No cut-offs only removes conformers without energies and sorts
+    screened = screen_conformers(confs, energies)
+    assert [conf.name for conf in screened] == ['conf2', 'conf3', 'conf4', 'conf0']
+
+    screened = screen_conformers(confs, energies, max_n=2)
+    assert [conf.name for conf in screened] == ['conf2', 'conf3']
+
+    screened = screen_conformers(confs, energies, window_kj=1.0)
+    assert [conf.name for conf in screened] == ['conf2']
+
+
+def test_low_sp_keywords(tmpdir):
+    os.chdir(tmpdir)
+
+    h2_conf = Conformer(name='h2_conf_sp', atoms=[Atom('H'), Atom('H', z=0.7)])
+
+    # Single points at the low level don't optimise
+    for method, filename in ((orca, 'h2_conf_sp_orca.inp'),
+                             (G09(), 'h2_conf_sp_g09.com')):
+
+        keywords = get_low_sp_keywords(method)
+        assert isinstance(keywords, SinglePointKeywords)
+
+        calc = Calculation(name='h2_conf_sp', molecule=h2_conf, method=method,
+                           keywords=keywords)
+        calc.generate_input()
+
+        assert not any('opt' in line.lower() for line in open(filename, 'r'))
+        assert any('def2' in line.lower() for line in open(filename, 'r'))
+        os.remove(filename)
+
+    keywords = get_low_sp_keywords(NWChem())
+    assert 'task dft energy' in keywords.keyword_list
+    assert not any('driver' in kw or 'optimize' in kw for kw in keywords)
+
+    os.chdir(here)
+
+
+def test_ff_energies():
+
+    h2 = Molecule(name='H2', atoms=[Atom('H'), Atom('H', z=0.7)])
+    h2_conf = Conformer(name='h2_conf', atoms=[Atom('H'), Atom('H', z=0.7)])
+    h2_long_conf = Conformer(name='h2_long_conf',
+                             atoms=[Atom('H'), Atom('H', z=1.5)])
+
+    energies = get_ff_energies(h2, [h2_conf, h2_long_conf])
+    assert energies[0] < energies[1]
+
+    # Constraining the bond length changes the ideal length
+    h2_long_conf.dist_consts = {(0, 1): 1.5}
+    energies = get_ff_energies(h2, [h2_conf, h2_long_conf])
+    assert energies[1] < energies[0]
+
+
+@testutils.work_in_zipped_dir(os.path.join(here, 'data', 'conformers.zip'))
+def test_parallel_conformer_calculations(monkeypatch):
+
+    monkeypatch.setattr(Config, 'n_cores', 2)
+
+    confs = [Conformer(name=name, charge=0, mult=1,
+                       atoms=[Atom('H', 0.0, 0.0, 0.0),
+                              Atom('H', 0.0, 0.0, 0.7)])
+             for name in ('h2_conf', 'h2_conf_broken')]
+
+    confs = run_conformer_calculations(confs, method=orca)
+    assert [conf.name for conf in confs] == ['h2_conf', 'h2_conf_broken']
+
+    # Results of the calculations are returned from the pool
+    assert confs[0].energy == -1.160780546661
+    assert confs[0].n_atoms == 2
+    assert confs[1].atoms is None
@@ -2,6 +2,7 @@ from autode.solvent import explicit_solvent
 from autode.species.molecule import SolvatedMolecule
 from autode.atoms import Atom
 import numpy as np
+from scipy.spatial.distance import cdist
 
 
 def test_add_solvent_mols():
@@ -19,3 +20,44 @@ def test_centre_species():
     species = SolvatedMolecule(atoms=[Atom('H', 1.0, 1.0, 1.0)])
     explicit_solvent.centre_species(species)
     assert np.allclose(species.atoms[0].coord, [0, 0, 0])
+
+
+def test_add_many_solvent_mols():
+    species = SolvatedMolecule(atoms=[Atom('C', 0.0, 0.0, 0.0),
+                                      Atom('C', 1.5, 0.0, 0.0)])
+    species.solvent_mol = SolvatedMolecule(atoms=[Atom('O'), Atom('H', 0.96),
+                                                  Atom('H', -0.24, 0.93)])
+    explicit_solvent.add_solvent_molecules(species, 10, 1000)
+
+    assert len(species.qm_solvent_atoms) == 3 * 10
+    assert len(species.mm_solvent_atoms) == 3 * 990
+
+    solvent_coords = np.array([atom.coord for atom in species.qm_solvent_atoms
+                               + species.mm_solvent_atoms]).reshape(-1, 3, 3)
+
+    # QM solvent molecules are the closest to the solute
+    distances = np.linalg.norm(np.average(solvent_coords, axis=1), axis=1)
+    assert np.max(distances[:10]) <= np.min(distances[10:])
+
+    # No solvent atoms are close to the solute or atoms in other solvent
+    # molecules
+    assert np.min(cdist(solvent_coords.reshape(-1, 3),
+                        species.get_coordinates())) > 1.5
+
+    mol_idxs = np.repeat(np.arange(1000), 3)
+    dist_mat = cdist(solvent_coords.reshape(-1, 3), solvent_coords.reshape(-1, 3))
+    assert np.min(dist_mat[mol_idxs[:, None] != mol_idxs[None, :]]) > 1.5
+
+
+def test_non_clashing_solvent_coords():
+
+    solvent_coords = np.array([[[0.0, 0.0, 0.0]],
+                               [[1.0, 0.0, 0.0]],
+                               [[5.0, 0.0, 0.0]],
+                               [[9.0, 0.0, 0.0]]])
+
+    # Second molecule clashes with the first and the last with the other atoms
+    coords = explicit_solvent.get_non_clashing_solvent_coords(solvent_coords,
+                                                              other_coords=np.array([[9.5, 0.0, 0.0]]),
+                                                              min_dist=1.5)
+    assert np.allclose(coords[:, 0, 0], [0.0, 5.0])
@@ -88,3 +88,62 @@ def test_calc_rmsd():
 
     # While the heavy atom RMSD should remain unchanged
     assert geom.calc_heavy_atom_rmsd(atoms, atoms_rot) < 1E-6
+
+
+def test_calc_rmsds():
+
+    rand = np.random.RandomState(0)
+    coords = rand.uniform(-2, 2, size=(10, 3))
+
+    # Randomly rotated, translated and displaced copies
+    coords_stack = []
+    for _ in range(5):
+        rot_mat = geom.get_rot_mat_euler(axis=rand.uniform(-1, 1, 3),
+                                         theta=rand.uniform(0, 2*np.pi))
+        coords_stack.append(np.matmul(coords, rot_mat.T)
+                            + rand.uniform(-0.3, 0.3, size=(10, 3))
+                            + rand.uniform(-5, 5, size=3))
+    coords_stack = np.array(coords_stack)
+
+    rmsds = geom.calc_rmsds(coords, coords_stack)
+    assert rmsds.shape == (5,)
+
+    for rmsd, other_coords in zip(rmsds, coords_stack):
+        assert np.isclose(rmsd, geom.calc_rmsd(coords, other_coords))
+
+    # A reflected structure is not superimposable
+    reflected = coords * np.array([1.0, 1.0, -1.0])
+    assert np.isclose(geom.calc_rmsds(coords, reflected)[0],
+                      geom.calc_rmsd(coords, reflected))
+
+    pairwise_rmsds = geom.calc_pairwise_rmsds(coords_stack)
+    assert pairwise_rmsds.shape == (5, 5)
+    assert np.allclose(pairwise_rmsds, pairwise_rmsds.T)
+    assert np.isclose(pairwise_rmsds[1, 3],
+                      geom.calc_rmsd(coords_stack[1], coords_stack[3]))
+
+    # Lower bounds from the distance fingerprints never exceed the RMSD
+    fingerprints = np.array([geom.get_distance_fingerprint(other_coords)
+                             for other_coords in coords_stack])
+    lower_bounds = geom.calc_rmsd_lower_bounds(geom.get_distance_fingerprint(coords),
+                                               fingerprints, n_atoms=10)
+    assert np.all(lower_bounds <= rmsds)
+
+
+def test_rot_mats():
+
+    axes = np.array([[0.0, 0.0, 1.0], [1.0, 1.0, 0.0]])
+    thetas = np.array([np.pi / 2.0, 1.0])
+
+    rot_mats = geom.get_rot_mats(axes, thetas)
+    assert rot_mats.shape == (2, 3, 3)
+
+    # Anticlockwise rotation of the x axis about z is the y axis
+    assert np.allclose(np.matmul(rot_mats[0], np.array([1.0, 0.0, 0.0])),
+                       np.array([0.0, 1.0, 0.0]))
+
+    # All rotation matrices are orthogonal and the same as those from the
+    # Euler-Rodrigues formula
+    for axis, theta, rot_mat in zip(axes, thetas, rot_mats):
+        assert np.allclose(np.matmul(rot_mat, rot_mat.T), np.identity(3))
+        assert np.allclose(rot_mat, geom.get_rot_mat_euler(axis, theta))
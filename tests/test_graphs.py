@@ -5,12 +5,15 @@ from autode.species.species import Species
 from autode.species.molecule import Molecule
 from autode.atoms import Atom
 from autode.conformers import Conformer
+from autode.config import Config
 from autode.input_output import xyz_file_to_atoms
 from . import testutils
+from concurrent.futures import ThreadPoolExecutor
 import networkx as nx
 import numpy as np
 import pytest
 import os
+import time
 
 here = os.path.dirname(os.path.abspath(__file__))
 
@@ -45,6 +48,29 @@ def test_edge_cases():
     assert h3.graph.number_of_nodes() == 3
 
 
+def test_close_atom_pairs():
+
+    # C-C and C-H are within 1.25 × the average bond length, H-H is not
+    ch_cc = Species(name='tmp', charge=0, mult=1,
+                    atoms=[Atom('C'), Atom('C', 1.6), Atom('H', -1.1),
+                           Atom('H', 1.6, 1.0), Atom('C', 9.0)])
+
+    pairs, distances = mol_graphs.get_close_atom_pairs(ch_cc)
+    assert sorted(map(tuple, pairs.tolist())) == [(0, 1), (0, 2), (1, 3)]
+    assert np.allclose(sorted(distances), [1.0, 1.1, 1.6])
+
+    mol_graphs.make_graph(ch_cc, allow_invalid_valancies=True)
+    assert ch_cc.graph.number_of_edges() == 3
+    assert ch_cc.graph.degree(4) == 0
+
+    pairs, _ = mol_graphs.get_close_atom_pairs(ch_cc, rel_tolerance=0.1)
+    assert sorted(map(tuple, pairs.tolist())) == [(1, 3)]
+
+    h = Species(name='h', charge=0, mult=2, atoms=[Atom('H')])
+    pairs, distances = mol_graphs.get_close_atom_pairs(h)
+    assert pairs.shape == (0, 2) and len(distances) == 0
+
+
 def test_remove_bonds():
 
     b3h6 = Species(name='diborane', charge=0, mult=1,
@@ -73,6 +99,101 @@ def test_isomorphic_graphs():
     assert mol_graphs.is_isomorphic(h2.graph, h2_alt.graph) is True
 
 
+def test_graph_hash():
+
+    # Propane with the atoms in a different order has the same hash
+    c3 = nx.Graph()
+    c3.add_nodes_from([(0, {'atom_label': 'C'}), (1, {'atom_label': 'C'}),
+                       (2, {'atom_label': 'O'})])
+    c3.add_edges_from([(0, 1), (1, 2)], active=False)
+
+    c3_alt = nx.relabel_nodes(c3, mapping={0: 2, 1: 0, 2: 1})
+    assert mol_graphs.get_graph_hash(c3) == mol_graphs.get_graph_hash(c3_alt)
+
+    # but not with a different atom or an active bond
+    c3_alt.nodes[2]['atom_label'] = 'N'
+    assert mol_graphs.get_graph_hash(c3) != mol_graphs.get_graph_hash(c3_alt)
+
+    c3_active = c3.copy()
+    c3_active.edges[0, 1]['active'] = True
+    assert mol_graphs.get_graph_hash(c3) != mol_graphs.get_graph_hash(c3_active)
+    assert (mol_graphs.get_graph_hash(c3, match_active_bonds=False)
+            == mol_graphs.get_graph_hash(c3_active, match_active_bonds=False))
+
+    # Same degree sequence and atoms but not isomorphic (C-O-C)
+    c2o = nx.Graph()
+    c2o.add_nodes_from([(0, {'atom_label': 'C'}), (1, {'atom_label': 'O'}),
+                        (2, {'atom_label': 'C'})])
+    c2o.add_edges_from([(0, 1), (1, 2)], active=False)
+    assert mol_graphs.get_graph_hash(c3) != mol_graphs.get_graph_hash(c2o)
+    assert not mol_graphs.is_isomorphic(c3, c2o)
+
+    # Hashes are cached on a species until the graph changes
+    h2_copy = Species(name='H2', atoms=[h_a, h_b], charge=0, mult=1)
+    mol_graphs.make_graph(h2_copy)
+    h2_hash = h2_copy.graph_hash
+    assert h2_hash == mol_graphs.get_graph_hash(h2_copy.graph)
+
+    h2_copy.graph.edges[0, 1]['active'] = True
+    assert h2_copy.graph_hash == mol_graphs.get_graph_hash(h2_copy.graph)
+    assert h2_copy.graph_hash != h2_hash
+
+    h2_copy.graph.remove_edge(0, 1)
+    assert h2_copy.graph_hash != h2_hash
+
+    # including for an edit that keeps the number of nodes and edges
+    h2o = Species(name='H2O', charge=0, mult=1,
+                  atoms=[Atom('O'), Atom('H', x=0.96), Atom('H', y=0.96)])
+    mol_graphs.make_graph(h2o)
+    h2o_hash = h2o.graph_hash
+
+    h2o.graph.remove_edge(0, 2)
+    h2o.graph.add_edge(1, 2, pi=False, active=False)
+    assert h2o.graph_hash == mol_graphs.get_graph_hash(h2o.graph)
+    assert h2o.graph_hash != h2o_hash
+    assert mol_graphs.is_isomorphic(h2o.graph, h2o.graph.copy(),
+                                    graph1_hash=h2o.graph_hash)
+
+    h2_copy.graph = None
+    assert h2_copy.graph_hash is None
+
+
+def test_editable_graph():
+
+    # Ethanol with an active C-O bond
+    graph = nx.Graph()
+    graph.add_nodes_from([(i, {'atom_label': label})
+                          for i, label in enumerate('CCOHHHHHH')])
+    graph.add_edges_from([(0, 1), (0, 3), (0, 4), (0, 5), (1, 6), (1, 7),
+                          (2, 8)], active=False)
+    graph.add_edge(1, 2, active=True)
+    graph_hash = mol_graphs.get_graph_hash(graph)
+
+    e_graph = mol_graphs.EditableGraph(graph)
+    assert e_graph.hash == graph_hash
+
+    # The hash of an edited graph is the same as that of the NX graph
+    edits = [([(2, 3)], [(0, 3)]), ([], [(1, 2)]), ([(0, 8), (3, 4)], [])]
+    for fbonds, bbonds in edits:
+        e_graph.edit(fbonds=fbonds, bbonds=bbonds)
+
+        nx_graph = e_graph.to_networkx()
+        assert e_graph.hash == mol_graphs.get_graph_hash(nx_graph)
+
+    assert nx_graph.has_edge(2, 3) and not nx_graph.has_edge(1, 2)
+    assert nx_graph.number_of_edges() == graph.number_of_edges() + 1
+
+    # and reverting the edits recovers the initial graph
+    for _ in edits:
+        e_graph.undo()
+
+    assert e_graph.hash == graph_hash
+    assert e_graph.neighbours[1] == {0, 2, 6, 7}
+    assert frozenset((1, 2)) in e_graph.active_edges
+    fingerprint = mol_graphs.get_graph_fingerprint(graph)
+    assert mol_graphs.get_graph_fingerprint(e_graph.to_networkx()) == fingerprint
+
+
 def test_subgraph_isomorphism():
 
     h_c = Atom(atomic_symbol='H', x=0.0, y=0.0, z=1.4)
@@ -178,6 +299,47 @@ def test_split_graph():
     assert mol_graphs.split_mol_across_bond(g, bond=(0, 3)) == [[0, 1, 2], [3, 4]]
 
 
+def test_compact_graph():
+
+    compact_graph = mol_graphs.CompactGraph(g)
+    assert compact_graph.n_nodes == 5 and compact_graph.n_edges == 5
+    assert sorted(compact_graph.neighbours(0)) == [1, 2, 3]
+    assert compact_graph.degree(4) == 1 and compact_graph.degrees.tolist() == [3, 2, 2, 2, 1]
+    assert compact_graph.atom_label(4) == 'C'
+    assert compact_graph.edges() == list(g.edges)
+    assert not compact_graph.has_edge(0, 4)
+
+    # Graph algorithms give the same results as with the NX graph
+    assert mol_graphs.find_cycles(compact_graph) == nx.cycle_basis(g)
+    assert mol_graphs.connected_components(compact_graph) == [{0, 1, 2, 3, 4}]
+    assert mol_graphs.split_mol_across_bond(compact_graph, bond=(0, 3)) == [[0, 1, 2], [3, 4]]
+
+    with pytest.raises(nx.NetworkXError):
+        mol_graphs.split_mol_across_bond(compact_graph, bond=(0, 4))
+
+    # Active and π edges are flags
+    ts_graph = g.copy()
+    ts_graph.add_edge(1, 4, active=True, pi=False)
+    compact_graph = mol_graphs.CompactGraph(ts_graph)
+    assert compact_graph.edges(flag=mol_graphs.CompactGraph.active) == [(1, 4)]
+    assert compact_graph.edge_flags(4, 1) == mol_graphs.CompactGraph.active
+    assert compact_graph.to_networkx().edges[1, 4]['active']
+
+    truncated_graph = mol_graphs.get_truncated_active_mol_graph(compact_graph)
+    assert truncated_graph.number_of_nodes() == 5
+
+    # and are cached on a species until the graph or any flags change
+    h2_copy = Species(name='H2', atoms=[h_a, h_b], charge=0, mult=1)
+    mol_graphs.make_graph(h2_copy)
+    compact_graph = h2_copy.compact_graph
+    assert h2_copy.compact_graph is compact_graph
+    assert compact_graph.n_edges == 1
+
+    h2_copy.graph.edges[0, 1]['pi'] = True
+    assert h2_copy.compact_graph is not compact_graph
+    assert h2_copy.compact_graph.edge_flags(0, 1) == mol_graphs.CompactGraph.pi
+
+
 def test_set_pi_bonds():
 
     ethene = Species(name='ethene', charge=0, mult=1,
@@ -271,6 +433,54 @@ def test_timeout():
     # optimal behavior
     assert not mol_graphs.is_isomorphic(graph, isomorphic_graph, timeout=1)
 
+    # The timeout also works outside the main thread and is not rounded
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        start_time = time.time()
+        future = executor.submit(mol_graphs.is_isomorphic, graph,
+                                 isomorphic_graph, timeout=0.2)
+        assert not future.result()
+        assert time.time() - start_time < 3.0
+
+
+def test_isomorphism_cache():
+    mol_graphs.clear_isomorphism_cache()
+
+    h2_alt = Species(name='H2', atoms=[h_b, h_a], charge=0, mult=1)
+    mol_graphs.make_graph(h2_alt)
+    mol_graphs.make_graph(h2)
+
+    assert mol_graphs.is_isomorphic(h2.graph, h2_alt.graph)
+    info = mol_graphs.get_isomorphism_cache_info()
+    assert info.hits == 0 and info.misses == 1 and info.currsize == 1
+
+    # Graphs are the same in either order, but not ignoring active bonds
+    assert mol_graphs.is_isomorphic(h2_alt.graph, h2.graph)
+    assert mol_graphs.is_isomorphic(h2.graph, h2_alt.graph,
+                                    ignore_active_bonds=True)
+    info = mol_graphs.get_isomorphism_cache_info()
+    assert info.hits == 1 and info.misses == 2
+
+    # A different graph is not a cache hit
+    h2_active = h2.graph.copy()
+    h2_active.edges[0, 1]['active'] = True
+    assert not mol_graphs.is_isomorphic(h2.graph, h2_active)
+    assert mol_graphs.get_isomorphism_cache_info().misses == 3
+
+    # A rejection from wrong hashes passed in is not cached
+    mol_graphs.clear_isomorphism_cache()
+    assert not mol_graphs.is_isomorphic(h2.graph, h2_alt.graph,
+                                        graph1_hash='a', graph2_hash='b')
+    assert mol_graphs.is_isomorphic(h2.graph, h2_alt.graph)
+
+    # Least recently used results are removed from the cache
+    Config.isomorphism_cache_size = 1
+    assert not mol_graphs.is_isomorphic(h2.graph, nx.Graph([(0, 1)]))
+    assert mol_graphs.get_isomorphism_cache_info().currsize == 1
+    Config.isomorphism_cache_size = 10000
+
+    mol_graphs.clear_isomorphism_cache()
+    assert mol_graphs.get_isomorphism_cache_info().currsize == 0
+
 
 def test_species_conformers_isomorphic():
     h2_a = Molecule(name='H2', atoms=[Atom('H'), Atom('H', x=0.7)])
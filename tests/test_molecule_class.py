@@ -118,3 +118,14 @@ def test_molecule_from_xyz():
     assert h2.name == 'h2_conf0'
     assert h2.n_atoms == 2
     assert h2.formula() == 'H2'
+
+
+def test_gen_conformers_saturation():
+
+    # Methane has a single conformer, so generation should stop well before
+    # the requested number
+    methane = Molecule(name='methane', smiles='C')
+    methane._generate_conformers(n_confs=300)
+
+    assert len(methane.conformers) == 1
+    assert methane.rdkit_mol_obj.GetNumConformers() < 300
@@ -9,6 +9,7 @@ from autode.exceptions import NoAtomsInMolecule
 from copy import deepcopy
 from . import testutils
 import numpy as np
+import pickle
 import pytest
 import os
 
@@ -111,6 +112,42 @@ def test_set_coords():
     assert np.linalg.norm(mol_copy.atoms[1].coord - np.array([0.0, 0.0, 0.0])) < 1E-9
 
 
+def test_distance_matrix():
+    mol_copy = deepcopy(mol)
+    version = mol_copy.geometry_version
+
+    dist_mat = mol_copy.get_distance_matrix()
+    assert dist_mat.shape == (2, 2)
+    assert np.isclose(dist_mat[0, 1], 1.0)
+    assert np.isclose(mol_copy.get_condensed_distance_matrix()[0], 1.0)
+
+    # Cached until the geometry changes
+    assert mol_copy.get_distance_matrix() is dist_mat
+    assert not dist_mat.flags.writeable
+
+    mol_copy.atoms[1].translate(vec=np.array([0.0, 0.0, 1.0]))
+    assert mol_copy.geometry_version != version
+    assert np.isclose(mol_copy.get_distance_matrix()[0, 1], 2.0)
+    assert np.isclose(mol_copy.get_distance(0, 1), 2.0)
+
+    mol_copy.set_coordinates(np.array([[0.0, 0.0, 0.0], [0.0, 0.0, 3.0]]))
+    assert np.isclose(mol_copy.get_distance_matrix()[0, 1], 3.0)
+
+    mol_copy.atoms[1].coord = np.array([0.0, 0.0, 0.5])
+    assert np.isclose(mol_copy.get_condensed_distance_matrix()[0], 0.5)
+
+    mol_copy.set_atoms(atoms=[h1, h2, Atom('H', 0.0, 1.0, 0.0)])
+    assert mol_copy.get_distance_matrix().shape == (3, 3)
+
+    # The cache is not pickled, as versions are only unique in a process
+    mol_pickled = pickle.loads(pickle.dumps(mol_copy))
+    assert mol_pickled._dist_mat is None
+    assert mol_pickled.get_distance_matrix().shape == (3, 3)
+
+    # Geometry of the original molecule is unchanged
+    assert np.isclose(mol.get_distance(0, 1), 1.0)
+
+
 def test_species_solvent():
 
     assert mol.solvent is None
@@ -0,0 +1,73 @@
+from autode.atoms import Atom
+from autode.conformers import torsions
+from autode.species.molecule import Molecule
+from autode.config import Config
+from autode.geom import are_coords_reasonable
+from autode.geom import calc_rmsd
+import numpy as np
+
+Config.n_cores = 1
+
+
+def test_rotatable_bonds():
+
+    pentane = Molecule(smiles='CCCCC')
+    bonds = torsions.get_rotatable_bonds(pentane.graph)
+
+    # Only C-C bonds are rotatable, not C-H bonds
+    assert len(bonds) == 4
+    assert all(pentane.atoms[i].label == 'C' and pentane.atoms[j].label == 'C'
+               for (i, j, _, _) in bonds)
+
+    # Methyl rotors have a symmetry number of three
+    assert sorted(sym_number for (_, _, _, sym_number) in bonds) == [1, 1, 3, 3]
+
+    # Planar rotors have a symmetry number of two, but pyramidal ones don't
+    for smiles, sym_numbers in (('CCC(=O)[O-]', [2, 3]), ('CCN', [1, 3])):
+        bonds = torsions.get_rotatable_bonds(Molecule(smiles=smiles).graph)
+        assert sorted(sym_number for (_, _, _, sym_number) in bonds) == sym_numbers
+
+    # Bonds in a ring are not rotatable
+    cyclohexane = Molecule(smiles='C1CCCCC1')
+    assert len(torsions.get_rotatable_bonds(cyclohexane.graph)) == 0
+
+    # and neither are π bonds
+    ethene = Molecule(smiles='C=C')
+    assert len(torsions.get_rotatable_bonds(ethene.graph)) == 0
+
+
+def test_torsion_conformers():
+
+    pentane = Molecule(smiles='CCCCC')
+    confs = list(torsions.generate_torsion_atoms(pentane, n_confs=300,
+                                                 angle_step=120))
+
+    # Two rotatable C-C bonds with three torsions each, but the g+g- pair
+    # of structures clash
+    assert len(confs) == 7
+
+    for atoms in confs:
+        coords = np.array([atom.coord for atom in atoms])
+        assert are_coords_reasonable(coords)
+
+    # Rotations are rigid so bond lengths don't change
+    coords0 = np.array([atom.coord for atom in confs[0]])
+    for atoms in confs[1:]:
+        coords = np.array([atom.coord for atom in atoms])
+        assert np.isclose(np.linalg.norm(coords[0] - coords[1]),
+                          np.linalg.norm(coords0[0] - coords0[1]))
+
+        assert calc_rmsd(coords, coords0) > 0.1
+
+    # Maximum number of conformers is respected
+    assert len(list(torsions.generate_torsion_atoms(pentane, n_confs=2))) <= 2
+
+
+def test_torsion_conformers_no_rotatable_bonds():
+
+    water = Molecule(name='water', atoms=[Atom('O', 0.0, 0.0, 0.0),
+                                          Atom('H', 0.96, 0.0, 0.0),
+                                          Atom('H', -0.24, 0.93, 0.0)])
+
+    confs = list(torsions.generate_torsion_atoms(water, n_confs=10))
+    assert len(confs) == 1